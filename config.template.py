@@ -21,6 +21,7 @@ ROOT_FOLDER_PATH = "/music"
 # Adjust these if you experience API issues
 
 MUSICBRAINZ_DELAY = 1.0         # Seconds between MusicBrainz queries (min 1.0)
+MUSICBRAINZ_CACHE_PATH = None   # e.g. "data/mb_cache.sqlite" to reuse MusicBrainz responses across runs
 LIDARR_REQUEST_DELAY = 2.0      # Seconds between Lidarr API requests
 MAX_RETRIES = 3                 # Maximum retries for failed API calls
 RETRY_DELAY = 5.0               # Base delay for exponential backoff
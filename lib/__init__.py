@@ -1,52 +1,53 @@
-"""Top-level convenience exports for the `lib` package.
+"""Lidarr Music Importer Library
+
+Core modules for interacting with Lidarr and MusicBrainz APIs, plus
+top-level convenience exports.
 
 Importing from `lib` directly is a small convenience for scripts and tests.
 Keep this module small: it should only expose stable, well-tested helpers.
-"""
-from .models import AlbumEntry
-from .parser_utils import (
-    normalize_spotify_id,
-    aggregate_spotify_rows,
-    parse_spotify_export,
-    filter_artist_albums,
-    generate_artist_album_output,
-    normalize_album_title,
-    needs_normalization,
-    clean_text,
-    normalize_rows,
-    process_csv,
-    read_csv_to_rows,
-    write_rows_to_csv,
-)
-from .io_utils import create_backup
-from .musicbrainz_client import MusicBrainzClient
-
-__all__ = [
-    'AlbumEntry',
-    'normalize_spotify_id',
-    'aggregate_spotify_rows',
-    'parse_spotify_export',
-    'filter_artist_albums',
-    'generate_artist_album_output',
-    'normalize_album_title',
-    'needs_normalization',
-    'clean_text',
-    'normalize_rows',
-    'process_csv',
-    'read_csv_to_rows',
-    'write_rows_to_csv',
-    'create_backup',
-    'MusicBrainzClient',
-]
-"""
-Lidarr Music Importer Library
 
-Core modules for interacting with Lidarr and MusicBrainz APIs.
+Exports are resolved lazily (PEP 562) so `import lib` does not pull in
+`requests` or the parser helpers until a name is actually used.
 """
+import importlib
+
+from .config_manager import Config
 
 __version__ = "2.0.0"
 __author__ = "Lidarr Music Importer Contributors"
 
-from .config_manager import Config
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'AlbumEntry': 'models',
+    'CSVItem': 'models',
+    'normalize_spotify_id': 'parser_utils',
+    'aggregate_spotify_rows': 'parser_utils',
+    'parse_spotify_export': 'parser_utils',
+    'filter_artist_albums': 'parser_utils',
+    'generate_artist_album_output': 'parser_utils',
+    'normalize_album_title': 'parser_utils',
+    'needs_normalization': 'parser_utils',
+    'clean_text': 'parser_utils',
+    'normalize_rows': 'parser_utils',
+    'process_csv': 'parser_utils',
+    'read_csv_to_rows': 'parser_utils',
+    'write_rows_to_csv': 'parser_utils',
+    'create_backup': 'io_utils',
+    'MusicBrainzClient': 'musicbrainz_client',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
-__all__ = ['Config']
+__all__ = ['Config'] + list(_LAZY_EXPORTS)
@@ -1,26 +1,62 @@
 """Configuration management for Lidarr Music Importer."""
 
+import copy
 import os
-from typing import Dict, Any
+import sys
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+# Repository root, where the optional config.py lives (computed once)
+_CONFIG_DIR = Path(__file__).resolve().parent.parent
+_CONFIG_DIR_STR = str(_CONFIG_DIR)
+
+# Settings holding mutable containers; everything else is immutable and shared
+_MUTABLE_SETTINGS = ('musicbrainz_user_agent', 'artist_aliases')
+
+
+def _copy_settings(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy loaded settings, deep-copying only the mutable ones."""
+    copied = dict(attrs)
+    copied.pop('_dict_cache', None)
+    for name in _MUTABLE_SETTINGS:
+        if name in copied:
+            copied[name] = copy.deepcopy(copied[name])
+    return copied
+
+
+def _module_key(config_module) -> Optional[Tuple[str, int]]:
+    """(path, mtime) identifying the config.py a module was loaded from, if any."""
+    path = getattr(config_module, '__file__', None)
+    if not path:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 class Config:
-    """Configuration container with validation."""
+    """Configuration container with validation.
+    
+    Settings read from config.py are cached per process, keyed on the file's
+    path and modification time, so an edited config.py is picked up by the
+    next Config(). Environment variables are re-read on every construction.
+    """
+    
+    # ((path, mtime), settings) from the last config.py load
+    _module_cache: Optional[Tuple[Tuple[str, int], Dict[str, Any]]] = None
     
     def __init__(self):
         """Initialize configuration from environment or config.py file."""
         # Try to import from config.py first
         try:
-            import sys
-            from pathlib import Path
-            
             # Add parent directory to path to import config
-            config_dir = Path(__file__).parent.parent
-            if str(config_dir) not in sys.path:
-                sys.path.insert(0, str(config_dir))
+            if _CONFIG_DIR_STR not in sys.path:
+                sys.path.insert(0, _CONFIG_DIR_STR)
             
             try:
                 import config as config_module
-                self._load_from_module(config_module)
+                self._load_from_cached_module(config_module)
             except ImportError:
                 self._load_from_env()
         except Exception as e:
@@ -31,6 +67,23 @@ class Config:
         # Leaving validation to an explicit call avoids raising during test setup
         # when a placeholder `config.py` is present in the working tree.
     
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the cached config.py settings so the next Config() re-reads the module."""
+        cls._module_cache = None
+    
+    def _load_from_cached_module(self, config_module) -> None:
+        """Load configuration from config.py, reusing the last parse while the file is unchanged."""
+        key = _module_key(config_module)
+        cached = Config._module_cache
+        if key is not None and cached is not None and cached[0] == key:
+            # Mutable settings (aliases, user agent) are copied per instance
+            self.__dict__.update(_copy_settings(cached[1]))
+            return
+        self._load_from_module(config_module)
+        if key is not None:
+            Config._module_cache = (key, _copy_settings(self.__dict__))
+    
     def _load_from_module(self, config_module) -> None:
         """Load configuration from config.py module."""
         # Lidarr connection
@@ -45,6 +98,7 @@ class Config:
         # API rate limiting
         self.musicbrainz_delay = getattr(config_module, 'MUSICBRAINZ_DELAY', 1.0)
         self.use_musicbrainz = getattr(config_module, 'USE_MUSICBRAINZ', True)
+        self.musicbrainz_cache_path = getattr(config_module, 'MUSICBRAINZ_CACHE_PATH', None)
         self.lidarr_request_delay = getattr(config_module, 'LIDARR_REQUEST_DELAY', 2.0)
         self.max_retries = getattr(config_module, 'MAX_RETRIES', 3)
         self.retry_delay = getattr(config_module, 'RETRY_DELAY', 5.0)
@@ -73,32 +127,35 @@ class Config:
     
     def _load_from_env(self) -> None:
         """Load configuration from environment variables (fallback)."""
+        getenv = os.environ.get
+        
         # Lidarr connection
-        self.lidarr_base_url = os.getenv('LIDARR_BASE_URL', 'http://localhost:8686')
-        self.lidarr_api_key = os.getenv('LIDARR_API_KEY')
+        self.lidarr_base_url = getenv('LIDARR_BASE_URL', 'http://localhost:8686')
+        self.lidarr_api_key = getenv('LIDARR_API_KEY')
         
         # Lidarr import settings
-        self.quality_profile_id = int(os.getenv('QUALITY_PROFILE_ID', '1'))
-        self.metadata_profile_id = int(os.getenv('METADATA_PROFILE_ID', '1'))
-        self.root_folder_path = os.getenv('ROOT_FOLDER_PATH', '/music')
+        self.quality_profile_id = int(getenv('QUALITY_PROFILE_ID', '1'))
+        self.metadata_profile_id = int(getenv('METADATA_PROFILE_ID', '1'))
+        self.root_folder_path = getenv('ROOT_FOLDER_PATH', '/music')
         
         # API rate limiting
-        self.musicbrainz_delay = float(os.getenv('MUSICBRAINZ_DELAY', '1.0'))
-        self.use_musicbrainz = os.getenv('USE_MUSICBRAINZ', 'true').lower() == 'true'
-        self.lidarr_request_delay = float(os.getenv('LIDARR_REQUEST_DELAY', '2.0'))
-        self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
-        self.retry_delay = float(os.getenv('RETRY_DELAY', '5.0'))
-        self.api_error_delay = float(os.getenv('API_ERROR_DELAY', '5.0'))
+        self.musicbrainz_delay = float(getenv('MUSICBRAINZ_DELAY', '1.0'))
+        self.use_musicbrainz = getenv('USE_MUSICBRAINZ', 'true').lower() == 'true'
+        self.musicbrainz_cache_path = getenv('MUSICBRAINZ_CACHE_PATH') or None
+        self.lidarr_request_delay = float(getenv('LIDARR_REQUEST_DELAY', '2.0'))
+        self.max_retries = int(getenv('MAX_RETRIES', '3'))
+        self.retry_delay = float(getenv('RETRY_DELAY', '5.0'))
+        self.api_error_delay = float(getenv('API_ERROR_DELAY', '5.0'))
         
         # Batch processing
-        self.batch_size = int(os.getenv('BATCH_SIZE', '10'))
-        self.batch_pause = float(os.getenv('BATCH_PAUSE', '10.0'))
+        self.batch_size = int(getenv('BATCH_SIZE', '10'))
+        self.batch_pause = float(getenv('BATCH_PAUSE', '10.0'))
         
         # MusicBrainz user agent
         self.musicbrainz_user_agent = {
-            'app_name': os.getenv('MB_APP_NAME', 'lidarr-album-import-script'),
-            'version': os.getenv('MB_VERSION', '1.0'),
-            'contact': os.getenv('MB_CONTACT', 'rutty.stuart@gmail.com')
+            'app_name': getenv('MB_APP_NAME', 'lidarr-album-import-script'),
+            'version': getenv('MB_VERSION', '1.0'),
+            'contact': getenv('MB_CONTACT', 'rutty.stuart@gmail.com')
         }
         
         # Artist aliases (simplified for env vars)
@@ -127,23 +184,36 @@ class Config:
                 "MUSICBRAINZ_DELAY must be at least 1.0 second to respect MusicBrainz rate limits."
             )
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Changing any setting invalidates the cached to_dict() result
+        if not name.startswith('_'):
+            self.__dict__['_dict_cache'] = None
+        object.__setattr__(self, name, value)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Export configuration as dictionary."""
-        return {
-            'lidarr_base_url': self.lidarr_base_url,
-            'quality_profile_id': self.quality_profile_id,
-            'metadata_profile_id': self.metadata_profile_id,
-            'root_folder_path': self.root_folder_path,
-            'musicbrainz_delay': self.musicbrainz_delay,
-            'use_musicbrainz': self.use_musicbrainz,
-            'lidarr_request_delay': self.lidarr_request_delay,
-            'max_retries': self.max_retries,
-            'retry_delay': self.retry_delay,
-            'api_error_delay': self.api_error_delay,
-            'batch_size': self.batch_size,
-            'batch_pause': self.batch_pause,
-            'artist_aliases': self.artist_aliases,
-        }
+        """Export configuration as dictionary.
+        
+        The dict is built once and cached until a setting changes; callers
+        get a shallow copy so mutating it does not affect the cache.
+        """
+        if getattr(self, '_dict_cache', None) is None:
+            self._dict_cache = {
+                'lidarr_base_url': self.lidarr_base_url,
+                'quality_profile_id': self.quality_profile_id,
+                'metadata_profile_id': self.metadata_profile_id,
+                'root_folder_path': self.root_folder_path,
+                'musicbrainz_delay': self.musicbrainz_delay,
+                'use_musicbrainz': self.use_musicbrainz,
+                'musicbrainz_cache_path': self.musicbrainz_cache_path,
+                'lidarr_request_delay': self.lidarr_request_delay,
+                'max_retries': self.max_retries,
+                'retry_delay': self.retry_delay,
+                'api_error_delay': self.api_error_delay,
+                'batch_size': self.batch_size,
+                'batch_pause': self.batch_pause,
+                'artist_aliases': self.artist_aliases,
+            }
+        return dict(self._dict_cache)
     
     def __repr__(self) -> str:
         """String representation (sanitized - no API key)."""
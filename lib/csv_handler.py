@@ -9,11 +9,28 @@ The status tracking enables resumable imports and detailed progress reporting.
 
 import csv
 import logging
-from typing import List, Dict, Tuple
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
+from lib.models import CSVItem
+from lib.status_store import StatusStore
+
 logger = logging.getLogger(__name__)
 
+# CSVs at least this large are read through mmap (see CSVHandler._open_lines)
+MMAP_THRESHOLD = 1024 * 1024
+
+# CSVs at least this large are parsed with pandas when it is installed
+# (see CSVHandler._read_items_pandas)
+PANDAS_THRESHOLD = 8 * 1024 * 1024
+
 
 class ItemStatus:
     """
@@ -47,38 +64,45 @@ class ItemStatus:
     # TESTING STATES
     DRY_RUN = 'dry_run'
     
+    # Status groups, built once so membership checks are O(1) hash lookups
+    _PENDING_SET = frozenset({PENDING_REFRESH, PENDING_IMPORT})
+    _SKIP_SET = frozenset({
+        SKIP, SKIP_NO_MUSICBRAINZ,
+        SKIP_NO_ARTIST_MATCH, SKIP_API_ERROR,
+        SKIP_ARTIST_EXISTS, SKIP_ALBUM_MB_NORESULTS,
+        ALREADY_MONITORED
+    })
+    _ERROR_SET = frozenset({
+        ERROR_CONNECTION, ERROR_TIMEOUT,
+        ERROR_INVALID_DATA, ERROR_UNKNOWN
+    })
+    # Empty status means "not processed yet"
+    _RETRY_SET = _ERROR_SET | _PENDING_SET | {''}
+    
     @classmethod
     def is_success(cls, status: str) -> bool:
         """Check if status indicates successful completion."""
-        return status in (cls.SUCCESS,)
+        return status == cls.SUCCESS
     
     @classmethod
     def is_pending(cls, status: str) -> bool:
         """Check if status indicates pending/in-progress state."""
-        return status in (cls.PENDING_REFRESH, cls.PENDING_IMPORT)
+        return status in cls._PENDING_SET
     
     @classmethod
     def is_skip(cls, status: str) -> bool:
         """Check if status indicates permanent skip (don't retry)."""
-        return status in (
-            cls.SKIP, cls.SKIP_NO_MUSICBRAINZ, 
-            cls.SKIP_NO_ARTIST_MATCH, cls.SKIP_API_ERROR,
-            cls.SKIP_ARTIST_EXISTS, cls.SKIP_ALBUM_MB_NORESULTS,
-            cls.ALREADY_MONITORED
-        )
+        return status in cls._SKIP_SET
     
     @classmethod
     def is_error(cls, status: str) -> bool:
         """Check if status indicates temporary error (retry possible)."""
-        return status in (
-            cls.ERROR_CONNECTION, cls.ERROR_TIMEOUT,
-            cls.ERROR_INVALID_DATA, cls.ERROR_UNKNOWN
-        )
+        return status in cls._ERROR_SET
     
     @classmethod
     def should_retry(cls, status: str) -> bool:
         """Check if status indicates item should be retried."""
-        return status == '' or cls.is_error(status) or cls.is_pending(status)
+        return status in cls._RETRY_SET
 
 
 class CSVHandler:
@@ -93,22 +117,39 @@ class CSVHandler:
     which items have been processed.
     """
     
-    def __init__(self, csv_path: str):
+    def __init__(self, csv_path: str, flush_every: int = 25,
+                 status_store: Optional[StatusStore] = None,
+                 tail_copy: bool = False):
         """
         Initialize the CSV handler.
         
         Args:
             csv_path: Path to the CSV file
+            flush_every: Number of buffered single-item updates that triggers
+                a CSV rewrite (see update_single_status)
+            status_store: Optional SQLite journal for single-item updates. When
+                given, statuses are journaled there and merged into the CSV
+                only on flush() (see lib.status_store)
+            tail_copy: During status rewrites, copy the rest of the file verbatim
+                once every pending update has matched a row. Faster when updates
+                cluster near the top of a large CSV, but later duplicate
+                artist/album rows keep their old status, so it is opt-in
         """
         self.csv_path = Path(csv_path)
         self.has_status_column = False
         
+        # Write-behind buffer for update_single_status: (artist, album) -> status
+        self._pending: Dict[Tuple[str, str], str] = {}
+        self._flush_every = max(1, flush_every)
+        self._status_store = status_store
+        self.tail_copy = tail_copy
+        
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
         logger.info(f"CSVHandler initialized for {self.csv_path}")
     
-    def read_items(self) -> Tuple[List[Dict[str, str]], bool]:
+    def read_items(self) -> Tuple[List[CSVItem], bool]:
         """
         Read CSV file containing artist/album pairs with optional progress tracking.
         
@@ -116,53 +157,159 @@ class CSVHandler:
         by universal_parser.py --enrich-musicbrainz feature.
         
         Returns:
-            Tuple of (list of items with artist/album/status/mb_ids, has_status_column boolean)
+            Tuple of (list of CSVItem rows with artist/album/status/mb_ids, has_status_column boolean)
         """
-        items = []
+        # Make sure buffered status updates are visible to this read
+        self.flush()
         
-        with open(self.csv_path, newline="", encoding="utf-8") as fh:
-            reader = csv.DictReader(fh)
-            fieldnames = reader.fieldnames
-            
-            # Auto-detect if CSV already has status tracking
-            if fieldnames and 'status' in fieldnames:
-                self.has_status_column = True
-                logger.info("Found existing status column, will track progress")
-            else:
-                self.has_status_column = False
-            
-            # Check for MusicBrainz ID columns
-            has_mb_ids = fieldnames and 'mb_artist_id' in fieldnames and 'mb_release_id' in fieldnames
-            if has_mb_ids:
-                logger.info("Found MusicBrainz ID columns (enriched CSV from universal_parser)")
-            
-            for row in reader:
-                artist = row.get('artist', '').strip()
-                album = row.get('album', '').strip()
-                status = row.get('status', '').strip() if self.has_status_column else ''
-                
-                # Read MB IDs if present (will be empty strings if not enriched)
-                mb_artist_id = row.get('mb_artist_id', '').strip() if has_mb_ids else ''
-                mb_release_id = row.get('mb_release_id', '').strip() if has_mb_ids else ''
-                
-                # Only include rows with both artist and album
-                if artist and album:
-                    items.append({
-                        "artist": artist, 
-                        "album": album, 
-                        "status": status,
-                        "mb_artist_id": mb_artist_id,
-                        "mb_release_id": mb_release_id,
-                        "row_num": reader.line_num
-                    })
+        parsed = None
+        if self.csv_path.stat().st_size >= PANDAS_THRESHOLD:
+            parsed = self._read_items_pandas()
+        if parsed is None:
+            parsed = self._read_items_csv()
+        items, has_mb_ids = parsed
         
         logger.info(f"Read {len(items)} items from CSV")
         if has_mb_ids:
-            enriched_count = sum(1 for item in items if item.get('mb_release_id'))
+            enriched_count = sum(1 for item in items if item.mb_release_id)
             logger.info(f"  📍 {enriched_count} items have MusicBrainz IDs")
         return items, self.has_status_column
     
-    def update_all_statuses(self, items: List[Dict[str, str]]):
+    def _inspect_header(self, fieldnames: List[str]) -> bool:
+        """Record whether the CSV tracks status; return whether it has MB ID columns."""
+        # Auto-detect if CSV already has status tracking
+        if 'status' in fieldnames:
+            self.has_status_column = True
+            logger.info("Found existing status column, will track progress")
+        else:
+            self.has_status_column = False
+        
+        # Check for MusicBrainz ID columns
+        has_mb_ids = 'mb_artist_id' in fieldnames and 'mb_release_id' in fieldnames
+        if has_mb_ids:
+            logger.info("Found MusicBrainz ID columns (enriched CSV from universal_parser)")
+        return has_mb_ids
+    
+    def _read_items_csv(self) -> Tuple[List[CSVItem], bool]:
+        """Parse items with the stdlib csv module; returns (items, has_mb_ids)."""
+        items = []
+        
+        with self._open_lines() as lines:
+            # Plain csv.reader with precomputed column indices avoids building
+            # a dict for every row
+            reader = csv.reader(lines)
+            fieldnames = next(reader, [])
+            has_mb_ids = self._inspect_header(fieldnames)
+            
+            if 'artist' in fieldnames and 'album' in fieldnames:
+                artist_idx = fieldnames.index('artist')
+                album_idx = fieldnames.index('album')
+                status_idx = fieldnames.index('status') if self.has_status_column else -1
+                mb_artist_idx = fieldnames.index('mb_artist_id') if has_mb_ids else -1
+                mb_release_idx = fieldnames.index('mb_release_id') if has_mb_ids else -1
+                # Short rows are padded so every known column index is valid
+                width = max(artist_idx, album_idx, status_idx, mb_artist_idx, mb_release_idx) + 1
+                
+                for row in reader:
+                    if len(row) < width:
+                        if not row:
+                            continue  # blank line
+                        row.extend([''] * (width - len(row)))
+                    
+                    artist = row[artist_idx].strip()
+                    album = row[album_idx].strip()
+                    
+                    # Only include rows with both artist and album
+                    if not (artist and album):
+                        continue
+                    
+                    items.append(CSVItem(
+                        artist=artist,
+                        album=album,
+                        # Interned: a handful of distinct values shared by every row
+                        status=sys.intern(row[status_idx].strip()) if status_idx >= 0 else '',
+                        # MB IDs are empty strings if the CSV is not enriched
+                        mb_artist_id=row[mb_artist_idx].strip() if has_mb_ids else '',
+                        mb_release_id=row[mb_release_idx].strip() if has_mb_ids else '',
+                        row_num=reader.line_num,
+                    ))
+        
+        return items, has_mb_ids
+    
+    def _read_items_pandas(self) -> Optional[Tuple[List[CSVItem], bool]]:
+        """
+        Parse items with pandas' C parser and vectorized string stripping.
+        
+        pandas is optional: returns None when it is not installed or cannot
+        parse the file, so the caller falls back to the csv module. Row
+        numbers are derived from the record index, which matches the line
+        number unless a quoted field spans several lines.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return None
+        
+        try:
+            df = pd.read_csv(self.csv_path, dtype=str, encoding='utf-8',
+                             keep_default_na=False, skip_blank_lines=False)
+        except Exception as e:
+            logger.debug(f"pandas could not parse {self.csv_path}, using csv module: {e}")
+            return None
+        
+        fieldnames = list(df.columns)
+        has_mb_ids = self._inspect_header(fieldnames)
+        if 'artist' not in fieldnames or 'album' not in fieldnames:
+            return [], has_mb_ids
+        
+        columns = ['artist', 'album']
+        if self.has_status_column:
+            columns.append('status')
+        if has_mb_ids:
+            columns += ['mb_artist_id', 'mb_release_id']
+        
+        df = df[columns].apply(lambda col: col.str.strip())
+        # Only include rows with both artist and album
+        df = df[(df['artist'] != '') & (df['album'] != '')]
+        
+        blanks = [''] * len(df)
+        statuses = [sys.intern(st) for st in df['status'].tolist()] if self.has_status_column else blanks
+        mb_artist_ids = df['mb_artist_id'].tolist() if has_mb_ids else blanks
+        mb_release_ids = df['mb_release_id'].tolist() if has_mb_ids else blanks
+        # Record i sits on line i + 2 (after the header line)
+        row_nums = (df.index + 2).tolist()
+        
+        items = [
+            CSVItem(artist, album, status, mb_artist_id, mb_release_id, row_num)
+            for artist, album, status, mb_artist_id, mb_release_id, row_num in zip(
+                df['artist'].tolist(), df['album'].tolist(), statuses,
+                mb_artist_ids, mb_release_ids, row_nums,
+            )
+        ]
+        return items, has_mb_ids
+    
+    @contextmanager
+    def _open_lines(self) -> Iterator[Iterator[str]]:
+        """
+        Yield the CSV as an iterator of text lines for ``csv.reader``.
+        
+        Large files are memory-mapped so lines are served straight from the
+        page cache; small files use a regular text file object, where the
+        fixed cost of setting up a mapping is not worth it.
+        """
+        size = self.csv_path.stat().st_size
+        if size < MMAP_THRESHOLD or size == 0:
+            with open(self.csv_path, newline="", encoding="utf-8") as fh:
+                yield fh
+            return
+        
+        with open(self.csv_path, 'rb') as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # UTF-8 never uses the newline byte inside a multi-byte character,
+            # so splitting on b'\n' before decoding is safe
+            yield (line.decode('utf-8') for line in iter(mm.readline, b''))
+    
+    def update_all_statuses(self, items: List[CSVItem]):
         """
         Update the CSV file with processing status for all items.
         
@@ -178,67 +325,42 @@ class CSVHandler:
         
         logger.info(f"Updating CSV status for {len(items)} items...")
         
+        # Create lookup for status updates based on artist+album combination.
+        # Buffered/journaled single-item updates are folded in so they are written too.
+        pending = self._take_pending()
+        status_lookup = dict(pending)
+        status_lookup.update({(item.artist, item.album): item.status for item in items})
+        logger.debug(f"Created status lookup with {len(status_lookup)} entries")
+        
         try:
-            # Read original file to preserve structure and order
-            logger.debug(f"Reading original CSV file: {self.csv_path}")
-            with open(self.csv_path, 'r', newline="", encoding="utf-8") as fh:
-                reader = csv.DictReader(fh)
-                fieldnames = list(reader.fieldnames) if reader.fieldnames else ['artist', 'album']
-                
-                # Add status column if it doesn't exist
-                if 'status' not in fieldnames:
-                    fieldnames.append('status')
-                    logger.info("Added 'status' column to CSV")
-                    self.has_status_column = True
-                else:
-                    logger.debug("CSV already has 'status' column")
-                
-                all_rows = list(reader)
-            
-            logger.debug(f"Read {len(all_rows)} rows from CSV")
-            
-            # Create lookup for status updates based on artist+album combination
-            status_lookup = {f"{item['artist']}|{item['album']}": item['status'] for item in items}
-            logger.debug(f"Created status lookup with {len(status_lookup)} entries")
-            
-            # Track what we're updating for debugging
-            updates_made = 0
-            
-            # Write back with updated status information
-            logger.debug(f"Writing updated CSV file: {self.csv_path}")
-            with open(self.csv_path, 'w', newline="", encoding="utf-8") as fh:
-                writer = csv.DictWriter(fh, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for row in all_rows:
-                    key = f"{row['artist']}|{row['album']}"
-                    if key in status_lookup:
-                        old_status = row.get('status', '')
-                        new_status = status_lookup[key]
-                        row['status'] = new_status
-                        updates_made += 1
-                        logger.debug(f"Updated status for '{key}': '{old_status}' -> '{new_status}'")
-                    elif 'status' not in row:
-                        row['status'] = ''  # Empty status for newly added column
-                    writer.writerow(row)
+            total_rows, updates_made, _ = self._rewrite_statuses(status_lookup)
+            if self._status_store is not None:
+                self._status_store.clear()
             
             logger.info(f"✅ CSV update complete: {self.csv_path}")
-            logger.info(f"   - Total rows: {len(all_rows)}")
+            logger.info(f"   - Total rows: {total_rows}")
             logger.info(f"   - Status updates made: {updates_made}")
             
         except PermissionError:
+            self._restore_pending(pending)
             logger.error(f"Permission denied writing to CSV file: {self.csv_path}")
             logger.error("Tip: Make sure the CSV file is not open in Excel or another program")
         except Exception as e:
-            logger.exception(f"Failed to update CSV status: %s", e)
+            self._restore_pending(pending)
+            logger.exception("Failed to update CSV status: %s", e)
             if "encoding" in str(e).lower():
                 logger.error("Tip: Try ensuring the CSV file uses UTF-8 encoding")
     
     def update_single_status(self, artist: str, album: str, status: str):
         """
-        Update status for a single item in the CSV file immediately after processing.
+        Record the status of a single item immediately after processing.
         
-        This provides real-time status updates during processing, allowing you to:
+        Updates are buffered and written in one rewrite every ``flush_every``
+        items, so a run of N items costs N/flush_every rewrites instead of N.
+        With a status store, each update is journaled to SQLite instead and the
+        CSV is only rewritten on flush(). Call flush() (or use the handler as a
+        context manager) to write any remaining updates. Buffered updates still
+        let you:
         - Monitor progress by checking the CSV file during execution
         - Resume interrupted runs with accurate status tracking
         - Identify failures as they happen without waiting for completion
@@ -248,53 +370,185 @@ class CSVHandler:
             album: Album name to match
             status: New status code to set
         """
+        if self._status_store is not None:
+            try:
+                self._status_store.set(artist, album, status)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to journal item status, buffering instead: {e}")
+        
+        self._pending[(artist, album)] = status
+        if len(self._pending) >= self._flush_every:
+            self.flush()
+    
+    def flush(self):
+        """
+        Write any buffered or journaled update_single_status() calls to the CSV file.
+        
+        Rows that cannot be found are logged as warnings. Failures are logged
+        rather than raised so a CSV problem never aborts an import run; the
+        updates stay buffered (and the status store, if any, keeps its
+        entries) until a flush succeeds.
+        """
+        pending = self._take_pending()
+        if not pending:
+            return
+        
         try:
-            # Read all rows
-            with open(self.csv_path, 'r', newline="", encoding="utf-8") as fh:
-                reader = csv.DictReader(fh)
-                fieldnames = list(reader.fieldnames) if reader.fieldnames else ['artist', 'album']
-                
-                # Add status column if it doesn't exist
-                if 'status' not in fieldnames:
-                    fieldnames.append('status')
-                    self.has_status_column = True
-                
-                all_rows = list(reader)
-            
-            # Update the matching row
-            key = f"{artist}|{album}"
-            updated = False
-            for row in all_rows:
-                row_key = f"{row['artist']}|{row['album']}"
-                if row_key == key:
-                    row['status'] = status
-                    updated = True
-                    break
+            _, updates_made, unmatched = self._rewrite_statuses(pending)
+            if self._status_store is not None:
+                self._status_store.clear()
             
-            if not updated:
+            for artist, album in unmatched:
                 logger.warning(f"Could not find row in CSV to update: {artist} - {album}")
-                return
-            
-            # Write back
-            with open(self.csv_path, 'w', newline="", encoding="utf-8") as fh:
-                writer = csv.DictWriter(fh, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(all_rows)
             
-            logger.debug(f"✅ Updated CSV status: {artist} - {album} -> {status}")
+            logger.debug("✅ Flushed %d buffered CSV status update(s)", updates_made)
             
         except Exception as e:
+            self._restore_pending(pending)
             logger.warning(f"Failed to update single item status in CSV: {e}")
             # Don't fail the entire run if CSV update fails
     
-    def filter_items_by_status(
-        self, 
-        items: List[Dict[str, str]], 
+    def _take_pending(self) -> Dict[Tuple[str, str], str]:
+        """Return buffered and journaled updates, emptying the in-memory buffer."""
+        pending = self._pending
+        self._pending = {}
+        if self._status_store is not None:
+            journaled = self._status_store.get_all()
+            journaled.update(pending)
+            pending = journaled
+        return pending
+    
+    def _restore_pending(self, pending: Dict[Tuple[str, str], str]):
+        """Put updates taken by _take_pending() back after a failed rewrite."""
+        # Updates buffered since the take are newer and win
+        self._pending = {**pending, **self._pending}
+    
+    def __enter__(self) -> 'CSVHandler':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+    
+    def _rewrite_statuses(
+        self, status_lookup: Dict[Tuple[str, str], str]
+    ) -> Tuple[int, int, List[Tuple[str, str]]]:
+        """
+        Stream the CSV into a temporary file, patching status values on the way.
+        
+        Rows are copied one at a time so memory use stays flat regardless of
+        file size. The temporary file replaces the original with ``os.replace``
+        so readers never observe a half-written CSV. If no row's status
+        actually changes the original file is left untouched.
+        
+        With ``tail_copy`` enabled, parsing stops once every key has matched
+        and the remainder of the file is copied as raw text.
+        
+        Args:
+            status_lookup: Mapping of ``(artist, album)`` keys to new status codes
+            
+        Returns:
+            Tuple of (rows parsed, rows whose status was set, unmatched keys)
+        """
+        total_rows = 0
+        updates_made = 0
+        changed = False
+        matched = set()
+        
+        # Uniquely named temp file in the same directory, so os.replace is an
+        # atomic rename and no user file (e.g. albums.tmp) can be clobbered
+        dst = tempfile.NamedTemporaryFile(
+            'w', newline="", encoding="utf-8", dir=self.csv_path.parent,
+            prefix=f".{self.csv_path.stem}.", suffix='.tmp', delete=False,
+        )
+        tmp_path = Path(dst.name)
+        
+        try:
+            with open(self.csv_path, 'r', newline="", encoding="utf-8") as src, dst:
+                # Rows stay plain lists indexed by column position; no per-row dicts
+                reader = csv.reader(src)
+                fieldnames = next(reader, None) or ['artist', 'album']
+                if 'artist' not in fieldnames or 'album' not in fieldnames:
+                    raise ValueError("CSV must have 'artist' and 'album' columns")
+                artist_idx = fieldnames.index('artist')
+                album_idx = fieldnames.index('album')
+                
+                # Add status column if it doesn't exist
+                added_status_column = 'status' not in fieldnames
+                if added_status_column:
+                    fieldnames.append('status')
+                status_idx = fieldnames.index('status')
+                width = len(fieldnames)
+                
+                writer = csv.writer(dst)
+                writer.writerow(fieldnames)
+                
+                # The tail can only be copied verbatim if rows need no new column
+                tail_copy = self.tail_copy and not added_status_column
+                
+                # Checked once so the per-row debug message costs nothing when disabled
+                debug = logger.isEnabledFor(logging.DEBUG)
+                
+                for row in reader:
+                    if len(row) < width:
+                        if not row:
+                            continue  # blank lines are dropped, as csv.DictReader did
+                        # Rows missing values (e.g. newly added status column) get ''
+                        row.extend([''] * (width - len(row)))
+                    
+                    total_rows += 1
+                    key = (row[artist_idx], row[album_idx])
+                    new_status = status_lookup.get(key)
+                    if new_status is not None:
+                        old_status = row[status_idx]
+                        row[status_idx] = new_status
+                        updates_made += 1
+                        matched.add(key)
+                        changed = changed or old_status != new_status
+                        if debug:
+                            logger.debug("Updated status for '%s - %s': '%s' -> '%s'",
+                                         key[0], key[1], old_status, new_status)
+                        writer.writerow(row)
+                        
+                        if tail_copy and len(matched) == len(status_lookup):
+                            # csv.writer does not buffer and csv.reader consumes
+                            # whole lines, so src/dst are both at a row boundary
+                            shutil.copyfileobj(src, dst, 64 * 1024)
+                            logger.debug("All updates applied; copied remaining rows verbatim")
+                            break
+                        continue
+                    writer.writerow(row)
+            
+            if changed or added_status_column:
+                # NamedTemporaryFile is created 0600; keep the CSV's own permissions
+                shutil.copymode(self.csv_path, tmp_path)
+                os.replace(tmp_path, self.csv_path)
+                self.has_status_column = True
+                if added_status_column:
+                    logger.info("Added 'status' column to CSV")
+            else:
+                # Nothing to change; leave the original file untouched
+                tmp_path.unlink()
+                logger.debug("No status changes; skipping rewrite")
+        except BaseException:
+            dst.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        
+        logger.debug(f"Streamed {total_rows} rows from CSV")
+        unmatched = [key for key in status_lookup if key not in matched]
+        return total_rows, updates_made, unmatched
+    
+    def partition(
+        self,
+        items: List[CSVItem],
         skip_completed: bool = True,
         skip_permanent_failures: bool = True
-    ) -> List[Dict[str, str]]:
+    ) -> Tuple[List[CSVItem], Counter]:
         """
-        Filter items based on their status codes.
+        Filter items by status and summarize all statuses in a single pass.
         
         Args:
             items: List of items to filter
@@ -302,13 +556,15 @@ class CSVHandler:
             skip_permanent_failures: Skip items with permanent skip status (default: True)
             
         Returns:
-            Filtered list of items to process
+            Tuple of (items to process, Counter of status codes across all items)
         """
         filtered = []
+        summary = Counter()
         skipped_count = 0
         
         for item in items:
-            status = item.get('status', '')
+            status = item.status
+            summary[status] += 1
             
             # Skip successful items if requested
             if skip_completed and ItemStatus.is_success(status):
@@ -326,9 +582,28 @@ class CSVHandler:
         if skipped_count > 0:
             logger.info(f"Filtered out {skipped_count} already processed/failed items")
         
-        return filtered
+        return filtered, summary
     
-    def get_status_summary(self, items: List[Dict[str, str]]) -> Dict[str, int]:
+    def filter_items_by_status(
+        self, 
+        items: List[CSVItem], 
+        skip_completed: bool = True,
+        skip_permanent_failures: bool = True
+    ) -> List[CSVItem]:
+        """
+        Filter items based on their status codes.
+        
+        Args:
+            items: List of items to filter
+            skip_completed: Skip items with success status (default: True)
+            skip_permanent_failures: Skip items with permanent skip status (default: True)
+            
+        Returns:
+            Filtered list of items to process
+        """
+        return self.partition(items, skip_completed, skip_permanent_failures)[0]
+    
+    def get_status_summary(self, items: List[CSVItem]) -> Dict[str, int]:
         """
         Generate a summary of status codes across all items.
         
@@ -338,11 +613,7 @@ class CSVHandler:
         Returns:
             Dictionary mapping status codes to counts
         """
-        summary = {}
-        for item in items:
-            status = item.get('status', 'unknown')
-            summary[status] = summary.get(status, 0) + 1
-        return summary
+        return Counter(item.status for item in items)
     
     def __repr__(self) -> str:
         """String representation of the handler."""
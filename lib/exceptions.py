@@ -21,6 +21,11 @@ class LidarrAPIError(APIError):
     pass
 
 
+class CircuitOpenError(LidarrAPIError):
+    """Lidarr calls are being refused after repeated consecutive failures."""
+    pass
+
+
 class MusicBrainzAPIError(APIError):
     """Error communicating with MusicBrainz API."""
     pass
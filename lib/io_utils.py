@@ -7,16 +7,21 @@ from pathlib import Path
 from datetime import datetime
 import csv
 import logging
+import shutil
 from typing import List, Dict, Tuple
 
 
 def create_backup(csv_file: Path) -> Path:
-    """Create a timestamped backup of the original CSV file and return the backup path."""
+    """Create a timestamped backup of the original CSV file and return the backup path.
+
+    The file is copied byte-for-byte with `shutil.copyfile`, which lets the OS
+    do the copy without decoding the CSV in Python.
+    """
     p = Path(csv_file)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = f"{p.stem}_backup_{timestamp}{p.suffix}"
     backup_path = p.parent / backup_name
-    backup_path.write_text(p.read_text(encoding='utf-8'), encoding='utf-8')
+    shutil.copyfile(p, backup_path)
     logging.info(f"Created backup: {backup_path}")
     return backup_path
 
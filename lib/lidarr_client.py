@@ -10,11 +10,24 @@ Provides a clean interface to the Lidarr Web Service API v1 with:
 This client encapsulates all Lidarr API interactions for the music importer.
 """
 
+import functools
+import hashlib
 import logging
+import random
+import threading
 import time
+import unicodedata
+
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional: faster parsing of large library listings
+    orjson = None
 from typing import Optional, Dict, Any, List, Tuple, Callable
 
+from lib.exceptions import CircuitOpenError
 from lib.text_utils import (
     normalize_artist_name,
     normalize_profanity,
@@ -26,6 +39,68 @@ from lib.text_utils import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying; other 4xx responses are definitive
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Upper bound for a single backoff sleep in seconds
+MAX_RETRY_WAIT = 60.0
+# How long artist/album lookup results are reused; "not found" expires sooner
+LOOKUP_CACHE_TTL = 900.0
+NEGATIVE_LOOKUP_CACHE_TTL = 60.0
+# Per-artist album lists are reused across the back-to-back calls of one
+# album workflow; kept short because an artist refresh fills them in later
+ARTIST_ALBUMS_CACHE_TTL = 60.0
+
+def _parse_json(r: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+# Memoized normalizer: the same library titles and artist names are
+# normalized over and over when matching a batch of albums
+# (normalize_album_title_for_matching is memoized in text_utils)
+_norm = functools.lru_cache(maxsize=131072)(normalize_artist_name)
+
+
+@functools.lru_cache(maxsize=16384)
+def _canon(text: str) -> str:
+    """Canonical form for case-insensitive title/name comparison (NFKC + casefold)."""
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+# Deletes '.' and '-' in one C-level pass for loose artist-name comparison
+_DOT_DASH_TBL = str.maketrans('', '', '.-')
+
+# Edition keywords ("deluxe", "remastered", ...) used to decide whether a search
+# title names a specific edition; get_edition_variants() is constant
+_EDITION_KEYWORDS = tuple(dict.fromkeys(v.strip('()[]- ') for v in get_edition_variants()))
+
+
+@functools.lru_cache(maxsize=8192)
+def _title_variations(album_title: str) -> Tuple[str, ...]:
+    """Memoized get_album_title_variations(), as an immutable tuple."""
+    return tuple(get_album_title_variations(album_title))
+
+
+def _release_date(album: Dict[str, Any]) -> str:
+    """Sort key for Lidarr albums; undated releases count as oldest."""
+    return album.get('releaseDate', '1900-01-01')
+
+# (by_mbid, by_name) lookup tables returned by LidarrClient.build_library_index()
+LibraryIndex = Tuple[Dict[str, Dict[str, Any]], Dict[Tuple[str, str], Dict[str, Any]]]
+
+# Album fields the library index is keyed on; changing them needs a rebuild
+_ALBUM_INDEX_FIELDS = ('title', 'releaseGroupId', 'artistId', 'artist')
+
+
+def _index_key(album: Dict[str, Any]) -> Tuple[str, str]:
+    """(normalized artist, normalized title) key of an album in the library index."""
+    return (
+        _norm(album.get('artist', {}).get('artistName', '')),
+        _norm(album['title'])
+    )
+
 
 class LidarrClient:
     """
@@ -49,7 +124,11 @@ class LidarrClient:
         request_delay: float = 0.5,
         max_retries: int = 3,
         retry_delay: float = 2.0,
-        timeout: int = 30
+        timeout: int = 30,
+        library_index_ttl: float = 300.0,
+        cache_ttl: float = 3600.0,
+        rate_per_sec: Optional[float] = None,
+        burst: int = 3
     ):
         """
         Initialize the Lidarr API client.
@@ -64,6 +143,10 @@ class LidarrClient:
             max_retries: Maximum number of retries for failed requests (default: 3)
             retry_delay: Base delay for exponential backoff (default: 2.0)
             timeout: Request timeout in seconds (default: 30)
+            library_index_ttl: Seconds a built library index is reused (default: 300)
+            cache_ttl: Seconds library listings and artist records are cached (default: 3600)
+            rate_per_sec: Sustained request rate (default: 1 / request_delay, unlimited if 0)
+            burst: Requests that may be sent back-to-back after an idle period (default: 3)
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -74,21 +157,70 @@ class LidarrClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
-        self.last_request_time = 0
+        # Token bucket: refills at rate_per_sec up to burst tokens, one per request
+        if rate_per_sec is None:
+            rate_per_sec = 1.0 / request_delay if request_delay > 0 else 0.0
+        self._refill_rate = rate_per_sec
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Circuit breaker: after _cb_threshold consecutive transient failures,
+        # fail fast for _cb_cooldown seconds, then let one probe through
+        # (half-open) while every other caller keeps failing fast. State is
+        # shared by every thread using the client, so it is only touched under _cb_lock
+        self._cb_fail_count = 0
+        self._cb_opened_at = 0.0
+        self._cb_probing = False
+        self._cb_threshold = 5
+        self._cb_cooldown = 30.0
+        self._cb_lock = threading.Lock()
+        
+        self.library_index_ttl = library_index_ttl
+        self._album_index: Optional[LibraryIndex] = None
+        self._album_index_time = 0.0
+        self._albums_by_artist: Optional[Dict[int, List[Dict[str, Any]]]] = None
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Any, Tuple[Any, float]] = {}
+        self._albums_cache: Dict[int, Tuple[List[Dict[str, Any]], float]] = {}
+        # Validators for conditional GETs: (url, params) -> (etag, body digest, parsed body)
+        self._conditional: Dict[Any, Tuple[Optional[str], bytes, Any]] = {}
+        
+        # One pooled session for all calls so keep-alive connections are reused
+        # instead of paying a TCP/TLS handshake per request
+        self._session = requests.Session()
+        self._headers = {"X-Api-Key": api_key}
+        self._session.headers["X-Api-Key"] = api_key
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         
         logger.info(f"LidarrClient initialized for {self.base_url}")
     
     def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        return {"X-Api-Key": self.api_key}
+        """Get headers for API requests (built once; the session already sends them)."""
+        return self._headers
     
     def _wait_for_rate_limit(self):
-        """Apply rate limiting between requests."""
-        if self.request_delay > 0:
-            time_since_last = time.time() - self.last_request_time
-            if time_since_last < self.request_delay:
-                time.sleep(self.request_delay - time_since_last)
-        self.last_request_time = time.time()
+        """
+        Apply token-bucket rate limiting before a request.
+        
+        Up to ``burst`` requests go out immediately after an idle period; after
+        that requests are paced at ``rate_per_sec``.
+        """
+        if self._refill_rate <= 0:
+            return
+        # Reserve a token under the lock (the balance may go negative) and
+        # sleep outside it, so concurrent callers queue up at the refill rate
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self._refill_rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
     
     def _retry_request(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -100,24 +232,226 @@ class LidarrClient:
             
         Returns:
             Result of the successful request, or raises exception
+            
+        Raises:
+            CircuitOpenError: Lidarr failed repeatedly and the cooldown has not elapsed
+        """
+        is_probe = self._cb_acquire()
+        try:
+            return self._retry_loop(is_probe, func, *args, **kwargs)
+        finally:
+            if is_probe:
+                # Probe ended without closing or re-opening the circuit (e.g. a
+                # non-transient error); let the next caller probe instead
+                with self._cb_lock:
+                    self._cb_probing = False
+    
+    def _cb_acquire(self) -> bool:
+        """
+        Check the circuit breaker before a request.
+        
+        Returns:
+            True if this caller is the half-open probe, False if the circuit is closed
+            
+        Raises:
+            CircuitOpenError: Cooling down, or another caller's probe is in flight
         """
+        with self._cb_lock:
+            if not self._cb_opened_at:
+                return False
+            if self._cb_probing or time.monotonic() - self._cb_opened_at < self._cb_cooldown:
+                raise CircuitOpenError(
+                    f"Lidarr circuit open after {self._cb_fail_count} consecutive failures; "
+                    f"retrying after {self._cb_cooldown}s cooldown"
+                )
+            self._cb_probing = True
+            return True
+    
+    def _retry_loop(self, is_probe: bool, func: Callable, *args, **kwargs) -> Any:
+        """Retry loop behind _retry_request(); a probe gets a single attempt."""
         for attempt in range(self.max_retries):
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                with self._cb_lock:
+                    self._cb_fail_count = 0
+                    self._cb_opened_at = 0.0
+                    self._cb_probing = False
+                return result
             except requests.exceptions.RequestException as e:
-                # Only retry on service unavailable errors
-                if "503" in str(e) or "Service Unavailable" in str(e):
-                    if attempt < self.max_retries - 1:
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        logger.warning(
-                            f"Service unavailable, retrying in {wait_time}s "
-                            f"(attempt {attempt + 1}/{self.max_retries})"
+                # Retry transient failures only: dropped connections, timeouts,
+                # rate limiting and gateway/service-unavailable responses
+                response = getattr(e, 'response', None)
+                status = getattr(response, 'status_code', None)
+                retryable = (
+                    isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                    or status in RETRYABLE_STATUS_CODES
+                )
+                if retryable:
+                    with self._cb_lock:
+                        self._cb_fail_count += 1
+                        trip = is_probe or self._cb_fail_count >= self._cb_threshold
+                        if trip:
+                            # Open (or re-open after a failed half-open probe)
+                            self._cb_opened_at = time.monotonic()
+                            self._cb_probing = False
+                            fail_count = self._cb_fail_count
+                    if trip:
+                        logger.error(
+                            f"Lidarr failed {fail_count} times in a row; "
+                            f"pausing requests for {self._cb_cooldown}s"
                         )
-                        time.sleep(wait_time)
-                        continue
+                        raise
+                if retryable and attempt < self.max_retries - 1:
+                    wait_time = None
+                    if status == 429:
+                        try:
+                            wait_time = min(float(response.headers['Retry-After']), MAX_RETRY_WAIT)
+                        except (KeyError, TypeError, ValueError):
+                            pass  # Missing or HTTP-date form; fall back to backoff
+                    if wait_time is None:
+                        # Full jitter keeps concurrent retries from firing in lockstep
+                        wait_time = random.uniform(0, min(self.retry_delay * (2 ** attempt), MAX_RETRY_WAIT))
+                    logger.warning(
+                        f"Lidarr request failed ({status or type(e).__name__}), retrying in {wait_time:.2f}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    time.sleep(wait_time)
+                    continue
                 raise
         raise Exception(f"Max retries ({self.max_retries}) exceeded")
     
+    def _cached(
+        self,
+        key: Any,
+        ttl: float,
+        fetcher: Callable[[], Any],
+        store: Optional[Dict[Any, Tuple[Any, float]]] = None
+    ) -> Any:
+        """
+        Return a cached response, calling fetcher() when missing or older than ttl.
+        
+        Entries live in ``store`` (default: the general response cache).
+        Exceptions from fetcher() propagate and nothing is cached for them.
+        """
+        if store is None:
+            store = self._cache
+        now = time.monotonic()
+        entry = store.get(key)
+        if entry is not None and now - entry[1] <= ttl:
+            return entry[0]
+        value = fetcher()
+        store[key] = (value, now)
+        return value
+    
+    def _cached_lookup(self, key: Any) -> Tuple[bool, Any]:
+        """
+        Return (hit, value) for a memoized lookup result.
+        
+        Found results live for LOOKUP_CACHE_TTL, empty (None) results for
+        NEGATIVE_LOOKUP_CACHE_TTL.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            value, ts = entry
+            ttl = LOOKUP_CACHE_TTL if value is not None else NEGATIVE_LOOKUP_CACHE_TTL
+            if time.monotonic() - ts <= ttl:
+                return True, value
+        return False, None
+    
+    def _store_lookup(self, key: Any, value: Any) -> Any:
+        """Memoize a lookup result and return it."""
+        self._cache[key] = (value, time.monotonic())
+        return value
+    
+    def _get_json_conditional(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a JSON listing, reusing the previously parsed body when it is unchanged.
+        
+        Sends If-None-Match when Lidarr supplied an ETag last time and reuses
+        the stored body on 304. Without ETags, a matching digest of the raw
+        body skips the JSON parse instead.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        previous = self._conditional.get(key)
+        headers = {'If-None-Match': previous[0]} if previous and previous[0] else None
+        
+        self._wait_for_rate_limit()
+        r = self._session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if r.status_code == 304 and previous:
+            return previous[2]
+        r.raise_for_status()
+        
+        digest = hashlib.blake2b(r.content, digest_size=16).digest()
+        if previous and previous[1] == digest:
+            value = previous[2]
+        else:
+            value = _parse_json(r)
+        self._conditional[key] = (r.headers.get('ETag'), digest, value)
+        return value
+    
+    def _cached_albums(self):
+        """Yield every album dict held by the listing caches and the library index."""
+        entry = self._cache.get('all_albums')
+        if entry is not None:
+            yield from entry[0]
+        for albums, _ in self._albums_cache.values():
+            yield from albums
+        if self._albums_by_artist is not None:
+            for albums in self._albums_by_artist.values():
+                yield from albums
+        # Bodies kept for conditional GETs can outlive the TTL cache entries
+        for (url, _), (_, _, body) in self._conditional.items():
+            if url.endswith('/api/v1/album') and isinstance(body, list):
+                yield from body
+    
+    def _patch_cached_albums(self, album_ids: List[int], changes: Dict[str, Any]):
+        """
+        Apply a successful album update to the cached copies of those albums.
+        
+        Updates only touch a few albums, so the cached listings and library
+        index are patched in place instead of being refetched. Changes to
+        fields the index is keyed on fall back to _invalidate_albums().
+        """
+        ids = set(album_ids)
+        matches = [album for album in self._cached_albums() if album.get('id') in ids]
+        if any(field in changes and album.get(field) != changes[field]
+               for album in matches for field in _ALBUM_INDEX_FIELDS):
+            self._invalidate_albums()
+            return
+        for album in matches:
+            album.update(changes)
+    
+    def _add_cached_album(self, album: Dict[str, Any]):
+        """Add a newly created album to the cached library listing and index."""
+        artist_id = album.get('artistId')
+        for entry in (self._cache.get('all_albums'), self._albums_cache.get(artist_id)):
+            if entry is not None:
+                entry[0].append(album)
+        if self._album_index is not None:
+            by_mbid, by_name = self._album_index
+            if album.get('releaseGroupId'):
+                by_mbid.setdefault(album['releaseGroupId'], album)
+            if album.get('title'):
+                by_name.setdefault(_index_key(album), album)
+            self._albums_by_artist.setdefault(artist_id, []).append(album)
+    
+    def _invalidate_albums(self):
+        """Drop cached album listings after the library's albums changed."""
+        self._cache.pop('all_albums', None)
+        self._albums_cache.clear()
+        # Stored bodies may hold album dicts the caller has since modified
+        self._conditional.clear()
+        self._album_index = None
+        self._albums_by_artist = None
+    
+    def invalidate(self):
+        """Drop all cached responses so the next calls refetch from Lidarr."""
+        self._cache.clear()
+        self._albums_cache.clear()
+        self._conditional.clear()
+        self._album_index = None
+        self._albums_by_artist = None
+    
     def get_existing_artists(self) -> Dict[str, Dict[str, Any]]:
         """
         Retrieve all artists currently in Lidarr library.
@@ -126,13 +460,14 @@ class LidarrClient:
             Dictionary mapping lowercase artist names to artist data
         """
         url = f"{self.base_url}/api/v1/artist"
-        try:
-            self._wait_for_rate_limit()
-            r = requests.get(url, headers=self._get_headers(), timeout=self.timeout)
-            r.raise_for_status()
-            artists = r.json()
+        
+        def _fetch():
+            artists = self._get_json_conditional(url)
             # Use lowercase names as keys for case-insensitive matching
             return {artist['artistName'].lower(): artist for artist in artists}
+        
+        try:
+            return self._cached('existing_artists', self.cache_ttl, _fetch)
         except Exception as e:
             logger.exception("Failed to get existing artists: %s", e)
             return {}
@@ -152,23 +487,22 @@ class LidarrClient:
         """
         url = f"{self.base_url}/api/v1/artist/lookup"
         
+        # Duplicate rows in a playlist resolve to the same artist
+        cache_key = ('artist_lookup', musicbrainz_id or artist_name.lower())
+        hit, cached = self._cached_lookup(cache_key)
+        if hit:
+            logger.debug(f"Using cached Lidarr artist lookup for {artist_name}")
+            return cached
+        
         # If we have a MusicBrainz ID, use it for more accurate lookup
         if musicbrainz_id:
             logger.info(f"Looking up artist by MusicBrainz ID: {musicbrainz_id}")
             
             def _lookup_by_mbid():
                 self._wait_for_rate_limit()
-                # Try mbid: prefix first (most common format)
-                params = {"term": f"mbid:{musicbrainz_id}"}
-                r = requests.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
-                if r.status_code == 200:
-                    result = r.json()
-                    if result:
-                        return result
-                
-                # If mbid: didn't work, try raw MBID
-                params = {"term": musicbrainz_id}
-                r = requests.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
+                # lidarr: is Lidarr's canonical MBID search term, so one request suffices
+                params = {"term": f"lidarr:{musicbrainz_id}"}
+                r = self._session.get(url, params=params, timeout=self.timeout)
                 r.raise_for_status()
                 return r.json()
             
@@ -176,7 +510,7 @@ class LidarrClient:
                 items = self._retry_request(_lookup_by_mbid)
                 if items:
                     logger.info(f"Lidarr lookup successful using MusicBrainz ID for {artist_name}")
-                    return items[0]
+                    return self._store_lookup(cache_key, items[0])
             except Exception as e:
                 logger.warning(f"Lidarr MBID lookup failed for {artist_name}, falling back to name search: {e}")
         
@@ -186,7 +520,7 @@ class LidarrClient:
         def _lookup_by_name():
             self._wait_for_rate_limit()
             params = {"term": artist_name}
-            r = requests.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.get(url, params=params, timeout=self.timeout)
             r.raise_for_status()
             return r.json()
         
@@ -194,9 +528,9 @@ class LidarrClient:
             items = self._retry_request(_lookup_by_name)
             if not items:
                 logger.warning(f"No Lidarr lookup results for artist: {artist_name}")
-                return None
+                return self._store_lookup(cache_key, None)
             logger.info(f"Lidarr name-based lookup successful for {artist_name}")
-            return items[0]
+            return self._store_lookup(cache_key, items[0])
         except Exception as e:
             logger.exception("Lidarr artist lookup failed for %s: %s", artist_name, e)
             return None
@@ -215,12 +549,17 @@ class LidarrClient:
         url = f"{self.base_url}/api/v1/album/lookup"
         params = {"term": f"{artist_name} {album_title}"}
         
+        cache_key = ('album_lookup', artist_name.lower(), album_title.lower())
+        hit, cached = self._cached_lookup(cache_key)
+        if hit:
+            return cached
+        
         try:
             self._wait_for_rate_limit()
-            r = requests.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.get(url, params=params, timeout=self.timeout)
             r.raise_for_status()
             items = r.json()
-            return items if items else None
+            return self._store_lookup(cache_key, items if items else None)
         except Exception as e:
             logger.exception("Lidarr album lookup failed for %s - %s: %s", artist_name, album_title, e)
             return None
@@ -240,18 +579,22 @@ class LidarrClient:
         url = f"{self.base_url}/api/v1/artist"
         
         # Build payload with configuration
-        payload = artist_data.copy()
-        payload["qualityProfileId"] = self.quality_profile_id
-        payload["metadataProfileId"] = self.metadata_profile_id
-        payload["rootFolderPath"] = self.root_folder_path
-        payload["addOptions"] = {"searchForMissingAlbums": search}
-        payload["monitor"] = monitor
+        payload = {
+            **artist_data,
+            "qualityProfileId": self.quality_profile_id,
+            "metadataProfileId": self.metadata_profile_id,
+            "rootFolderPath": self.root_folder_path,
+            "addOptions": {"searchForMissingAlbums": search},
+            "monitor": monitor,
+        }
         
         try:
             self._wait_for_rate_limit()
-            r = requests.post(url, json=payload, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.post(url, json=payload, timeout=self.timeout)
             r.raise_for_status()
             result = r.json()
+            self._cache.pop('existing_artists', None)
+            self._invalidate_albums()
             logger.info(f"Added artist to Lidarr: {artist_data.get('artistName', 'Unknown')}")
             return result
         except requests.exceptions.HTTPError as e:
@@ -264,12 +607,14 @@ class LidarrClient:
             logger.exception("Failed to add artist: %s", e)
             return None
     
-    def get_artist_albums(self, artist_id: int) -> List[Dict[str, Any]]:
+    def get_artist_albums(self, artist_id: int, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get all albums for a specific artist.
         
         Args:
             artist_id: Lidarr internal artist ID
+            refresh: Skip the short-lived cache and read Lidarr's current state,
+                e.g. to see albums Lidarr monitored on its own after an add
             
         Returns:
             List of album data dictionaries
@@ -277,11 +622,15 @@ class LidarrClient:
         url = f"{self.base_url}/api/v1/album"
         params = {"artistId": artist_id}
         
+        def _fetch():
+            return self._get_json_conditional(url, params)
+        
+        if refresh:
+            # The stored body may carry local patches, so parse the response afresh too
+            self._albums_cache.pop(artist_id, None)
+            self._conditional.pop((url, tuple(params.items())), None)
         try:
-            self._wait_for_rate_limit()
-            r = requests.get(url, params=params, headers=self._get_headers(), timeout=self.timeout)
-            r.raise_for_status()
-            return r.json()
+            return self._cached(artist_id, ARTIST_ALBUMS_CACHE_TTL, _fetch, store=self._albums_cache)
         except Exception as e:
             logger.exception("Failed to get albums for artist ID %s: %s", artist_id, e)
             return []
@@ -295,11 +644,11 @@ class LidarrClient:
         """
         url = f"{self.base_url}/api/v1/album"
         
+        def _fetch():
+            return self._get_json_conditional(url)
+        
         try:
-            self._wait_for_rate_limit()
-            r = requests.get(url, headers=self._get_headers(), timeout=self.timeout)
-            r.raise_for_status()
-            return r.json()
+            return self._cached('all_albums', self.cache_ttl, _fetch)
         except Exception as e:
             logger.exception("Failed to get all albums: %s", e)
             return []
@@ -323,13 +672,45 @@ class LidarrClient:
         
         try:
             self._wait_for_rate_limit()
-            r = requests.put(url, json=album_data, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.put(url, json=album_data, timeout=self.timeout)
             r.raise_for_status()
+            self._patch_cached_albums([album_id], album_data)
             return True
         except Exception as e:
+            # album_data may be a cached dict the caller already modified;
+            # don't serve it back as Lidarr's state
+            self._invalidate_albums()
             logger.exception("Failed to update album ID %s: %s", album_id, e)
             return False
     
+    def set_albums_monitored(self, album_ids: List[int], monitored: bool) -> bool:
+        """
+        Set the monitored flag on many albums with one request.
+        
+        Args:
+            album_ids: Lidarr internal album IDs
+            monitored: Monitoring state to apply
+            
+        Returns:
+            True if successful (or nothing to change), False otherwise
+        """
+        if not album_ids:
+            return True
+        
+        url = f"{self.base_url}/api/v1/album/monitor"
+        payload = {"albumIds": list(album_ids), "monitored": monitored}
+        
+        try:
+            self._wait_for_rate_limit()
+            r = self._session.put(url, json=payload, timeout=self.timeout)
+            r.raise_for_status()
+            self._patch_cached_albums(album_ids, {'monitored': monitored})
+            return True
+        except Exception as e:
+            self._invalidate_albums()
+            logger.exception("Failed to set monitored=%s for album IDs %s: %s", monitored, album_ids, e)
+            return False
+    
     def add_album(self, album_data: Dict[str, Any], monitored: bool = True, search: bool = True) -> Optional[Dict[str, Any]]:
         """
         Add a specific album to Lidarr and optionally monitor it.
@@ -345,17 +726,20 @@ class LidarrClient:
         url = f"{self.base_url}/api/v1/album"
         
         # Configure the album
-        payload = album_data.copy()
-        payload['monitored'] = monitored
-        payload['addOptions'] = {'searchForMissingAlbums': search}
+        payload = {**album_data, 'monitored': monitored, 'addOptions': {'searchForMissingAlbums': search}}
         
         try:
             self._wait_for_rate_limit()
-            r = requests.post(url, json=payload, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.post(url, json=payload, timeout=self.timeout)
             
             if r.status_code in (200, 201):
+                added = r.json()
+                if isinstance(added, dict):
+                    self._add_cached_album(added)
+                else:
+                    self._invalidate_albums()
                 logger.info(f"Added album: {album_data.get('title', 'Unknown')}")
-                return r.json()
+                return added
             elif r.status_code == 400:
                 error_text = r.text
                 if "already exists" in error_text.lower():
@@ -374,6 +758,41 @@ class LidarrClient:
             logger.exception("Failed to add album: %s", e)
             return None
     
+    def search_for_albums(self, album_ids: List[int], chunk: int = 50) -> int:
+        """
+        Trigger automatic searches for many albums with batched commands.
+        
+        Lidarr's AlbumSearch command takes a list of album IDs, so this sends
+        one command per ``chunk`` albums instead of one per album.
+        
+        Args:
+            album_ids: Lidarr internal album IDs
+            chunk: Maximum album IDs per command (default: 50)
+            
+        Returns:
+            Number of albums whose search was triggered
+        """
+        url = f"{self.base_url}/api/v1/command"
+        triggered = 0
+        
+        for start in range(0, len(album_ids), chunk):
+            chunk_ids = list(album_ids[start:start + chunk])
+            payload = {
+                "name": "AlbumSearch",
+                "albumIds": chunk_ids
+            }
+            
+            try:
+                self._wait_for_rate_limit()
+                r = self._session.post(url, json=payload, timeout=self.timeout)
+                r.raise_for_status()
+                triggered += len(chunk_ids)
+                logger.info(f"Started automatic search for album IDs {chunk_ids}")
+            except Exception as e:
+                logger.warning(f"Failed to trigger search for album IDs {chunk_ids}: {e}")
+        
+        return triggered
+    
     def search_for_album(self, album_id: int) -> bool:
         """
         Trigger automatic search for a specific album's files.
@@ -384,21 +803,7 @@ class LidarrClient:
         Returns:
             True if search was triggered, False otherwise
         """
-        url = f"{self.base_url}/api/v1/command"
-        payload = {
-            "name": "AlbumSearch",
-            "albumIds": [album_id]
-        }
-        
-        try:
-            self._wait_for_rate_limit()
-            r = requests.post(url, json=payload, headers=self._get_headers(), timeout=self.timeout)
-            r.raise_for_status()
-            logger.info(f"Started automatic search for album ID {album_id}")
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to trigger search for album ID {album_id}: {e}")
-            return False
+        return self.search_for_albums([album_id]) == 1
     
     def refresh_artist(self, artist_id: int) -> bool:
         """
@@ -420,8 +825,10 @@ class LidarrClient:
         
         try:
             self._wait_for_rate_limit()
-            r = requests.post(url, json=payload, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.post(url, json=payload, timeout=self.timeout)
             r.raise_for_status()
+            # The refresh may add albums; don't serve the old list
+            self._albums_cache.pop(artist_id, None)
             logger.info(f"Triggered metadata refresh for artist ID {artist_id}")
             return True
         except Exception as e:
@@ -440,15 +847,77 @@ class LidarrClient:
         """
         url = f"{self.base_url}/api/v1/artist/{artist_id}"
         
-        try:
+        def _fetch():
             self._wait_for_rate_limit()
-            r = requests.get(url, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.get(url, timeout=self.timeout)
             r.raise_for_status()
             return r.json()
+        
+        try:
+            return self._cached(('artist', artist_id), self.cache_ttl, _fetch)
         except Exception as e:
             logger.exception("Failed to get artist ID %s: %s", artist_id, e)
             return None
     
+    def build_library_index(
+        self,
+        albums: Optional[List[Dict[str, Any]]] = None
+    ) -> LibraryIndex:
+        """
+        Build lookup tables over the whole Lidarr library.
+        
+        Every album is normalized once here, so repeated monitored-checks
+        become dictionary lookups instead of scans of the full library.
+        
+        Args:
+            albums: Album list to index (default: fetched via get_all_albums())
+            
+        Returns:
+            Tuple of (by_mbid, by_name) where by_mbid maps releaseGroupId to
+            album and by_name maps (normalized artist, normalized title) to album
+        """
+        if albums is None:
+            albums = self.get_all_albums()
+        
+        by_mbid: Dict[str, Dict[str, Any]] = {}
+        by_name: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for album in albums:
+            release_group_id = album.get('releaseGroupId')
+            if release_group_id:
+                by_mbid.setdefault(release_group_id, album)
+            
+            # Keep the first album in library order, as the linear scan did
+            by_name.setdefault(_index_key(album), album)
+        
+        logger.debug(f"Built Lidarr library index: {len(by_name)} albums")
+        return by_mbid, by_name
+    
+    def _get_library_index(self) -> LibraryIndex:
+        """Return the cached library index, rebuilding it once it is older than library_index_ttl."""
+        now = time.monotonic()
+        if self._album_index is None or now - self._album_index_time > self.library_index_ttl:
+            albums = self.get_all_albums()
+            self._album_index = self.build_library_index(albums)
+            by_artist: Dict[int, List[Dict[str, Any]]] = {}
+            for album in albums:
+                by_artist.setdefault(album.get('artistId'), []).append(album)
+            self._albums_by_artist = by_artist
+            self._album_index_time = now
+        return self._album_index
+    
+    def _indexed_artist_albums(self, artist_id: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return an artist's albums from a fresh library index without any HTTP call.
+        
+        Returns None when no fresh index exists or the artist is not in it
+        (e.g. added after the index was built); callers then fall back to
+        get_artist_albums().
+        """
+        if (self._albums_by_artist is None
+                or time.monotonic() - self._album_index_time > self.library_index_ttl):
+            return None
+        return self._albums_by_artist.get(artist_id)
+    
     def is_album_already_monitored(
         self, 
         artist_name: str, 
@@ -458,9 +927,9 @@ class LidarrClient:
         """
         Check if a specific album is already monitored in Lidarr library.
         
-        This function searches through all albums in the Lidarr library to find
-        if the specified artist/album combination is already being monitored.
-        Uses fuzzy matching with profanity/suffix filtering to handle title variations.
+        Looks the artist/album combination up in an index of the whole Lidarr
+        library (see build_library_index()). Uses fuzzy matching with
+        profanity/suffix filtering to handle title variations.
         
         Args:
             artist_name: Name of the artist
@@ -471,15 +940,14 @@ class LidarrClient:
             Tuple of (is_monitored_boolean, album_data_if_found)
         """
         try:
-            # Get all albums from Lidarr (this includes all artists)
-            albums = self.get_all_albums()
+            by_mbid, by_name = self._get_library_index()
             
             # Use text_utils to get album variations
-            album_variations = get_album_title_variations(album_title)
+            album_variations = _title_variations(album_title)
             
             # Normalize all variations for comparison
-            album_title_variations_normalized = [normalize_artist_name(v) for v in album_variations]
-            artist_name_normalized = normalize_artist_name(artist_name)
+            album_title_variations_normalized = [_norm(v) for v in album_variations]
+            artist_name_normalized = _norm(artist_name)
             
             # Try to get MusicBrainz data for better matching (if function provided)
             mb_album = None
@@ -493,33 +961,27 @@ class LidarrClient:
                         if mb_release_group_id:
                             break  # Found MB data, stop trying
             
-            for album in albums:
-                # Check if artist name matches (with normalization)
-                lidarr_artist_name = album.get('artist', {}).get('artistName', '')
-                lidarr_artist_normalized = normalize_artist_name(lidarr_artist_name)
-                
-                if lidarr_artist_normalized == artist_name_normalized:
-                    # Check if album title matches (with normalization)
-                    album_normalized = normalize_artist_name(album['title'])
-                    
-                    # First try exact MusicBrainz ID match if available
-                    if mb_release_group_id and album.get('releaseGroupId') == mb_release_group_id:
-                        if album.get('monitored', False):
-                            logger.info(f"Album already monitored (MusicBrainz ID match): {album['title']} by {artist_name}")
-                            return True, album
-                        else:
-                            logger.info(f"Album found but not monitored (MusicBrainz ID match): {album['title']} by {artist_name}")
-                            return False, album
-                    
-                    # Try fuzzy text matching with ALL album variations
-                    for album_variant_normalized in album_title_variations_normalized:
-                        if album_normalized == album_variant_normalized:
-                            if album.get('monitored', False):
-                                logger.info(f"Album already monitored (variant match): {album['title']} by {artist_name}")
-                                return True, album
-                            else:
-                                logger.info(f"Album found but not monitored (variant match): {album['title']} by {artist_name}")
-                                return False, album
+            # First try exact MusicBrainz ID match if available
+            if mb_release_group_id:
+                album = by_mbid.get(mb_release_group_id)
+                if album and _norm(album.get('artist', {}).get('artistName', '')) == artist_name_normalized:
+                    if album.get('monitored', False):
+                        logger.info(f"Album already monitored (MusicBrainz ID match): {album['title']} by {artist_name}")
+                        return True, album
+                    else:
+                        logger.info(f"Album found but not monitored (MusicBrainz ID match): {album['title']} by {artist_name}")
+                        return False, album
+            
+            # Try fuzzy text matching with ALL album variations
+            for album_variant_normalized in album_title_variations_normalized:
+                album = by_name.get((artist_name_normalized, album_variant_normalized))
+                if album is not None:
+                    if album.get('monitored', False):
+                        logger.info(f"Album already monitored (variant match): {album['title']} by {artist_name}")
+                        return True, album
+                    else:
+                        logger.info(f"Album found but not monitored (variant match): {album['title']} by {artist_name}")
+                        return False, album
             
             # Album not found in library
             logger.debug(f"Album not found in Lidarr library: {artist_name} - {album_title}")
@@ -552,8 +1014,11 @@ class LidarrClient:
             True if album was successfully added and monitored, False otherwise
         """
         try:
-            # First check if this album already exists in Lidarr
-            existing_albums = self.get_artist_albums(artist_id)
+            # First check if this album already exists in Lidarr, using the
+            # cached library index when it is fresh
+            existing_albums = self._indexed_artist_albums(artist_id)
+            if existing_albums is None:
+                existing_albums = self.get_artist_albums(artist_id)
             
             # Check if album with this MusicBrainz ID already exists
             for album in existing_albums:
@@ -574,7 +1039,7 @@ class LidarrClient:
             lookup_params = {"term": f"lidarr:{musicbrainz_album_id}"}
             
             self._wait_for_rate_limit()
-            r = requests.get(lookup_url, params=lookup_params, headers=self._get_headers(), timeout=self.timeout)
+            r = self._session.get(lookup_url, params=lookup_params, timeout=self.timeout)
             r.raise_for_status()
             lookup_results = r.json()
             
@@ -603,9 +1068,11 @@ class LidarrClient:
                 
                 # Strategy 1: If album artist ID is None but names are similar
                 if album_artist_id is None and album_artist_name and artist_name:
-                    name_match = (album_artist_name.lower().strip() == artist_name.lower().strip() or
-                                 album_artist_name.lower().replace('.', '').replace('-', '') == 
-                                 artist_name.lower().replace('.', '').replace('-', ''))
+                    album_artist_canon = _canon(album_artist_name)
+                    artist_canon = _canon(artist_name)
+                    name_match = (album_artist_canon.strip() == artist_canon.strip() or
+                                 album_artist_canon.translate(_DOT_DASH_TBL) == 
+                                 artist_canon.translate(_DOT_DASH_TBL))
                     
                     if name_match:
                         logger.info(f"Name match with null ID - fixing artist data: {album_artist_name}")
@@ -686,47 +1153,50 @@ class LidarrClient:
         Returns:
             True if album was successfully found and monitored, False otherwise
         """
-        # Get edition variants from text_utils
-        edition_variants = get_edition_variants()
-        
         try:
             # Get all albums for this artist from Lidarr
             albums = self.get_artist_albums(artist_id)
             
-            album_title_clean = album_title.lower().strip()
+            album_title_clean = _canon(album_title).strip()
             matching_albums = []
             search_normalized = normalize_album_title_for_matching(album_title)
             
             for album in albums:
-                album_title_lidarr = album['title'].lower().strip()
+                lidarr_title = album['title']
+                album_title_lidarr = _canon(lidarr_title).strip()
                 
                 # Priority 1: Exact match
                 if album_title_lidarr == album_title_clean:
                     matching_albums.insert(0, album)
-                    logger.debug(f"  Exact match: '{album['title']}'")
+                    logger.debug(f"  Exact match: '{lidarr_title}'")
                 
-                # Priority 2: Normalized match (handles edition variants)
-                else:
+                # Priority 2: Normalized match (handles edition variants).
+                # Normalizing only strips a suffix, so a match must start with
+                # the search title; skip the normalizer for everything else
+                elif search_normalized and album_title_lidarr.startswith(search_normalized):
                     lidarr_normalized = normalize_album_title_for_matching(album_title_lidarr)
                     
-                    if search_normalized == lidarr_normalized and search_normalized != "":
+                    if search_normalized == lidarr_normalized:
                         len_diff = abs(len(search_normalized) - len(lidarr_normalized))
                         if len_diff <= 2 or len(search_normalized) > 8:
                             matching_albums.append(album)
-                            logger.debug(f"  Normalized match: '{album['title']}' -> '{lidarr_normalized}'")
+                            logger.debug(f"  Normalized match: '{lidarr_title}' -> '{lidarr_normalized}'")
                         else:
-                            logger.debug(f"  Rejected normalized match (length diff {len_diff}): '{album['title']}'")
-            
-            # If we have multiple matches, prefer more recent releases
-            if len(matching_albums) > 1:
-                has_edition_in_search = any(variant.strip('()[]- ') in album_title.lower() for variant in edition_variants)
-                if not has_edition_in_search:
-                    matching_albums.sort(key=lambda x: x.get('releaseDate', '1900-01-01'), reverse=True)
-                    logger.debug(f"  Multiple matches found, preferring newest: '{matching_albums[0]['title']}'")
+                            logger.debug(f"  Rejected normalized match (length diff {len_diff}): '{lidarr_title}'")
             
             # If we found matching albums, check if already monitored
             if matching_albums:
                 album = matching_albums[0]
+                
+                # If we have multiple matches, prefer more recent releases.
+                # Only the winner is used, so pick it with max() instead of
+                # sorting (max keeps the first of equally dated matches)
+                if len(matching_albums) > 1:
+                    has_edition_in_search = any(keyword in album_title_clean for keyword in _EDITION_KEYWORDS)
+                    if not has_edition_in_search:
+                        album = max(matching_albums, key=_release_date)
+                        logger.debug(f"  Multiple matches found, preferring newest: '{album['title']}'")
+                
                 album_title_matched = album['title']
                 
                 # Check if album is already monitored
@@ -773,21 +1243,21 @@ class LidarrClient:
             True if successful, False if there were errors
         """
         try:
-            albums = self.get_artist_albums(artist_id)
-            
-            unmonitored_count = 0
-            for album in albums:
-                if album.get('monitored', False):
-                    album['monitored'] = False
-                    if self.update_album(album):
-                        unmonitored_count += 1
-                        logger.debug(f"Unmonitored album: {album['title']} by {artist_name}")
+            albums = self.get_artist_albums(artist_id, refresh=True)
             
-            if unmonitored_count > 0:
-                logger.info(f"Unmonitored {unmonitored_count} albums for NEWLY ADDED artist {artist_name}")
-            else:
+            to_unmonitor = [album for album in albums if album.get('monitored', False)]
+            if not to_unmonitor:
                 logger.debug(f"No albums needed unmonitoring for newly added artist {artist_name}")
-                
+                return True
+            
+            # One bulk request instead of a PUT per album
+            if not self.set_albums_monitored([album['id'] for album in to_unmonitor], False):
+                return False
+            
+            for album in to_unmonitor:
+                album['monitored'] = False
+                logger.debug(f"Unmonitored album: {album['title']} by {artist_name}")
+            logger.info(f"Unmonitored {len(to_unmonitor)} albums for NEWLY ADDED artist {artist_name}")
             return True
             
         except Exception as e:
@@ -817,45 +1287,61 @@ class LidarrClient:
             True if successful, False if there were errors
         """
         try:
-            albums = self.get_artist_albums(artist_id)
+            albums = self.get_artist_albums(artist_id, refresh=True)
             
-            unmonitored_count = 0
+            extra_albums = []
             kept_monitored_count = 0
             target_found = False
             
             logger.debug(f"Looking for target album with MBID: {target_musicbrainz_id}")
             
+            # Loop-invariant: canonicalize the target title once
+            target_lower = _canon(target_album_title) if target_album_title else ''
+            
             for album in albums:
-                if album.get('monitored', False):
-                    album_mbid = album.get('foreignAlbumId')
-                    album_title = album.get('title', '')
-                    
-                    logger.debug(f"Checking album: '{album_title}' (MBID: {album_mbid})")
-                    
-                    # Check if this is our target album by MusicBrainz ID first
-                    is_target_by_mbid = album_mbid == target_musicbrainz_id
-                    
-                    # Fallback: also check by title similarity (case-insensitive)
-                    is_target_by_title = False
-                    if target_album_title and album_title:
-                        title_lower = album_title.lower()
-                        target_lower = target_album_title.lower()
-                        is_target_by_title = (title_lower == target_lower or 
-                                            target_lower in title_lower or 
-                                            title_lower in target_lower)
-                    
-                    if is_target_by_mbid or (is_target_by_title and not target_found):
-                        # This is our target album - keep it monitored
-                        kept_monitored_count += 1
-                        target_found = True
-                        match_reason = "MBID" if is_target_by_mbid else "title"
-                        logger.debug(f"Keeping monitored: '{album_title}' by {artist_name} (target album, matched by {match_reason})")
+                if not album.get('monitored', False):
+                    continue
+                album_mbid = album.get('foreignAlbumId')
+                album_title = album.get('title') or ''
+                
+                logger.debug(f"Checking album: '{album_title}' (MBID: {album_mbid})")
+                
+                # Check if this is our target album by MusicBrainz ID first
+                is_target_by_mbid = album_mbid == target_musicbrainz_id
+                
+                # Fallback: also check by title similarity (case-insensitive).
+                # Only the first title match is kept, so skip the check once the
+                # target is found; equality is tried before the substring scan,
+                # and only the shorter string can be contained in the longer one.
+                is_target_by_title = False
+                if not is_target_by_mbid and not target_found and target_lower and album_title:
+                    title_lower = _canon(album_title)
+                    if title_lower == target_lower:
+                        is_target_by_title = True
+                    elif len(title_lower) > len(target_lower):
+                        is_target_by_title = target_lower in title_lower
                     else:
-                        # This is NOT our target album - unmonitor it
-                        album['monitored'] = False
-                        if self.update_album(album):
-                            unmonitored_count += 1
-                            logger.debug(f"Unmonitored extra album: '{album_title}' by {artist_name} (MBID: {album_mbid})")
+                        is_target_by_title = title_lower in target_lower
+                
+                if is_target_by_mbid or (is_target_by_title and not target_found):
+                    # This is our target album - keep it monitored
+                    kept_monitored_count += 1
+                    target_found = True
+                    match_reason = "MBID" if is_target_by_mbid else "title"
+                    logger.debug(f"Keeping monitored: '{album_title}' by {artist_name} (target album, matched by {match_reason})")
+                else:
+                    # This is NOT our target album - unmonitor it below
+                    extra_albums.append(album)
+            
+            # Unmonitor all extra albums with one bulk request
+            unmonitored_count = 0
+            if extra_albums:
+                if not self.set_albums_monitored([album['id'] for album in extra_albums], False):
+                    return False
+                for album in extra_albums:
+                    album['monitored'] = False
+                    logger.debug(f"Unmonitored extra album: '{album.get('title', '')}' by {artist_name} (MBID: {album.get('foreignAlbumId')})")
+                unmonitored_count = len(extra_albums)
             
             if not target_found:
                 logger.warning(f"Target album '{target_album_title}' (MBID: {target_musicbrainz_id}) was not found among monitored albums for {artist_name}")
@@ -871,6 +1357,10 @@ class LidarrClient:
             logger.error(f"✗ Error in final cleanup for {artist_name} (ID {artist_id}): %s", e)
             return False
     
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
     def __repr__(self) -> str:
         """String representation of the client."""
         return f"LidarrClient(url={self.base_url}, quality_profile={self.quality_profile_id})"
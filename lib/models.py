@@ -1,8 +1,15 @@
-from dataclasses import dataclass
-from typing import Optional
+import sys
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 
 
-@dataclass
+# A parse creates one AlbumEntry per input row; slot them where supported
+# (dataclass(slots=True) needs Python 3.10+, older versions keep __dict__)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class AlbumEntry:
     artist: str
     album: str
@@ -19,13 +26,77 @@ class AlbumEntry:
     spotify_album_url: str = ""
     release_date: str = ""
     total_tracks: Optional[int] = None
-    track_titles: str = ""  # semicolon-separated
-    track_isrcs: str = ""  # semicolon-separated
+    # Track lists stay parsed; they are ';'-joined only when written to CSV
+    track_titles: Tuple[str, ...] = ()
+    track_isrcs: Tuple[str, ...] = ()
+    # ((artist, album), identity key) the key was last computed from
+    _key_cache: Tuple[Tuple[str, str], Tuple[str, str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._key_cache = ((self.artist, self.album), self._make_key())
+
+    def _make_key(self) -> Tuple[str, str]:
+        # NFKC + case-folded identity, so precomposed vs decomposed
+        # spellings ("Beyoncé") dedup together
+        return (
+            unicodedata.normalize('NFKC', self.artist).casefold(),
+            unicodedata.normalize('NFKC', self.album).casefold(),
+        )
+
+    @property
+    def _key(self) -> Tuple[str, str]:
+        # Reuse the cached key while artist/album are unchanged, so hashing
+        # and equality in dedup sets/dicts allocate no new strings
+        source, key = self._key_cache
+        if source[0] is not self.artist or source[1] is not self.album:
+            key = self._make_key()
+            self._key_cache = ((self.artist, self.album), key)
+        return key
 
     def __hash__(self):
-        return hash((self.artist.lower(), self.album.lower()))
+        return hash(self._key)
 
     def __eq__(self, other):
         if not isinstance(other, AlbumEntry):
             return NotImplemented
-        return (self.artist.lower(), self.album.lower()) == (other.artist.lower(), other.album.lower())
+        return self._key == other._key
+
+
+@dataclass
+class CSVItem:
+    """One artist/album row returned by `CSVHandler.read_items`.
+
+    Uses `__slots__` to keep large item lists compact. Dict-style access
+    (`item['status']`, `item.get('mb_release_id', '')`) is kept so callers
+    written against the old dict rows keep working; use `to_dict()` when a
+    real dict is needed.
+    """
+    __slots__ = ('artist', 'album', 'status', 'mb_artist_id', 'mb_release_id', 'row_num')
+
+    artist: str
+    album: str
+    status: str
+    mb_artist_id: str
+    mb_release_id: str
+    row_num: int
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
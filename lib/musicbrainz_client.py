@@ -4,7 +4,7 @@ MusicBrainz API Client
 Provides a clean interface to the MusicBrainz Web Service API v2 with:
 - Rate limiting (respects 1 req/sec minimum)
 - Retry logic for transient failures
-- XML response parsing
+- JSON response parsing
 - User agent management (required by MB TOS)
 
 MusicBrainz Terms of Service:
@@ -13,23 +13,126 @@ MusicBrainz Terms of Service:
 - https://musicbrainz.org/doc/MusicBrainz_API/Rate_Limiting
 """
 
+import functools
+import json
 import time
 import logging
 import re
-import xml.etree.ElementTree as ET
-from typing import Optional, Dict, Any, List, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, Tuple
 import requests
-from rapidfuzz import fuzz
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rapidfuzz import fuzz, process
+
+try:
+    import orjson
+except ImportError:  # Optional: faster decoding of search responses
+    orjson = None
+from lib.response_cache import DEFAULT_TTL, ResponseCache
 from lib.text_utils import normalize_artist_name, normalize_album_title_for_matching, strip_album_suffixes
 
 logger = logging.getLogger(__name__)
 
+# Memoized normalizer: the searched artist and the same credit phrases are
+# normalized for every candidate of every query while matching an import
+# (normalize_album_title_for_matching is memoized in text_utils)
+_norm = functools.lru_cache(maxsize=16384)(normalize_artist_name)
+
+# Artist-search similarity thresholds: candidates below MIN are only used
+# when nothing reaches it, and candidates below RELAXED are never used.
+# Scoring with score_cutoff=RELAXED lets rapidfuzz stop early on losers.
+MIN_ARTIST_SIMILARITY = 70
+RELAXED_ARTIST_SIMILARITY = 60
+
+# Responses that mean "slow down / try again later"; retried with backoff
+RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+# Upper bound for a single retry wait, whatever Retry-After asks for
+MAX_RETRY_WAIT = 60.0
+# Transport-level retries for connections that could not be established
+CONNECT_RETRIES = 2
+
+# Leading word dropped by _generate_title_variations ("ep seeds" -> "seeds")
+_TITLE_PREFIX_RE = re.compile(r'^\s*(ep|single|the|a)\s', re.IGNORECASE)
+# Volume indicator in a title ("Vol. 5", "Volume 5", "vol #5"); group 1 is the number
+_VOL_RE = re.compile(r"\bvol(?:\.|ume)?\s*#?:?\s*(\d+)\b", re.IGNORECASE)
+
+
+def _ext_score(candidate: Dict[str, Any]) -> int:
+    """MusicBrainz relevance score ('ext:score') of a candidate as an int sort key."""
+    try:
+        return int(candidate.get('ext:score') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _decode_body(content: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a MusicBrainz JSON response body (with orjson when installed)."""
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except ValueError as e:
+        logger.debug(f"MusicBrainz JSON parse error: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_variations(title: str) -> Tuple[str, ...]:
+    """
+    Memoized worker for MusicBrainzClient._generate_title_variations().
+
+    The same titles come back on retries and across albums of a library, so
+    the variations are computed once per title and returned as a tuple.
+    """
+    # Insertion-ordered dict as an ordered set: O(1) duplicate checks
+    variations: Dict[str, None] = {title: None}  # Always try original first
+    title_lower = title.lower().strip()
+
+    # Remove a common prefix (ep, the, a, single); at most one can match
+    prefix_m = _TITLE_PREFIX_RE.match(title)
+    if prefix_m:
+        stripped = title[prefix_m.end():].strip()
+        if stripped and stripped not in variations:
+            variations[stripped] = None
+            logger.debug(f"      Title variation: '{title}' → '{stripped}' (removed '{prefix_m.group(1)}')")
+
+    # Try Title Case if original is lowercase
+    if title_lower == title:
+        title_case = title.title()
+        if title_case not in variations:
+            variations[title_case] = None
+            logger.debug(f"      Title variation: '{title}' → '{title_case}' (title case)")
+
+    # Try all caps if it's a short title (likely an acronym)
+    if len(title) <= 6 and not title.isupper():
+        upper_title = title.upper()
+        if upper_title not in variations:
+            variations[upper_title] = None
+            logger.debug(f"      Title variation: '{title}' → '{upper_title}' (uppercase)")
+
+    # Additional helpful variations: replace ampersand with 'and', remove commas/periods
+    amp = title.replace('&', 'and')
+    if amp not in variations:
+        variations[amp] = None
+        logger.debug(f"      Title variation: '{title}' → '{amp}' (ampersand→and)")
+
+    no_punct = ''.join(ch for ch in title if ch.isalnum() or ch.isspace())
+    no_punct = ' '.join(no_punct.split())
+    if no_punct and no_punct not in variations:
+        variations[no_punct] = None
+        logger.debug(f"      Title variation: '{title}' → '{no_punct}' (removed punctuation)")
+
+    return tuple(variations)
+
 
 class MusicBrainzClient:
     """
     Client for MusicBrainz Web Service API v2.
     
-    This client handles rate limiting, request formatting, and XML response
+    This client handles rate limiting, request formatting, and JSON response
     parsing for MusicBrainz API interactions. It's designed to be a drop-in
     replacement for python-musicbrainzngs with improved control.
     
@@ -37,21 +140,61 @@ class MusicBrainzClient:
         delay: Minimum seconds between requests (default: 2.0, min: 1.0)
         user_agent: User agent dict with app_name, version, contact
         timeout: Request timeout in seconds
+        cache_path: Optional SQLite file for persisting responses between runs
+        cache_ttl: Seconds a persisted response is reused (default: one week)
+        max_retries: Retries for 429/503/504 responses before giving up
+        max_workers: Threads used by batch_search_release_groups()
+        session: Optional requests.Session to share a connection pool with
+            other clients; it is used as given (no adapter is mounted) and
+            is left open by close(). Rate limiting stays per client.
     """
     
     def __init__(
         self,
         delay: float = 2.0,
         user_agent: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache_path: Optional[str] = None,
+        cache_ttl: float = DEFAULT_TTL,
+        max_retries: int = 3,
+        max_workers: int = 4,
+        session: Optional[requests.Session] = None
     ):
         self.base_url = "https://musicbrainz.org/ws/2"
         self.min_delay = max(delay, 1.0)  # Enforce 1sec minimum per MB TOS
         self.timeout = timeout
-        self.last_request_time = 0.0
+        self.max_retries = max_retries
+        # Monotonic time before which the next request may not start; callers
+        # reserve slots under the lock so concurrent threads stay min_delay apart
+        self._next_slot = 0.0
+        self._rate_lock = threading.Lock()
         
-        # Setup session with proper user agent
-        self.session = requests.Session()
+        # Cached responses are served without a request, so they skip the
+        # rate limiter entirely
+        self.cache = ResponseCache(cache_path, ttl=cache_ttl) if cache_path else None
+        
+        # Worker threads for batch searches; requests still go out one slot
+        # at a time through _wait_for_rate_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="musicbrainz")
+        
+        # Setup session with proper user agent. All traffic goes to one host;
+        # size the keep-alive pool so concurrent callers each reuse an open
+        # connection instead of opening (and TLS-handshaking) a new one.
+        # Failed connection attempts are retried in the transport (nothing was
+        # sent yet); throttling statuses stay with _make_request, which has to
+        # keep the shared rate-limit schedule in step with the backoff
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, status=0,
+                                  backoff_factor=0.5, respect_retry_after_header=False),
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
         if user_agent is None:
             user_agent = {
                 'app_name': 'lidarr-album-import-script',
@@ -65,63 +208,73 @@ class MusicBrainzClient:
             f"( {user_agent['contact']} )"
         )
         
-        # Keep Accept header as XML by default to match expected test behavior
-        # and MusicBrainz defaults; we still attempt to decode JSON responses
-        # in _make_request when present.
+        # Ask for JSON: it is smaller than the XML representation and cheaper
+        # to decode
         self.session.headers.update({
             'User-Agent': user_agent_string,
-            'Accept': 'application/xml'
+            'Accept': 'application/json'
         })
         
         logger.debug(f"MusicBrainz client initialized with user agent: {user_agent_string}")
     
     def _wait_for_rate_limit(self):
-        """Ensure we don't exceed rate limits (1 req/sec minimum)."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """
+        Ensure we don't exceed rate limits (1 req/sec minimum).
         
-        if time_since_last < self.min_delay:
-            wait_time = self.min_delay - time_since_last
+        The next free slot is reserved under a lock and the wait happens
+        outside it, so concurrent callers are spaced ``min_delay`` apart
+        without holding the lock while sleeping.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait_time = max(0.0, self._next_slot - now)
+            self._next_slot = now + wait_time + self.min_delay
+        
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
             time.sleep(wait_time)
+
+    def _defer_next_request(self, wait: float):
+        """Push the next request slot at least ``wait`` seconds into the future.
         
-        self.last_request_time = time.time()
+        Used when MusicBrainz asks us to back off: the server-side limit is
+        shared, so every caller of this client waits, not just the retrying one.
+        """
+        with self._rate_lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + wait)
 
-    def _extract_artists_from_root(self, root: Union[dict, ET.Element], search_term: str) -> List[Dict[str, Any]]:
-        """Normalize artist candidates from either JSON dict or XML Element tree.
+    def _retry_wait(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retry ``attempt``: Retry-After if sent, else exponential."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_RETRY_WAIT)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        return min(self.min_delay * 2 ** attempt, MAX_RETRY_WAIT)
+
+    def _extract_artists_from_root(self, root: Dict[str, Any], search_term: str) -> List[Dict[str, Any]]:
+        """Normalize artist candidates from a JSON search response.
 
         Returns a list of dicts with keys: id, name, ext:score, similarity
         """
         artists: List[Dict[str, Any]] = []
-        if isinstance(root, dict):
-            raw = root.get('artists') or root.get('artist-list') or []
-            for a in raw:
-                aid = a.get('id', '')
-                name = a.get('name', '')
-                score = a.get('score') or a.get('ext:score') or '100'
-                try:
-                    similarity = fuzz.ratio(search_term, (name or '').lower())
-                except Exception:
-                    similarity = 0
-                artists.append({'id': aid, 'name': name, 'ext:score': str(score), 'similarity': similarity})
-        else:
-            ns = {'mb': 'http://musicbrainz.org/ns/mmd-2.0#'}
-            elems = root.findall('.//mb:artist', ns)
-            for elem in elems:
-                aid = elem.get('id', '')
-                name_elem = elem.find('./mb:name', ns)
-                name = name_elem.text if name_elem is not None else ''
-                score = elem.get('ext:score', '100')
-                try:
-                    similarity = fuzz.ratio(search_term, (name or '').lower())
-                except Exception:
-                    similarity = 0
-                artists.append({'id': aid, 'name': name, 'ext:score': str(score), 'similarity': similarity})
+        raw = root.get('artists') or root.get('artist-list') or []
+        for a in raw:
+            score = a.get('score') or a.get('ext:score') or '100'
+            artists.append({'id': a.get('id', ''), 'name': a.get('name', ''), 'ext:score': str(score), 'similarity': 0})
+
+        # Score every candidate name in one rapidfuzz call; names below the
+        # relaxed cutoff are not returned and keep similarity 0.
+        names = [(a['name'] or '').lower() for a in artists]
+        for _, similarity, idx in process.extract(search_term, names, scorer=fuzz.ratio, processor=None,
+                                                  score_cutoff=RELAXED_ARTIST_SIMILARITY, limit=None):
+            artists[idx]['similarity'] = similarity
         return artists
 
     def _extract_release_groups_from_json(self, root: dict) -> List[Dict[str, Any]]:
         """Normalize release-group candidates from a JSON response into the
-        same dict shape used by the XML parser path and later selection logic.
+        dict shape used by the selection logic in search_release_groups.
         """
         rgs: List[Dict[str, Any]] = []
         raw = root.get('release-groups') or root.get('release-group-list') or root.get('release-groups-list') or root.get('release-group') or []
@@ -195,51 +348,92 @@ class MusicBrainzClient:
             })
         return rgs
     
-    def _make_request(self, endpoint: str, params: Dict[str, str]) -> Optional[ET.Element]:
+    def _make_request(self, endpoint: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """
         Make a request to MusicBrainz API with rate limiting.
         
+        429/503/504 responses are retried up to ``max_retries`` times,
+        honouring Retry-After and otherwise backing off exponentially.
+        Every request asks for JSON (``fmt=json``).
+        
         Args:
             endpoint: API endpoint (e.g., 'artist', 'release-group')
             params: Query parameters
             
         Returns:
-            Parsed XML Element tree, or None if request failed
+            Decoded JSON dict, or None if request failed
         """
-        self._wait_for_rate_limit()
-
+        params = {**params, 'fmt': 'json'}
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(endpoint, params)
+            body = self.cache.get(cache_key)
+            if body is not None:
+                logger.debug(f"MusicBrainz cache hit: {cache_key}")
+                return _decode_body(body)
+        
         url = f"{self.base_url}/{endpoint}"
 
-        try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
 
-            if response.status_code == 200:
-                # Prefer JSON where the caller requests it; attempt to decode JSON
-                try:
-                    return response.json()
-                except Exception:
-                    # Fallback to XML parsing for compatibility
-                    try:
-                        return ET.fromstring(response.content)
-                    except ET.ParseError as e:
-                        logger.debug(f"MusicBrainz XML parse error: {e}")
-                        return None
-            elif response.status_code == 503:
-                logger.debug(f"MusicBrainz rate limited (503), retrying...")
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except requests.exceptions.Timeout:
+                logger.debug(f"MusicBrainz request timeout after {self.timeout}s")
                 return None
+            except requests.exceptions.RequestException as e:
+                logger.debug(f"MusicBrainz request failed: {e}")
+                return None
+
+            if response.status_code == 200:
+                root = _decode_body(response.content)
+                if root is not None and cache_key is not None:
+                    self.cache.set(cache_key, response.content)
+                return root
+            elif response.status_code in RETRYABLE_STATUS_CODES:
+                if attempt == self.max_retries:
+                    logger.debug(f"MusicBrainz rate limited ({response.status_code}), giving up after {attempt} retries")
+                    return None
+                wait = self._retry_wait(response, attempt)
+                logger.debug(f"MusicBrainz rate limited ({response.status_code}), retrying in {wait:.1f}s")
+                self._defer_next_request(wait)
             else:
                 logger.debug(
                     f"MusicBrainz error {response.status_code}: {response.text[:200]}"
                 )
                 return None
-
-        except requests.exceptions.Timeout:
-            logger.debug(f"MusicBrainz request timeout after {self.timeout}s")
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"MusicBrainz request failed: {e}")
-            return None
+        return None
     
+    @staticmethod
+    def _merge_into_collected(
+        collected: Dict[str, Dict[str, Any]],
+        artists: List[Dict[str, Any]],
+        is_quoted: bool,
+    ):
+        """
+        Merge extracted artist candidates into ``collected`` (keyed by MB id),
+        keeping the best similarity and ext:score seen for each artist.
+        """
+        for a in artists:
+            aid = str(a.get('id') or '')
+            score = a.get('ext:score')
+            similarity = a.get('similarity', 0)
+            existing = collected.get(aid)
+            if existing is None:
+                collected[aid] = {
+                    'id': aid,
+                    'name': a.get('name'),
+                    'ext:score': score,
+                    'similarity': similarity,
+                    'is_quoted': is_quoted,
+                }
+                continue
+            existing['similarity'] = max(existing.get('similarity', 0), similarity)
+            existing['is_quoted'] = existing.get('is_quoted', False) or is_quoted
+            if _ext_score(a) > _ext_score(existing):
+                existing['ext:score'] = score
+
     def search_artists(self, artist: str, limit: int = 5) -> Dict[str, Any]:
         """
         Search for an artist by name.
@@ -263,35 +457,14 @@ class MusicBrainzClient:
 
         # First: quoted, precise query
         q = f'artist:"{search_artist}"'
-        params = {'query': q, 'limit': str(limit), 'fmt': 'json'}
+        params = {'query': q, 'limit': str(limit)}
         root = self._make_request('artist', params)
         if root is None:
             quoted_failed = True
             artists = []
         else:
             artists = self._extract_artists_from_root(root, search_term)
-
-        for a in artists:
-            aid = str(a.get('id') or '')
-            name = a.get('name')
-            score = a.get('ext:score')
-            similarity = a.get('similarity', 0)
-            if aid in collected:
-                existing = collected[aid]
-                existing['similarity'] = max(existing.get('similarity', 0), similarity)
-                existing['is_quoted'] = existing.get('is_quoted', False) or True
-                try:
-                    existing['ext:score'] = str(max(int(existing.get('ext:score', '0') or 0), int(score or 0)))
-                except Exception:
-                    existing['ext:score'] = score
-            else:
-                collected[aid] = {
-                    'id': aid,
-                    'name': name,
-                    'ext:score': score,
-                    'similarity': similarity,
-                    'is_quoted': True,
-                }
+        self._merge_into_collected(collected, artists, is_quoted=True)
 
         # Note: we intentionally avoid issuing a second, looser query by
         # default. If the quoted query failed or returned no results, the
@@ -307,65 +480,39 @@ class MusicBrainzClient:
         has_quoted = any(a.get('is_quoted') for a in collected.values())
         if not has_quoted and quoted_failed:
             q = f'artist:"{search_artist}"'
-            params = {'query': q, 'limit': str(limit), 'fmt': 'json'}
+            params = {'query': q, 'limit': str(limit)}
             root = self._make_request('artist', params)
             if root is not None:
-                if isinstance(root, dict):
-                    artists = root.get('artists') or root.get('artist-list') or []
-                else:
-                    ns = {'mb': 'http://musicbrainz.org/ns/mmd-2.0#'}
-                    artists = root.findall('.//mb:artist', ns)
-
-                for artist_elem in artists:
-                    if isinstance(root, dict):
-                        aid = artist_elem.get('id', '')
-                        name = artist_elem.get('name', '')
-                        score = artist_elem.get('score') or artist_elem.get('ext:score') or '100'
-                    else:
-                        aid = artist_elem.get('id', '')
-                        name_elem = artist_elem.find('./mb:name', {'mb': 'http://musicbrainz.org/ns/mmd-2.0#'})
-                        name = name_elem.text if name_elem is not None else ''
-                        score = artist_elem.get('ext:score', '100')
-                    try:
-                        similarity = fuzz.ratio(search_term, (name or '').lower())
-                    except Exception:
-                        similarity = 0
-
-                    if aid in collected:
-                        existing = collected[aid]
-                        existing['similarity'] = max(existing.get('similarity', 0), similarity)
-                        existing['is_quoted'] = True
-                        try:
-                            existing['ext:score'] = str(max(int(existing.get('ext:score', '0') or 0), int(score or 0)))
-                        except Exception:
-                            existing['ext:score'] = score
-                    else:
-                        collected[aid] = {
-                            'id': aid,
-                            'name': name,
-                            'ext:score': score,
-                            'similarity': similarity,
-                            'is_quoted': True,
-                        }
+                self._merge_into_collected(
+                    collected, self._extract_artists_from_root(root, search_term), is_quoted=True
+                )
 
         artist_list: List[Dict[str, Any]] = list(collected.values())
 
-        # Debug: show raw candidates
+        # Normalize each candidate name once (keyed by MB id, unique in
+        # `collected`); reused by the debug listing and the sort key below
+        norm_names: Dict[str, str] = {}
         logger.debug(f"Raw artist candidates for '{search_artist}':")
         for a in artist_list:
             n = (a.get('name') or '')
             try:
-                n_norm = normalize_artist_name(n)
+                n_norm = _norm(n)
             except Exception:
                 n_norm = n.lower()
+            norm_names[a['id']] = n_norm
             logger.debug(f"  - id={a.get('id')} name='{a.get('name')}' norm='{n_norm}' sim={a.get('similarity')} score={a.get('ext:score')}")
 
         # Filter results to only include reasonably similar matches.
-        MIN_SIMILARITY = 70
-        filtered_list = [a for a in artist_list if a['similarity'] >= MIN_SIMILARITY]
-        if not filtered_list and artist_list:
-            RELAXED_SIM = 60
-            filtered_list = [a for a in artist_list if a['similarity'] >= RELAXED_SIM]
+        # Split strict and relaxed matches in one pass; candidates under the
+        # relaxed cutoff were already scored 0 by rapidfuzz.
+        strict_list = []
+        relaxed_list = []
+        for a in artist_list:
+            if a['similarity'] >= MIN_ARTIST_SIMILARITY:
+                strict_list.append(a)
+            elif a['similarity'] >= RELAXED_ARTIST_SIMILARITY:
+                relaxed_list.append(a)
+        filtered_list = strict_list or relaxed_list
 
         # Prefer results that preserve leading qualifiers when the search term has one
         search_tokens = (search_artist or '').lower().split()
@@ -373,16 +520,12 @@ class MusicBrainzClient:
         search_prefix = search_tokens[0] if search_tokens and search_tokens[0] in prefix_candidates else None
 
         def _sort_key(x: Dict[str, Any]):
-            name_val = x.get('name') or ''
-            try:
-                norm_name = normalize_artist_name(name_val)
-            except Exception:
-                norm_name = name_val.lower()
+            norm_name = norm_names[x['id']]
             has_prefix = 1 if (search_prefix and norm_name.startswith(search_prefix)) else 0
             prefix_boost = 1000 if has_prefix else 0
             quoted_boost = 2000 if x.get('is_quoted') else 0
             # quoted_boost is highest priority, then prefix_boost, then similarity, then ext score
-            return (quoted_boost + prefix_boost + int(x.get('similarity') or 0), int(x.get('ext:score') or 0))
+            return (quoted_boost + prefix_boost + int(x.get('similarity') or 0), _ext_score(x))
 
         filtered_list.sort(key=_sort_key, reverse=True)
 
@@ -427,13 +570,23 @@ class MusicBrainzClient:
         if artist_aliases is None:
             artist_aliases = {}
         
-        # Generate title variations to try
-        title_variations = self._generate_title_variations(releasegroup)
+        # Generate title variations to try. MusicBrainz search is
+        # case-insensitive, so keep only the first of any variations that
+        # normalize to the same text (e.g. "ep seeds" / "Ep Seeds", or
+        # differing only in Unicode form or surrounding whitespace); each
+        # would otherwise repeat the same rate-limited queries
+        by_norm: Dict[str, str] = {}
+        for variation in self._generate_title_variations(releasegroup):
+            by_norm.setdefault(normalize_album_title_for_matching(variation), variation)
+        title_variations = list(by_norm.values())
         logger.debug(f"Generated {len(title_variations)} title variations to try: {title_variations}")
         
         # If we have a MusicBrainz artist MBID, prefer queries using arid: to
         # constrain by the canonical MB artist id — this avoids artist-name
-        # mismatches (case/punctuation/alias differences).
+        # mismatches (case/punctuation/alias differences). arid: already pins
+        # the artist, so its results skip the client-side artist-name filter;
+        # a credit spelled differently would otherwise be discarded and send
+        # us on to more (rate-limited) title variations.
         use_arid = bool(artist_mbid)
 
         # Try each title variation
@@ -443,10 +596,10 @@ class MusicBrainzClient:
             # Build progressive query strategies for this title variant
             if use_arid:
                 # Prefer arid:<mbid> queries which are much more reliable
-                queries = [
-                    f'arid:{artist_mbid} AND releasegroup:"{title_variant}"',
-                    f'arid:{artist_mbid} AND releasegroup:{title_variant}',
-                ]
+                queries = [f'arid:{artist_mbid} AND releasegroup:"{title_variant}"']
+                if not title_variant.isalnum():
+                    # Unquoted only differs from quoted for multi-word/punctuated titles
+                    queries.append(f'arid:{artist_mbid} AND releasegroup:{title_variant}')
             else:
                 queries = self._build_release_group_queries(artist, title_variant)
 
@@ -457,43 +610,27 @@ class MusicBrainzClient:
                     'query': query,
                     'limit': str(limit),
                     # request URL relations and release info (for dates/track-count)
-                    'inc': 'url-rels+releases'
+                    'inc': 'url-rels+releases',
                 }
                 
                 root = self._make_request('release-group', params)
                 if root is None:
                     continue
                 
-                # Parse XML or JSON response
+                # Normalize the JSON response into rg dicts
                 rg_list = []
-                if isinstance(root, dict):
-                    # Normalize JSON response into the same rg dict shape used by the XML parser
-                    rgs = self._extract_release_groups_from_json(root)
-                    logger.debug(f"Got {len(rgs)} raw results from MusicBrainz (json)")
-                    # Filter by artist relevance
+                rgs = self._extract_release_groups_from_json(root)
+                logger.debug(f"Got {len(rgs)} raw results from MusicBrainz")
+                # Filter by artist relevance
+                if use_arid:
+                    rg_list = rgs
+                else:
                     for rg_data in rgs:
                         if self._is_artist_match(rg_data['artist-credit-phrase'], artist, artist_aliases):
                             rg_list.append(rg_data)
                             logger.debug(f"Kept: '{rg_data['title']}' by '{rg_data['artist-credit-phrase']}' (score: {rg_data.get('ext:score')})")
                         else:
                             logger.debug(f"Filtered: '{rg_data['title']}' by '{rg_data['artist-credit-phrase']}' (not a match for '{artist}')")
-                else:
-                    ns = {
-                        'mb': 'http://musicbrainz.org/ns/mmd-2.0#',
-                        'ns2': 'http://musicbrainz.org/ns/ext#-2.0'
-                    }
-                    release_groups = root.findall('.//mb:release-group', ns)
-
-                    if not release_groups:
-                        logger.debug(f"No results from MusicBrainz")
-                        continue
-
-                    logger.debug(f"Got {len(release_groups)} raw results from MusicBrainz")
-
-                    # Parse and filter results (XML path)
-                    rg_list = self._parse_release_groups(
-                        release_groups, ns, artist, artist_aliases
-                    )
                 
                 if rg_list:
                     logger.debug(f"Found {len(rg_list)} matching albums with title '{title_variant}' (query {query_idx})")
@@ -523,29 +660,35 @@ class MusicBrainzClient:
                             if fr and fr.startswith(req_year):
                                 year_match.append(rg)
                         if year_match:
-                            year_match.sort(key=lambda r: int(r.get('ext:score') or 0), reverse=True)
+                            year_match.sort(key=_ext_score, reverse=True)
                             logger.debug(f"Selecting {len(year_match)} candidate(s) by release year {req_year}")
                             return {"release-group-list": year_match}
 
                     # 3) Prefer exact title matches (case-insensitive)
-                    exact_matches = [rg for rg in rg_list if (rg.get('title') or '').strip().lower() == title_variant.strip().lower()]
+                    # (identical titles short-circuit before lowercasing)
+                    wanted_title = title_variant.strip().lower()
+                    exact_matches = [
+                        rg for rg in rg_list
+                        if rg.get('title') == title_variant
+                        or (rg.get('title') or '').strip().lower() == wanted_title
+                    ]
                     if exact_matches:
-                        exact_matches.sort(key=lambda r: int(r.get('ext:score') or 0), reverse=True)
+                        exact_matches.sort(key=_ext_score, reverse=True)
                         return {"release-group-list": exact_matches}
 
                     # If the requested title includes a volume indicator like 'Vol. 5',
                     # prefer candidates that include the same volume number.
-                    vol_re = re.search(r"\bvol(?:\.|ume)?\s*#?:?\s*(\d+)\b", title_variant, flags=re.IGNORECASE)
+                    vol_re = _VOL_RE.search(title_variant)
                     if vol_re:
                         wanted_vol = vol_re.group(1)
                         vol_matches = []
                         for rg in rg_list:
                             cand_title = (rg.get('title') or '')
-                            cand_vol_m = re.search(r"\bvol(?:\.|ume)?\s*#?:?\s*(\d+)\b", cand_title, flags=re.IGNORECASE)
+                            cand_vol_m = _VOL_RE.search(cand_title)
                             if cand_vol_m and cand_vol_m.group(1) == wanted_vol:
                                 vol_matches.append(rg)
                         if vol_matches:
-                            vol_matches.sort(key=lambda r: int(r.get('ext:score') or 0), reverse=True)
+                            vol_matches.sort(key=_ext_score, reverse=True)
                             logger.debug(f"Selecting {len(vol_matches)} candidate(s) matching requested volume {wanted_vol}")
                             return {"release-group-list": vol_matches}
                         else:
@@ -557,14 +700,21 @@ class MusicBrainzClient:
                             return {"release-group-list": []}
 
                     # No exact or same-volume matches; prefer releases whose titles
-                    # are most similar to the requested title (client-side title similarity)
-                    scored = []
-                    for rg in rg_list:
-                        cand_title = (rg.get('title') or '')
-                        sim = fuzz.token_set_ratio(normalize_album_title_for_matching(title_variant), normalize_album_title_for_matching(cand_title))
-                        scored.append((sim, int(rg.get('ext:score') or 0), rg))
+                    # are most similar to the requested title (client-side title similarity).
+                    # All candidates are scored in one process.extract call, which
+                    # runs the scorer loop in C; results come back as (choice, sim, index)
+                    sims = [0.0] * len(rg_list)
+                    for _, sim, idx in process.extract(
+                        normalize_album_title_for_matching(title_variant),
+                        [normalize_album_title_for_matching(rg.get('title') or '') for rg in rg_list],
+                        scorer=fuzz.token_set_ratio,
+                        processor=None,
+                        limit=None,
+                    ):
+                        sims[idx] = sim
+                    scored = [(sim, _ext_score(rg), rg) for sim, rg in zip(sims, rg_list)]
                     # sort by similarity then MB score
-                    scored.sort(key=lambda t: (t[0], t[1]), reverse=True)
+                    scored.sort(key=itemgetter(0, 1), reverse=True)
                     sorted_rgs = [t[2] for t in scored]
                     return {"release-group-list": sorted_rgs}
                 else:
@@ -576,44 +726,50 @@ class MusicBrainzClient:
         # and lets us inspect artist-credit phrases to find a match.
         for title_variant in title_variations:
             logger.debug(f"Fallback: trying releasegroup-only search for '{title_variant}'")
-            params = {'query': f'releasegroup:"{title_variant}"', 'limit': str(limit), 'fmt': 'json'}
+            params = {'query': f'releasegroup:"{title_variant}"', 'limit': str(limit)}
             root = self._make_request('release-group', params)
             if root is None:
                 continue
-            # Support JSON or XML fallback parsing
-            if isinstance(root, dict):
-                rgs = self._extract_release_groups_from_json(root)
-                if not rgs:
-                    logger.debug("Fallback search returned no results (json)")
-                    continue
-                logger.debug(f"Fallback search got {len(rgs)} raw results from MusicBrainz (json)")
-                rg_list = []
-                for rg_data in rgs:
-                    if self._is_artist_match(rg_data['artist-credit-phrase'], artist, artist_aliases):
-                        rg_list.append(rg_data)
-
-                if rg_list:
-                    logger.debug(f"Found {len(rg_list)} matching albums via fallback for '{title_variant}'")
-                    return {"release-group-list": rg_list}
-            else:
-                ns = {
-                    'mb': 'http://musicbrainz.org/ns/mmd-2.0#',
-                    'ns2': 'http://musicbrainz.org/ns/ext#-2.0'
-                }
-                release_groups = root.findall('.//mb:release-group', ns)
-                if not release_groups:
-                    logger.debug("Fallback search returned no results")
-                    continue
-                logger.debug(f"Fallback search got {len(release_groups)} raw results from MusicBrainz")
-                rg_list = self._parse_release_groups(release_groups, ns, artist, artist_aliases, title_variant)
-                if rg_list:
-                    logger.debug(f"Found {len(rg_list)} matching albums via fallback for '{title_variant}'")
-                    return {"release-group-list": rg_list}
+            rgs = self._extract_release_groups_from_json(root)
+            if not rgs:
+                logger.debug("Fallback search returned no results")
+                continue
+            logger.debug(f"Fallback search got {len(rgs)} raw results from MusicBrainz")
+            rg_list = []
+            for rg_data in rgs:
+                if self._is_artist_match(rg_data['artist-credit-phrase'], artist, artist_aliases):
+                    rg_list.append(rg_data)
+
+            if rg_list:
+                logger.debug(f"Found {len(rg_list)} matching albums via fallback for '{title_variant}'")
+                return {"release-group-list": rg_list}
         logger.debug(
             f"No matches found after trying {len(title_variations)} title variations"
         )
         return {"release-group-list": []}
     
+    def batch_search_release_groups(self, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run many release-group searches concurrently.
+        
+        Requests from all searches share the client's rate limiter, so the
+        overall request rate is unchanged; the gain is that response
+        parsing, candidate scoring and cache hits of one search overlap the
+        rate-limit wait of the others.
+        
+        Args:
+            searches: Keyword arguments for search_release_groups(), one dict
+                per search (e.g. {'artist': ..., 'releasegroup': ...})
+            
+        Returns:
+            search_release_groups() results in the same order as searches
+        """
+        results: List[Any] = [None] * len(searches)
+        futures = {self._executor.submit(self.search_release_groups, **kwargs): i for i, kwargs in enumerate(searches)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+    
     def _generate_title_variations(self, title: str) -> List[str]:
         """
         Generate variations of an album title to improve search success.
@@ -625,45 +781,7 @@ class MusicBrainzClient:
         
         Returns list with original first, then variations in order of preference.
         """
-        variations = [title]  # Always try original first
-        title_lower = title.lower().strip()
-        
-        # Remove common prefixes (ep, the, a, single)
-        prefixes_to_strip = ['ep ', 'single ', 'the ', 'a ']
-        for prefix in prefixes_to_strip:
-            if title_lower.startswith(prefix):
-                stripped = title[len(prefix):].strip()
-                if stripped and stripped not in variations:
-                    variations.append(stripped)
-                    logger.debug(f"      Title variation: '{title}' → '{stripped}' (removed '{prefix.strip()}')")
-        
-        # Try Title Case if original is lowercase
-        if title_lower == title:
-            title_case = title.title()
-            if title_case not in variations:
-                variations.append(title_case)
-                logger.debug(f"      Title variation: '{title}' → '{title_case}' (title case)")
-
-        # Try all caps if it's a short title (likely an acronym)
-        if len(title) <= 6 and not title.isupper():
-            upper_title = title.upper()
-            if upper_title not in variations:
-                variations.append(upper_title)
-                logger.debug(f"      Title variation: '{title}' → '{upper_title}' (uppercase)")
-
-        # Additional helpful variations: replace ampersand with 'and', remove commas/periods
-        amp = title.replace('&', 'and')
-        if amp not in variations:
-            variations.append(amp)
-            logger.debug(f"      Title variation: '{title}' → '{amp}' (ampersand→and)")
-
-        no_punct = ''.join(ch for ch in title if ch.isalnum() or ch.isspace())
-        no_punct = ' '.join(no_punct.split())
-        if no_punct and no_punct not in variations:
-            variations.append(no_punct)
-            logger.debug(f"      Title variation: '{title}' → '{no_punct}' (removed punctuation)")
-        
-        return variations
+        return list(_title_variations(title))
     
     def _build_release_group_queries(self, artist: str, releasegroup: str) -> List[str]:
         """
@@ -674,6 +792,10 @@ class MusicBrainzClient:
         2. Cleaned artist name (handle special chars like $ and !)
         3. Looser matching without quotes
         4. Most permissive (for artists with brackets)
+        
+        Quoting a single plain word changes nothing in a Lucene query, so the
+        unquoted-artist query is skipped when the artist is one alphanumeric
+        word; it would repeat the first query and cost another request.
         """
         queries = []
         
@@ -698,9 +820,8 @@ class MusicBrainzClient:
             if clean_artist != artist:
                 queries.append(f'artist:"{clean_artist}" AND releasegroup:"{releasegroup}"')
             
-            queries.extend([
-                f'artist:{artist} AND releasegroup:"{releasegroup}"',
-            ])
+            if not artist.isalnum():
+                queries.append(f'artist:{artist} AND releasegroup:"{releasegroup}"')
             
             if clean_artist != artist:
                 queries.append(f'artist:{clean_artist} releasegroup:{releasegroup}')
@@ -716,13 +837,17 @@ class MusicBrainzClient:
         if not artist_credit_phrase or not artist:
             return False
 
+        # Most credits are spelled exactly like the searched artist
+        if artist_credit_phrase == artist:
+            return True
+
         try:
-            credit_norm = normalize_artist_name(artist_credit_phrase)
+            credit_norm = _norm(artist_credit_phrase)
         except Exception:
             credit_norm = (artist_credit_phrase or '').lower()
 
         try:
-            artist_norm = normalize_artist_name(artist)
+            artist_norm = _norm(artist)
         except Exception:
             artist_norm = (artist or '').lower()
 
@@ -734,7 +859,7 @@ class MusicBrainzClient:
         aliases = artist_aliases.get(artist, []) if artist_aliases else []
         for a in aliases:
             try:
-                if normalize_artist_name(a) in credit_norm:
+                if _norm(a) in credit_norm:
                     return True
             except Exception:
                 if (a or '').lower() in credit_norm:
@@ -748,94 +873,10 @@ class MusicBrainzClient:
 
         return sim >= 70
     
-    def _parse_release_groups(
-        self,
-        release_groups: List[ET.Element],
-        ns: Dict[str, str],
-        artist: str,
-        artist_aliases: Dict[str, List[str]],
-        title_searched: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        Parse and filter release group XML elements.
-        
-        Filters out results where the artist doesn't match to prevent
-        false positives (e.g., "AJ Suede" matching "Suede").
-        """
-        rg_list = []
-        
-        for rg in release_groups:
-            title_elem = rg.find('./mb:title', ns)
-            artist_credit = rg.find('.//mb:artist-credit/mb:name-credit/mb:artist/mb:name', ns)
-            
-            # Get score with proper namespace handling
-            score = (
-                rg.get('{http://musicbrainz.org/ns/ext#-2.0}score') or
-                rg.get('ns2:score') or
-                rg.get('ext:score') or
-                '100'
-            )
-            
-            rg_data = {
-                'id': rg.get('id', ''),
-                'title': title_elem.text if title_elem is not None else '',
-                'artist-credit-phrase': artist_credit.text if artist_credit is not None else '',
-                'ext:score': score,
-                'urls': [],
-                'first_release_date': None,
-                'track_count': None,
-            }
-
-            # Extract first-release-date if present
-            try:
-                fr_elem = rg.find('./mb:first-release-date', ns)
-                if fr_elem is not None and fr_elem.text:
-                    rg_data['first_release_date'] = fr_elem.text
-            except Exception:
-                pass
-
-            # Try to extract track count from first release (if included via inc=releases)
-            try:
-                first_release = rg.find('.//mb:release', ns)
-                if first_release is not None:
-                    tracks = first_release.findall('.//mb:medium/mb:track-list/mb:track', ns)
-                    if tracks:
-                        rg_data['track_count'] = len(tracks)
-            except Exception:
-                pass
-
-            # Extract relation URLs (if any)
-            try:
-                targets = [t.text for t in rg.findall('.//mb:relation/mb:target', ns) if t is not None and t.text]
-                if targets:
-                    rg_data['urls'] = targets
-            except Exception:
-                pass
-            
-            # Filter results by artist relevance
-            if self._is_artist_match(rg_data['artist-credit-phrase'], artist, artist_aliases):
-                rg_list.append(rg_data)
-                logger.debug(
-                    f"Kept: '{rg_data['title']}' by '{rg_data['artist-credit-phrase']}' "
-                    f"(score: {score})"
-                )
-            else:
-                logger.debug(
-                    f"Filtered: '{rg_data['title']}' by '{rg_data['artist-credit-phrase']}' "
-                    f"(not a match for '{artist}')"
-                )
-        
-        
-        # If we have a searched title and there are multiple matches, prefer
-        # exact-title matches (case-insensitive) before falling back to fuzzy
-        # ordering as returned by MusicBrainz / ext:score.
-        if title_searched and rg_list:
-            lower_title = title_searched.strip().lower()
-            exact = [r for r in rg_list if (r.get('title') or '').strip().lower() == lower_title]
-            if exact:
-                # We already have exact title matches; prefer higher ext:score
-                exact.sort(key=lambda r: int(r.get('ext:score') or 0), reverse=True)
-                return exact
-        # Default: return the filtered/collected release-group list
-        return rg_list
-        
+    def close(self):
+        """Shut down batch workers and close the HTTP session (unless shared) and response cache (if any)."""
+        self._executor.shutdown(wait=True)
+        if self._owns_session:
+            self.session.close()
+        if self.cache is not None:
+            self.cache.close()
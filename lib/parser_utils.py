@@ -8,6 +8,7 @@ from typing import Dict, Tuple, Any, Iterable, List, Set
 import re
 import csv
 import json
+import shutil
 from collections import defaultdict
 from typing import Optional
 from pathlib import Path
@@ -336,7 +337,7 @@ def create_backup(csv_file: Path) -> Path:
     backup_name = f"{csv_file.stem}_backup_{timestamp}{csv_file.suffix}"
     backup_path = csv_file.parent / backup_name
 
-    backup_path.write_text(csv_file.read_text(encoding='utf-8'), encoding='utf-8')
+    shutil.copyfile(csv_file, backup_path)
     logging.info(f"Created backup: {backup_path}")
     return backup_path
 
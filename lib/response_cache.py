@@ -0,0 +1,106 @@
+"""
+SQLite-backed cache of MusicBrainz API responses.
+
+Imports are dominated by repeated MusicBrainz searches: the same artist is
+looked up for each of its albums, title variations collide across albums,
+and resumed or re-run imports repeat every query of the previous run. Each
+of those requests costs at least one second of mandatory rate-limit wait.
+
+ResponseCache stores raw response bodies keyed by endpoint and query
+parameters, so a repeated search is answered from disk without touching the
+network or the rate limiter. Entries expire after a configurable TTL so
+MusicBrainz edits are eventually picked up.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+# One week: MusicBrainz search results change slowly
+DEFAULT_TTL = 7 * 24 * 3600.0
+
+
+class ResponseCache:
+    """
+    Persistent (endpoint, params) -> response body mapping stored in SQLite.
+
+    The connection is shared between threads (MusicBrainzClient may be used
+    from worker threads), so every statement runs under a lock.
+    """
+
+    def __init__(self, db_path: str, ttl: float = DEFAULT_TTL):
+        """
+        Open (or create) the response cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl: Seconds a cached response stays valid
+        """
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response ("
+            "key TEXT PRIMARY KEY, "
+            "body BLOB NOT NULL, "
+            "stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        logger.debug(f"ResponseCache opened at {self.db_path}")
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, str]) -> str:
+        """Build a cache key that does not depend on parameter order."""
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key``, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM response WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return row[0]
+
+    def set(self, key: str, body: bytes):
+        """Store (or replace) the response body for ``key``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response (key, body, stored_at) VALUES (?, ?, ?)",
+                (key, body, time.time()),
+            )
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM response")
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response").fetchone()[0]
+
+    def __enter__(self) -> 'ResponseCache':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        return f"ResponseCache(path={self.db_path}, ttl={self.ttl}s)"
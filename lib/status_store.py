@@ -0,0 +1,91 @@
+"""
+SQLite-backed status journal for CSV imports.
+
+The input CSV doubles as the progress record, but CSV files are not
+random-access: every status change means rewriting the whole file.
+StatusStore keeps per-item statuses in a small SQLite sidecar instead, so
+recording a status is a single indexed write. CSVHandler merges the
+journal back into the CSV in one streaming rewrite when it is flushed.
+
+Because the journal survives crashes, statuses recorded by an interrupted
+run are merged into the CSV the next time it is read.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StatusStore:
+    """
+    Persistent (artist, album) -> status mapping stored in SQLite.
+
+    The database runs in WAL mode with ``synchronous=NORMAL``: each write is
+    durable against process crashes without an fsync per item.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the status journal.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS status ("
+            "artist TEXT NOT NULL, "
+            "album TEXT NOT NULL, "
+            "status TEXT NOT NULL, "
+            "PRIMARY KEY (artist, album))"
+        )
+        self._conn.commit()
+        logger.debug(f"StatusStore opened at {self.db_path}")
+
+    @classmethod
+    def for_csv(cls, csv_path: str) -> 'StatusStore':
+        """Open the sidecar journal for a CSV file (``albums.csv`` -> ``albums.status.sqlite``)."""
+        csv_path = Path(csv_path)
+        return cls(str(csv_path.with_name(f"{csv_path.stem}.status.sqlite")))
+
+    def set(self, artist: str, album: str, status: str):
+        """Record the latest status for an artist/album pair."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO status (artist, album, status) VALUES (?, ?, ?)",
+                (artist, album, status),
+            )
+
+    def get_all(self) -> Dict[Tuple[str, str], str]:
+        """Return every recorded status keyed by (artist, album)."""
+        rows = self._conn.execute("SELECT artist, album, status FROM status")
+        return {(artist, album): status for artist, album, status in rows}
+
+    def clear(self):
+        """Forget all recorded statuses (after they were merged into the CSV)."""
+        with self._conn:
+            self._conn.execute("DELETE FROM status")
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM status").fetchone()[0]
+
+    def __enter__(self) -> 'StatusStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        """String representation of the store."""
+        return f"StatusStore(path={self.db_path})"
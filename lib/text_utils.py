@@ -12,6 +12,7 @@ These functions handle common variations like:
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List
 
 
@@ -174,12 +175,15 @@ def get_edition_variants() -> List[str]:
     ]
 
 
+@lru_cache(maxsize=8192)
 def normalize_album_title_for_matching(title: str) -> str:
     """
     Normalize album title by removing edition suffixes.
     
     Used for fuzzy matching to compare albums regardless of edition.
     For example, "Album (Deluxe)" and "Album" should match.
+    Results are memoized, since the same library titles are matched
+    against every album in an import.
     
     Args:
         title: Album title to normalize
@@ -187,7 +191,9 @@ def normalize_album_title_for_matching(title: str) -> str:
     Returns:
         Normalized title with edition suffixes removed
     """
-    normalized = title.lower().strip()
+    # NFKC + casefold so composed/decomposed accents and case variants
+    # such as "ß"/"SS" compare equal
+    normalized = unicodedata.normalize('NFKC', title).casefold().strip()
     for variant in get_edition_variants():
         if normalized.endswith(variant):
             normalized = normalized[:-len(variant)].strip()
@@ -38,6 +38,7 @@ import time
 import argparse
 import logging
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -54,6 +55,7 @@ if str(lib_path) not in sys.path:
 from config_manager import Config
 from lidarr_client import LidarrClient
 from csv_handler import CSVHandler, ItemStatus
+from status_store import StatusStore
 from lib.text_utils import (
     normalize_artist_name,
     normalize_profanity,
@@ -478,6 +480,8 @@ def monitor_album_by_mbid(artist_id: int, musicbrainz_album_id: str, artist_name
         r = requests.post(add_url, json=album_data, headers=headers, timeout=30)
         
         if r.status_code in (200, 201):
+            # Added outside LidarrClient, so drop its cached library listings
+            lidarr_client.invalidate()
             logging.info(f"Added and monitoring album: {artist_name} - {album_title} (MBID: {musicbrainz_album_id})")
             return True, False
         elif r.status_code == 400:
@@ -895,6 +899,8 @@ def add_new_artist_to_lidarr(artist: str, mb_artist_id: str) -> Tuple[bool, Dict
         added_artist = retry_api_call(_add_artist)
         if not added_artist:
             return False, {}, f"Failed to add artist: {artist}", "error_unknown"
+        # Added outside LidarrClient, so drop its cached artist list
+        lidarr_client.invalidate()
         
         added_artist_name = added_artist.get("artistName", "Unknown")
         added_artist_id = added_artist.get("id", "Unknown")
@@ -1001,6 +1007,8 @@ def handle_race_condition(artist: str, album: str, mb_album_id: Optional[str]) -
     """
     logging.info(f"Race condition detected for {artist}, refreshing artist list and retrying album monitoring")
     try:
+        # The artist was added by someone else, so the cached list cannot have it
+        lidarr_client.invalidate()
         existing_artists = lidarr_client.get_existing_artists()
         existing_artist = find_existing_artist(artist, existing_artists)
         if existing_artist:
@@ -1144,13 +1152,17 @@ def process_artist_album_pair(
 
 # ========== MAIN EXECUTION ==========
 
-def main():
+def main(cleanup: ExitStack):
     """
     Main entry point for the album import script.
     
     Handles command-line arguments, orchestrates the import process,
     and provides comprehensive progress reporting and status tracking.
     
+    Args:
+        cleanup: Exit stack owned by the caller; the CSV handler is entered on
+            it so buffered status updates are flushed however the run ends
+    
     FEATURES:
     - Dry-run mode for testing without making changes
     - Batch processing with configurable pauses to avoid API overload  
@@ -1241,6 +1253,9 @@ QUICK ALIAS (optional):
     parser.add_argument("--album", type=str,
                        help="Process only albums matching specific title (case-insensitive partial match)")
     # NOTE: legacy alias --exclude-status removed; use --not-status instead
+    parser.add_argument("--status-journal", action="store_true",
+                       help="Journal per-item statuses in a SQLite sidecar (<csv>.status.sqlite) and "
+                            "merge them into the CSV at the end of the run (faster for large CSVs)")
     parser.add_argument("--log-file", type=str,
                        help="Write detailed logs to specified file (in addition to console)")
     parser.add_argument("--progress-interval", type=int, default=50,
@@ -1268,7 +1283,8 @@ QUICK ALIAS (optional):
         logging.info(f"Logging to file: {args.log_file}")
     
     # Load and validate CSV input using CSVHandler
-    csv_handler = CSVHandler(args.input)
+    status_store = StatusStore.for_csv(args.input) if args.status_journal else None
+    csv_handler = cleanup.enter_context(CSVHandler(args.input, status_store=status_store))
     items, has_status_column = csv_handler.read_items()
     if not items:
         logging.error("No valid artist/album pairs found in CSV file.")
@@ -1280,8 +1296,9 @@ QUICK ALIAS (optional):
     # Filter out already completed items if resuming
     original_count = len(items)
     if args.skip_completed:
-        # Use CSVHandler's filtering to skip already processed items
-        items = csv_handler.filter_items_by_status(
+        # Use CSVHandler's filtering to skip already processed items; the
+        # status summary covers all loaded items so skipped ones are counted
+        items, status_summary = csv_handler.partition(
             items,
             skip_completed=True,
             skip_permanent_failures=True
@@ -1290,12 +1307,15 @@ QUICK ALIAS (optional):
         if skipped > 0:
             logging.info(f"Skipped {skipped} already completed/permanently failed items")
             
-            # Show breakdown of what was skipped using status summary
-            status_summary = csv_handler.get_status_summary(items)
-            
-            if status_summary:
+            # Show breakdown of what was skipped; the summary also counts the
+            # items still to process, so keep only the filtered-out statuses
+            skipped_summary = {
+                status: count for status, count in status_summary.items()
+                if ItemStatus.is_success(status) or ItemStatus.is_skip(status)
+            }
+            if skipped_summary:
                 logging.info("Skipped breakdown:")
-                for status, count in status_summary.items():
+                for status, count in skipped_summary.items():
                     if ItemStatus.is_success(status):
                         logging.info(f"  {status}: {count} items (successful)")
                     elif ItemStatus.is_skip(status):
@@ -1477,7 +1497,7 @@ QUICK ALIAS (optional):
             item['status'] = ItemStatus.DRY_RUN
             successes += 1
             
-            # Write status immediately after processing (use raw values for CSV matching)
+            # Record status right after processing (buffered; use raw values for CSV matching)
             csv_handler.update_single_status(raw_artist, raw_album, ItemStatus.DRY_RUN)
         else:
             # Real processing: add artist and monitor album
@@ -1489,7 +1509,7 @@ QUICK ALIAS (optional):
             item['status'] = status_code
             messages.append(f"[{'OK' if success else 'FAIL'}] {message}")
             
-            # Write status immediately after processing this item (use raw values for CSV matching)
+            # Record status right after processing this item (buffered; use raw values for CSV matching)
             csv_handler.update_single_status(raw_artist, raw_album, status_code)
             
             # Log the result clearly (use tqdm.write to avoid conflicts with progress bar)
@@ -1530,6 +1550,9 @@ QUICK ALIAS (optional):
     # Update CSV file with processing status for resumable imports
     if not args.dry_run or (args.dry_run and not has_status_column):
         csv_handler.update_all_statuses(items)
+    if status_store is not None:
+        status_store.close()
+    lidarr_client.close()
     
     # Display detailed processing results
     if messages:
@@ -1604,4 +1627,5 @@ QUICK ALIAS (optional):
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with ExitStack() as cleanup:
+        main(cleanup)
\ No newline at end of file
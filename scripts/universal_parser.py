@@ -192,8 +192,9 @@ class UniversalParser:
                 spotify_album_url=meta.get('spotify_album_url', '') or '',
                 release_date=meta.get('release_date', '') or '',
                 total_tracks=track_count,
-                track_titles=';'.join(meta.get('track_titles', [])) if meta.get('track_titles') else '',
-                track_isrcs=';'.join(meta.get('track_isrcs', [])) if meta.get('track_isrcs') else '',
+                track_titles=tuple(meta.get('track_titles') or ()),
+                # ISRCs are short and recur across a library; share one copy each
+                track_isrcs=tuple(sys.intern(isrc) for isrc in meta.get('track_isrcs') or ()),
             )
             self.entries.append(entry)
 
@@ -329,7 +330,8 @@ class UniversalParser:
                         'app_name': 'lidarr-album-import-universal-parser',
                         'version': '2.1',
                         'contact': getattr(config, 'musicbrainz_contact', 'your.email@example.com')
-                    }
+                    },
+                    cache_path=getattr(config, 'musicbrainz_cache_path', None)
                 )
             except Exception:
                 logging.warning("⚠️  Could not load config for MusicBrainz - using defaults")
@@ -516,8 +518,8 @@ class UniversalParser:
                         entry.spotify_album_url,
                         entry.release_date,
                         str(entry.total_tracks) if entry.total_tracks is not None else '',
-                        entry.track_titles,
-                        entry.track_isrcs,
+                        ';'.join(entry.track_titles),
+                        ';'.join(entry.track_isrcs),
                     ])
                 if has_mb_ids:
                     row.extend([entry.mb_artist_id, entry.mb_release_id])
@@ -7,6 +7,7 @@ Tests configuration loading, validation, and environment variable handling.
 import pytest
 import sys
 import os
+import types
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -341,6 +342,19 @@ class TestConfigToDict:
         assert config_dict['musicbrainz_delay'] == config.musicbrainz_delay
         assert config_dict['lidarr_base_url'] == config.lidarr_base_url
 
+    @pytest.mark.unit
+    def test_to_dict_cache_tracks_changes(self, monkeypatch):
+        """Test that the cached dict is copied out and refreshed on change."""
+        monkeypatch.setenv('LIDARR_API_KEY', 'test-key')
+        
+        config = Config()
+        first = config.to_dict()
+        first['batch_size'] = -1
+        assert config.to_dict()['batch_size'] == config.batch_size
+        
+        config.batch_size = 77
+        assert config.to_dict()['batch_size'] == 77
+
 
 class TestConfigRepr:
     """Tests for configuration string representation."""
@@ -435,3 +449,52 @@ class TestConfigIntegration:
         
         assert config.batch_size == 999
         assert config.batch_size != original_batch
+
+    @pytest.mark.unit
+    def test_environment_is_reread_on_every_load(self, monkeypatch):
+        """Test that env-var changes are seen by later Config() calls."""
+        monkeypatch.setenv('LIDARR_API_KEY', 'first-key')
+        assert Config().lidarr_api_key == 'first-key'
+        
+        monkeypatch.setenv('LIDARR_API_KEY', 'second-key')
+        assert Config().lidarr_api_key == 'second-key'
+    
+    @pytest.mark.unit
+    def test_config_module_parse_is_cached_until_file_changes(self, monkeypatch, tmp_path):
+        """Test that config.py is parsed once per file version."""
+        config_file = tmp_path / "config.py"
+        config_file.write_text("LIDARR_API_KEY = 'module-key'\n")
+        module = types.ModuleType('config')
+        module.__file__ = str(config_file)
+        module.LIDARR_API_KEY = 'module-key'
+        monkeypatch.setitem(sys.modules, 'config', module)
+        
+        loads = []
+        real_load = Config._load_from_module
+        def counting_load(self, config_module):
+            loads.append(config_module)
+            real_load(self, config_module)
+        monkeypatch.setattr(Config, '_load_from_module', counting_load)
+        
+        Config.invalidate_cache()
+        try:
+            first = Config()
+            second = Config()
+            assert len(loads) == 1
+            assert second.lidarr_api_key == 'module-key'
+            
+            # Mutable settings are copied per instance
+            second.artist_aliases['new'] = ['alias']
+            second.musicbrainz_user_agent['contact'] = 'changed'
+            assert 'new' not in first.artist_aliases
+            assert 'new' not in Config().artist_aliases
+            assert Config().musicbrainz_user_agent['contact'] != 'changed'
+            
+            # An edited config.py is parsed again
+            module.LIDARR_API_KEY = 'edited-key'
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert Config().lidarr_api_key == 'edited-key'
+            assert len(loads) == 2
+        finally:
+            Config.invalidate_cache()
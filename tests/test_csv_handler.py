@@ -9,6 +9,7 @@ import pytest
 import csv
 from pathlib import Path
 from lib.csv_handler import CSVHandler, ItemStatus
+from lib.models import CSVItem
 
 
 class TestItemStatus:
@@ -128,6 +129,21 @@ class TestCSVHandlerReadItems:
         assert items[0]['status'] == 'success'
         assert items[1]['status'] == 'pending_refresh'
     
+    def test_read_csv_interns_status(self, tmp_path):
+        """Test that identical status values share one string object."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "artist,album,status\n"
+            "Artist A,Album A,error_timeout\n"
+            "Artist B,Album B,error_timeout\n"
+        )
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        
+        assert items[0].status is items[1].status
+        assert items[0].status is ItemStatus.ERROR_TIMEOUT
+    
     def test_read_csv_skips_empty_rows(self, tmp_path):
         """Test that empty rows are skipped."""
         csv_file = tmp_path / "test.csv"
@@ -201,6 +217,86 @@ class TestCSVHandlerReadItems:
         assert int(items[1]['row_num']) >= 3
 
 
+    def test_read_short_rows_and_mb_ids(self, tmp_path):
+        """Test that short rows and blank lines are handled with index access."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "album,artist,status,mb_artist_id,mb_release_id\n"
+            "Album A,Artist A,success,art-1,rel-1\n"
+            "\n"
+            "Album B,Artist B\n"
+        )
+        
+        handler = CSVHandler(str(csv_file))
+        items, has_status = handler.read_items()
+        
+        assert has_status
+        assert [(i.artist, i.album) for i in items] == [('Artist A', 'Album A'), ('Artist B', 'Album B')]
+        assert items[0].mb_release_id == 'rel-1'
+        assert items[1].status == ''
+        assert items[1].mb_artist_id == ''
+    
+    def test_read_via_mmap_matches_regular_read(self, tmp_path, monkeypatch):
+        """Test that the memory-mapped path parses exactly like the file path."""
+        csv_file = tmp_path / "test.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['artist', 'album', 'status'])
+            writer.writerow(['Björk', 'Homogenic', 'success'])
+            writer.writerow(['Sigur Rós', 'Multi\nLine', ''])
+        
+        handler = CSVHandler(str(csv_file))
+        expected, _ = handler.read_items()
+        
+        monkeypatch.setattr('lib.csv_handler.MMAP_THRESHOLD', 1)
+        items, has_status = handler.read_items()
+        
+        assert has_status
+        assert items == expected
+        assert items[1].album == 'Multi\nLine'
+    
+    def test_read_via_pandas_matches_regular_read(self, tmp_path, monkeypatch):
+        """Test that the optional pandas path parses like the csv module."""
+        pytest.importorskip('pandas')
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "artist,album,status,mb_artist_id,mb_release_id\n"
+            " Artist A , Album A ,success,art-1,rel-1\n"
+            "\n"
+            ",Missing Artist\n"
+            "Artist B,Album B\n",
+            encoding='utf-8',
+        )
+        
+        handler = CSVHandler(str(csv_file))
+        expected, _ = handler.read_items()
+        
+        monkeypatch.setattr('lib.csv_handler.PANDAS_THRESHOLD', 1)
+        items, has_status = handler.read_items()
+        
+        assert has_status
+        assert items == expected
+    
+    def test_read_returns_slotted_items(self, tmp_path):
+        """Test that items are CSVItem rows with attribute and dict access."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album,status\nTaylor Swift,1989,success\n")
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        
+        item = items[0]
+        assert isinstance(item, CSVItem)
+        assert item.status == item['status'] == 'success'
+        assert item.get('missing', 'default') == 'default'
+        assert item.to_dict() == {
+            'artist': 'Taylor Swift', 'album': '1989', 'status': 'success',
+            'mb_artist_id': '', 'mb_release_id': '', 'row_num': 2,
+        }
+        with pytest.raises(AttributeError):
+            item.extra = 'no __dict__'
+
+
 class TestCSVHandlerUpdateAllStatuses:
     """Test batch status updates."""
     
@@ -313,6 +409,93 @@ class TestCSVHandlerUpdateAllStatuses:
             assert rows[0]['status'] == 'success'
             assert rows[1]['status'] == ''
             assert rows[2]['status'] == ''
+    
+    def test_update_all_statuses_leaves_no_temp_file(self, tmp_path):
+        """Test that the streaming rewrite replaces the CSV and cleans up."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album,extra\nArtist A,Album A,keep\nArtist B,Album B,me\n")
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        items[1]['status'] = 'success'
+        handler.update_all_statuses(items)
+        
+        assert [p.name for p in tmp_path.iterdir()] == ['test.csv']
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['extra'] == 'keep'
+        assert rows[1]['extra'] == 'me'
+        assert rows[1]['status'] == 'success'
+
+
+    def test_update_all_statuses_keeps_unrelated_tmp_file(self, tmp_path):
+        """Test that the rewrite never reuses a fixed <name>.tmp path."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album\nTaylor Swift,1989\n")
+        user_tmp = tmp_path / "test.tmp"
+        user_tmp.write_text("not ours")
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        items[0]['status'] = 'success'
+        handler.update_all_statuses(items)
+        
+        assert user_tmp.read_text() == "not ours"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['test.csv', 'test.tmp']
+    
+    def test_update_all_statuses_skips_unchanged_rewrite(self, tmp_path):
+        """Test that the file is not rewritten when no status changes."""
+        csv_file = tmp_path / "test.csv"
+        # Unusual quoting would be normalized by a rewrite
+        csv_file.write_text('"artist","album","status"\n"Artist A","Album A","success"\n')
+        original = csv_file.read_text()
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        handler.update_all_statuses(items)
+        
+        assert csv_file.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ['test.csv']
+    
+    def test_update_all_statuses_tail_copy(self, tmp_path):
+        """Test that rows after the last match are copied byte-for-byte."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "artist,album,status\n"
+            "Artist A,Album A,\n"
+            "Artist B,Album B,\n"
+            '"Artist C",  Album C  ,error_timeout\n'
+        )
+        
+        handler = CSVHandler(str(csv_file), tail_copy=True)
+        items, _ = handler.read_items()
+        items[0]['status'] = 'success'
+        handler.update_all_statuses([items[0]])
+        
+        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines[1] == 'Artist A,Album A,success'
+        # Untouched tail keeps its original quoting and spacing
+        assert lines[3] == '"Artist C",  Album C  ,error_timeout'
+    
+    def test_update_all_statuses_pipe_in_names(self, tmp_path):
+        """Test that a '|' inside names cannot make two rows collide."""
+        csv_file = tmp_path / "test.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['artist', 'album'])
+            writer.writerow(['A|B', 'C'])
+            writer.writerow(['A', 'B|C'])
+        
+        handler = CSVHandler(str(csv_file))
+        items, _ = handler.read_items()
+        items[0]['status'] = 'success'
+        handler.update_all_statuses([items[0]])
+        
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['status'] == 'success'
+        assert rows[1]['status'] == ''
 
 
 class TestCSVHandlerUpdateSingleStatus:
@@ -332,6 +515,7 @@ class TestCSVHandlerUpdateSingleStatus:
         
         # Update single item
         handler.update_single_status('Taylor Swift', '1989', 'success')
+        handler.flush()
         
         # Verify only that item was updated
         with open(csv_file, 'r', encoding='utf-8') as f:
@@ -350,9 +534,76 @@ class TestCSVHandlerUpdateSingleStatus:
         
         # Try to update non-existent item
         handler.update_single_status('Unknown Artist', 'Unknown Album', 'success')
+        handler.flush()
         
         # Should log warning
         assert 'Could not find row' in caplog.text
+    
+    def test_update_single_status_is_buffered(self, tmp_path):
+        """Test that single updates are written in batches of flush_every."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "artist,album\n"
+            "Artist A,Album A\n"
+            "Artist B,Album B\n"
+            "Artist C,Album C\n"
+        )
+        original = csv_file.read_text()
+        
+        handler = CSVHandler(str(csv_file), flush_every=2)
+        handler.update_single_status('Artist A', 'Album A', 'success')
+        assert csv_file.read_text() == original
+        
+        handler.update_single_status('Artist B', 'Album B', 'skip')
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['status'] for r in rows] == ['success', 'skip', '']
+    
+    def test_context_manager_flushes_pending(self, tmp_path):
+        """Test that leaving the context writes buffered updates."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album\nTaylor Swift,1989\n")
+        
+        with CSVHandler(str(csv_file)) as handler:
+            handler.update_single_status('Taylor Swift', '1989', 'success')
+        
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            row = next(csv.DictReader(f))
+        assert row['status'] == 'success'
+    
+    def test_failed_flush_keeps_pending_updates(self, tmp_path, monkeypatch):
+        """Test that updates survive a rewrite failure (e.g. CSV open in Excel)."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album\nArtist A,Album A\nArtist B,Album B\n")
+        
+        handler = CSVHandler(str(csv_file), flush_every=10)
+        handler.update_single_status('Artist A', 'Album A', 'success')
+        
+        rewrite = handler._rewrite_statuses
+        def locked(status_lookup):
+            raise PermissionError("file is locked")
+        monkeypatch.setattr(handler, '_rewrite_statuses', locked)
+        handler.flush()
+        handler.update_all_statuses([CSVItem('Artist B', 'Album B', 'skip', '', '', 3)])
+        
+        monkeypatch.setattr(handler, '_rewrite_statuses', rewrite)
+        handler.flush()
+        
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['status'] for r in rows] == ['success', '']
+    
+    def test_read_items_sees_pending_updates(self, tmp_path):
+        """Test that read_items flushes buffered updates first."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("artist,album\nTaylor Swift,1989\n")
+        
+        handler = CSVHandler(str(csv_file))
+        handler.update_single_status('Taylor Swift', '1989', 'success')
+        items, has_status = handler.read_items()
+        
+        assert has_status
+        assert items[0]['status'] == 'success'
 
 
 class TestCSVHandlerFilterItems:
@@ -361,9 +612,9 @@ class TestCSVHandlerFilterItems:
     def test_filter_skip_completed(self):
         """Test filtering out completed items."""
         items = [
-            {'artist': 'A', 'album': 'X', 'status': 'success'},
-            {'artist': 'B', 'album': 'Y', 'status': 'pending_refresh'},
-            {'artist': 'C', 'album': 'Z', 'status': 'already_monitored'},
+            CSVItem('A', 'X', 'success', '', '', 0),
+            CSVItem('B', 'Y', 'pending_refresh', '', '', 0),
+            CSVItem('C', 'Z', 'already_monitored', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)  # Create without init
@@ -371,14 +622,14 @@ class TestCSVHandlerFilterItems:
         
         # Only pending should remain
         assert len(filtered) == 1
-        assert filtered[0]['artist'] == 'B'
+        assert filtered[0].artist == 'B'
     
     def test_filter_skip_permanent_failures(self):
         """Test filtering out permanent failures."""
         items = [
-            {'artist': 'A', 'album': 'X', 'status': 'skip_no_musicbrainz'},
-            {'artist': 'B', 'album': 'Y', 'status': 'error_timeout'},
-            {'artist': 'C', 'album': 'Z', 'status': 'skip_api_error'},
+            CSVItem('A', 'X', 'skip_no_musicbrainz', '', '', 0),
+            CSVItem('B', 'Y', 'error_timeout', '', '', 0),
+            CSVItem('C', 'Z', 'skip_api_error', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)
@@ -386,13 +637,13 @@ class TestCSVHandlerFilterItems:
         
         # Only error (retryable) should remain
         assert len(filtered) == 1
-        assert filtered[0]['artist'] == 'B'
+        assert filtered[0].artist == 'B'
     
     def test_filter_keep_empty_status(self):
         """Test that empty status items are kept."""
         items = [
-            {'artist': 'A', 'album': 'X', 'status': ''},
-            {'artist': 'B', 'album': 'Y', 'status': 'success'},
+            CSVItem('A', 'X', '', '', '', 0),
+            CSVItem('B', 'Y', 'success', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)
@@ -400,14 +651,14 @@ class TestCSVHandlerFilterItems:
         
         # Empty status should be kept
         assert len(filtered) == 1
-        assert filtered[0]['artist'] == 'A'
+        assert filtered[0].artist == 'A'
     
     def test_filter_no_filters(self):
         """Test filtering with all filters disabled."""
         items = [
-            {'artist': 'A', 'album': 'X', 'status': 'success'},
-            {'artist': 'B', 'album': 'Y', 'status': 'skip_no_musicbrainz'},
-            {'artist': 'C', 'album': 'Z', 'status': 'error_timeout'},
+            CSVItem('A', 'X', 'success', '', '', 0),
+            CSVItem('B', 'Y', 'skip_no_musicbrainz', '', '', 0),
+            CSVItem('C', 'Z', 'error_timeout', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)
@@ -427,11 +678,11 @@ class TestCSVHandlerGetStatusSummary:
     def test_get_status_summary_basic(self):
         """Test basic status summary."""
         items = [
-            {'status': 'success'},
-            {'status': 'success'},
-            {'status': 'error_timeout'},
-            {'status': 'pending_refresh'},
-            {'status': 'success'},
+            CSVItem('', '', 'success', '', '', 0),
+            CSVItem('', '', 'success', '', '', 0),
+            CSVItem('', '', 'error_timeout', '', '', 0),
+            CSVItem('', '', 'pending_refresh', '', '', 0),
+            CSVItem('', '', 'success', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)
@@ -450,9 +701,9 @@ class TestCSVHandlerGetStatusSummary:
     def test_get_status_summary_with_empty_status(self):
         """Test summary with empty status values."""
         items = [
-            {'status': ''},
-            {'status': 'success'},
-            {'status': ''},
+            CSVItem('', '', '', '', '', 0),
+            CSVItem('', '', 'success', '', '', 0),
+            CSVItem('', '', '', '', '', 0),
         ]
         
         handler = CSVHandler.__new__(CSVHandler)
@@ -462,6 +713,25 @@ class TestCSVHandlerGetStatusSummary:
         assert summary['success'] == 1
 
 
+class TestCSVHandlerPartition:
+    """Test the fused filter + summary pass."""
+    
+    def test_partition_filters_and_counts_all_items(self):
+        """Test that the summary covers skipped items as well as kept ones."""
+        items = [
+            CSVItem('A', 'X', 'success', '', '', 0),
+            CSVItem('B', 'Y', '', '', '', 0),
+            CSVItem('C', 'Z', 'skip_no_musicbrainz', '', '', 0),
+            CSVItem('D', 'W', 'success', '', '', 0),
+        ]
+        
+        handler = CSVHandler.__new__(CSVHandler)
+        filtered, summary = handler.partition(items)
+        
+        assert [i.artist for i in filtered] == ['B']
+        assert summary == {'success': 2, '': 1, 'skip_no_musicbrainz': 1}
+
+
 class TestCSVHandlerIntegration:
     """Integration tests for full CSV workflows."""
     
@@ -9,6 +9,7 @@ from lib.exceptions import (
     LidarrImporterError,
     APIError,
     LidarrAPIError,
+    CircuitOpenError,
     MusicBrainzAPIError,
     RateLimitError,
     DataError,
@@ -37,6 +38,11 @@ class TestExceptionHierarchy:
         assert issubclass(LidarrAPIError, LidarrImporterError)
         assert issubclass(LidarrAPIError, Exception)
     
+    def test_circuit_open_error_inherits_from_lidarr_api_error(self):
+        """Test that CircuitOpenError inherits from LidarrAPIError."""
+        assert issubclass(CircuitOpenError, LidarrAPIError)
+        assert issubclass(CircuitOpenError, LidarrImporterError)
+    
     def test_musicbrainz_api_error_inherits_from_api_error(self):
         """Test that MusicBrainzAPIError inherits from APIError."""
         assert issubclass(MusicBrainzAPIError, APIError)
@@ -92,3 +92,13 @@ def test_read_and_write_rows_via_parser_utils(tmp_path: Path):
     assert backups
     r2, _ = parser_utils.read_csv_to_rows(p)
     assert r2[0]['status'] == 'done'
+
+
+def test_create_backup_preserves_bytes(tmp_path):
+    p = tmp_path / "sample.csv"
+    # BOM and CRLF line endings must survive unchanged
+    content = "\ufeffartist,album\r\nBjörk,Homogenic\r\n".encode('utf-8')
+    p.write_bytes(content)
+
+    backup_path = create_backup(p)
+    assert backup_path.read_bytes() == content
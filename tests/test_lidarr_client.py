@@ -1,3 +1,4 @@
+import json
 import requests
 import pytest
 import responses
@@ -5,6 +6,8 @@ import time
 from unittest.mock import Mock, patch
 from datetime import datetime
 
+from lib.exceptions import CircuitOpenError
+import lib.lidarr_client as lidarr_client_module
 from lib.lidarr_client import LidarrClient
 
 
@@ -37,16 +40,36 @@ class _DummyResp201:
 def test_get_headers_and_repr():
     c = LidarrClient("http://localhost:8686/", "APIKEY", 1, 1, "/music")
     assert c._get_headers() == {"X-Api-Key": "APIKEY"}
+    assert c._get_headers() is c._get_headers()
     assert "LidarrClient" in repr(c)
 
 
+def test_session_carries_api_key_and_closes():
+    c = LidarrClient("http://localhost:8686/", "APIKEY", 1, 1, "/music")
+    assert c._session.headers["X-Api-Key"] == "APIKEY"
+    assert c._session.get_adapter("https://example.org")._pool_maxsize == 16
+    c.close()
+
+
+@responses.activate
+def test_requests_reuse_session_headers():
+    c = LidarrClient("http://localhost:8686", "APIKEY", 1, 1, "/music", request_delay=0)
+    responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[], status=200)
+    responses.add(responses.GET, "http://localhost:8686/api/v1/artist", json=[], status=200)
+
+    c.get_all_albums()
+    c.get_existing_artists()
+
+    assert all(call.request.headers["X-Api-Key"] == "APIKEY" for call in responses.calls)
+
+
 def test_add_artist_already_exists(monkeypatch):
     c = LidarrClient("http://localhost:8686/", "K", 1, 1, "/root")
 
-    def fake_post(url, json=None, headers=None, timeout=None):
+    def fake_post(url, json=None, timeout=None):
         return _DummyResp400("Artist already exists")
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr(c._session, "post", fake_post)
 
     artist_data = {"artistName": "Test Artist"}
     result = c.add_artist(artist_data, monitor=False, search=False)
@@ -56,10 +79,10 @@ def test_add_artist_already_exists(monkeypatch):
 def test_add_album_returns_json_on_201(monkeypatch):
     c = LidarrClient("http://localhost:8686/", "K", 1, 1, "/root")
 
-    def fake_post(url, json=None, headers=None, timeout=None):
+    def fake_post(url, json=None, timeout=None):
         return _DummyResp201({"title": "AlbumX"})
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr(c._session, "post", fake_post)
 
     album = {"title": "AlbumX"}
     res = c.add_album(album, monitored=True, search=True)
@@ -79,6 +102,39 @@ def test_is_album_already_monitored_matches_by_title(monkeypatch):
     assert album == sample_album
 
 
+def test_is_album_already_monitored_reuses_library_index(monkeypatch):
+    c = LidarrClient("http://localhost:8686/", "K", 1, 1, "/root")
+    albums = [
+        {"title": "First", "artist": {"artistName": "The Band"}, "monitored": True},
+        {"title": "Second", "artist": {"artistName": "The Band"}, "monitored": False},
+    ]
+    fetches = []
+
+    def fake_get_all_albums():
+        fetches.append(1)
+        return albums
+
+    monkeypatch.setattr(c, "get_all_albums", fake_get_all_albums)
+
+    assert c.is_album_already_monitored("The Band", "First") == (True, albums[0])
+    assert c.is_album_already_monitored("The Band", "Second") == (False, albums[1])
+    assert c.is_album_already_monitored("Other Band", "First") == (False, None)
+    assert len(fetches) == 1
+
+
+def test_is_album_already_monitored_matches_mbid_via_index(monkeypatch):
+    c = LidarrClient("http://localhost:8686/", "K", 1, 1, "/root")
+    album = {"title": "Renamed", "releaseGroupId": "rg-1", "artist": {"artistName": "The Band"}, "monitored": True}
+
+    monkeypatch.setattr(c, "get_all_albums", lambda: [album])
+
+    matched, found = c.is_album_already_monitored(
+        "The Band", "Original Title", mb_search_func=lambda a, t: {"id": "rg-1"}
+    )
+    assert matched is True
+    assert found is album
+
+
 def test_monitor_album_by_mbid_existing_monitored(monkeypatch):
     c = LidarrClient("http://host", "key", 1, 1, "/root")
 
@@ -90,6 +146,31 @@ def test_monitor_album_by_mbid_existing_monitored(monkeypatch):
     assert res is True
 
 
+def test_monitor_album_by_mbid_uses_fresh_library_index(monkeypatch):
+    c = LidarrClient("http://host", "key", 1, 1, "/root")
+    existing = {"title": "T", "artist": {"artistName": "A"}, "artistId": 5,
+                "foreignAlbumId": "mbid1", "monitored": True}
+    monkeypatch.setattr(c, "get_all_albums", lambda: [existing])
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: pytest.fail("index should be used"))
+
+    c.is_album_already_monitored("A", "T")  # builds the index
+
+    assert c.monitor_album_by_mbid(5, "mbid1", "A", "T") is True
+
+
+def test_monitor_album_by_mbid_unknown_artist_falls_back_to_http(monkeypatch):
+    c = LidarrClient("http://host", "key", 1, 1, "/root")
+    monkeypatch.setattr(c, "get_all_albums", lambda: [])
+    fetched = []
+    existing = {"title": "T", "foreignAlbumId": "mbid1", "monitored": True}
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: fetched.append(artist_id) or [existing])
+
+    c.is_album_already_monitored("A", "T")
+
+    assert c.monitor_album_by_mbid(9, "mbid1", "A", "T") is True
+    assert fetched == [9]
+
+
 def test_monitor_album_by_mbid_existing_unmonitored_updates(monkeypatch):
     c = LidarrClient("http://host", "key", 1, 1, "/root")
 
@@ -107,7 +188,7 @@ def test_monitor_album_by_mbid_no_lookup_results(monkeypatch):
 
     monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [])
 
-    # monkeypatch requests.get for lookup to return an object with json() -> []
+    # monkeypatch the session GET for lookup to return an object with json() -> []
     class R:
         status_code = 200
         def raise_for_status(self):
@@ -115,7 +196,7 @@ def test_monitor_album_by_mbid_no_lookup_results(monkeypatch):
         def json(self):
             return []
 
-    monkeypatch.setattr("requests.get", lambda *args, **kwargs: R())
+    monkeypatch.setattr(c._session, "get", lambda *args, **kwargs: R())
 
     res = c.monitor_album_by_mbid(1, "missing-mbid", "A", "T")
     assert res is False
@@ -141,7 +222,7 @@ def test_monitor_album_by_mbid_lookup_name_match_fix(monkeypatch):
         def json(self):
             return [album_data]
 
-    monkeypatch.setattr("requests.get", lambda *args, **kwargs: R())
+    monkeypatch.setattr(c._session, "get", lambda *args, **kwargs: R())
 
     # get_artist_by_id should return the complete artist data used to patch album
     monkeypatch.setattr(c, "get_artist_by_id", lambda a: {"id": 99, "artistName": "The Band"})
@@ -152,6 +233,77 @@ def test_monitor_album_by_mbid_lookup_name_match_fix(monkeypatch):
     assert res is True
 
 
+def test_monitor_album_by_mbid_null_id_matches_ignoring_dots(monkeypatch):
+    c = LidarrClient("http://host", "key", 1, 1, "/root")
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [])
+
+    class R:
+        status_code = 200
+        def raise_for_status(self):
+            return None
+        def json(self):
+            return [{"title": "X", "artist": {"id": None, "artistName": "T.I."}, "foreignAlbumId": "m"}]
+
+    monkeypatch.setattr(c._session, "get", lambda *args, **kwargs: R())
+    monkeypatch.setattr(c, "get_artist_by_id", lambda a: {"id": 3, "artistName": "TI"})
+    monkeypatch.setattr(c, "add_album", lambda album, monitored=True, search=True: album)
+
+    assert c.monitor_album_by_mbid(3, "m", "TI", "X") is True
+
+
+def test_monitor_album_by_mbid_mbid_match_fetches_artist_once(monkeypatch):
+    c = LidarrClient("http://host", "key", 1, 1, "/root")
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [])
+
+    album_data = {
+        "title": "X",
+        "artist": {"id": 5, "artistName": "Band", "foreignArtistId": "artist-mbid"},
+        "foreignAlbumId": "mbid4"
+    }
+
+    class R:
+        status_code = 200
+        def raise_for_status(self):
+            return None
+        def json(self):
+            return [album_data]
+
+    monkeypatch.setattr(c._session, "get", lambda *args, **kwargs: R())
+
+    fetched = []
+
+    def fake_get_artist_by_id(artist_id):
+        fetched.append(artist_id)
+        return {"id": 42, "artistName": "Band", "foreignArtistId": "artist-mbid"}
+
+    monkeypatch.setattr(c, "get_artist_by_id", fake_get_artist_by_id)
+    added = []
+    monkeypatch.setattr(c, "add_album", lambda album, monitored=True, search=True: added.append(album) or album)
+
+    assert c.monitor_album_by_mbid(42, "mbid4", "Band", "X") is True
+    assert fetched == [42]
+    assert added[0]["artistId"] == 42
+
+
+def test_monitor_album_by_mbid_name_mismatch_skips_artist_fetch(monkeypatch):
+    c = LidarrClient("http://host", "key", 1, 1, "/root")
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [])
+
+    album_data = {"title": "X", "artist": {"id": None, "artistName": "Someone Else"}, "foreignAlbumId": "mbid5"}
+
+    class R:
+        status_code = 200
+        def raise_for_status(self):
+            return None
+        def json(self):
+            return [album_data]
+
+    monkeypatch.setattr(c._session, "get", lambda *args, **kwargs: R())
+    monkeypatch.setattr(c, "get_artist_by_id", lambda artist_id: pytest.fail("artist should not be fetched"))
+
+    assert c.monitor_album_by_mbid(42, "mbid5", "Band", "X") is False
+
+
 def test_monitor_album_exact_match_and_monitoring(monkeypatch):
     c = LidarrClient("http://host", "k", 1, 1, "/root")
 
@@ -180,6 +332,48 @@ def test_monitor_album_exact_match_not_monitored_updates_and_search(monkeypatch)
     assert called["search"] is True
 
 
+def test_monitor_album_edition_in_search_keeps_exact_match(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+
+    original = {"title": "Album", "monitored": False, "id": 1, "releaseDate": "2020-01-01"}
+    deluxe = {"title": "Album (Deluxe)", "monitored": False, "id": 2, "releaseDate": "2010-01-01"}
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [original, deluxe])
+    updated = []
+    monkeypatch.setattr(c, "update_album", lambda a: updated.append(a["id"]) or True)
+    monkeypatch.setattr(c, "search_for_album", lambda aid: True)
+
+    assert c.monitor_album(12, "Album (Deluxe)", "Artist") is True
+    assert updated == [2]
+
+
+def test_monitor_album_multiple_matches_prefers_newest(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+
+    original = {"title": "Album", "monitored": False, "id": 1, "releaseDate": "2010-01-01"}
+    undated = {"title": "Album (Remastered)", "monitored": False, "id": 2}
+    deluxe = {"title": "Album (Deluxe)", "monitored": False, "id": 3, "releaseDate": "2020-01-01"}
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [original, undated, deluxe])
+    updated = []
+    monkeypatch.setattr(c, "update_album", lambda a: updated.append(a["id"]) or True)
+    monkeypatch.setattr(c, "search_for_album", lambda aid: True)
+
+    assert c.monitor_album(12, "Album", "Artist") is True
+    assert updated == [3]
+
+
+def test_monitor_album_matches_casefolded_titles(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+
+    album = {"title": "STRASSE", "monitored": False, "id": 7}
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [album])
+    updated = []
+    monkeypatch.setattr(c, "update_album", lambda a: updated.append(a["id"]) or True)
+    monkeypatch.setattr(c, "search_for_album", lambda aid: True)
+
+    assert c.monitor_album(12, "Straße", "Artist") is True
+    assert updated == [7]
+
+
 def test_monitor_album_no_matches_triggers_refresh(monkeypatch):
     c = LidarrClient("http://host", "k", 1, 1, "/root")
     monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: [])
@@ -201,19 +395,20 @@ def test_unmonitor_all_albums_for_artist(monkeypatch):
         {"id": 3, "title": "C", "monitored": True},
     ]
 
-    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: albums)
-    updated = []
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id, refresh=False: albums)
+    calls = []
 
-    def fake_update(album):
-        updated.append(album.get("title"))
+    def fake_set_monitored(album_ids, monitored):
+        calls.append((album_ids, monitored))
         return True
 
-    monkeypatch.setattr(c, "update_album", fake_update)
+    monkeypatch.setattr(c, "set_albums_monitored", fake_set_monitored)
 
     res = c.unmonitor_all_albums_for_artist(10, "Artist")
     assert res is True
-    # Only monitored albums were updated
-    assert "A" in updated and "C" in updated
+    # Only monitored albums were updated, in a single bulk call
+    assert calls == [([1, 3], False)]
+    assert not any(a["monitored"] for a in albums)
 
 
 def test_unmonitor_all_except_specific_album_keep_target_by_mbid(monkeypatch):
@@ -224,20 +419,20 @@ def test_unmonitor_all_except_specific_album_keep_target_by_mbid(monkeypatch):
         {"id": 2, "title": "Other", "monitored": True, "foreignAlbumId": "MBIDX"},
     ]
 
-    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: albums)
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id, refresh=False: albums)
     unmonitored = []
 
-    def fake_update(album):
-        if not album.get('monitored'):
-            unmonitored.append(album.get('title'))
+    def fake_set_monitored(album_ids, monitored):
+        assert monitored is False
+        unmonitored.extend(album_ids)
         return True
 
-    monkeypatch.setattr(c, "update_album", fake_update)
+    monkeypatch.setattr(c, "set_albums_monitored", fake_set_monitored)
 
     res = c.unmonitor_all_except_specific_album(1, "MBIDT", "Artist", "Target")
     assert res is True
     # Other album should have been unmonitored
-    assert "Other" in unmonitored
+    assert unmonitored == [2]
 
 
 def test_unmonitor_all_except_specific_album_keep_target_by_title(monkeypatch):
@@ -249,31 +444,75 @@ def test_unmonitor_all_except_specific_album_keep_target_by_title(monkeypatch):
         {"id": 3, "title": "Other", "monitored": True, "foreignAlbumId": None},
     ]
 
-    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id: albums)
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id, refresh=False: albums)
     unmonitored = []
 
-    def fake_update(album):
-        if not album.get('monitored'):
-            unmonitored.append(album.get('title'))
+    def fake_set_monitored(album_ids, monitored):
+        unmonitored.extend(album_ids)
         return True
 
-    monkeypatch.setattr(c, "update_album", fake_update)
+    monkeypatch.setattr(c, "set_albums_monitored", fake_set_monitored)
 
     res = c.unmonitor_all_except_specific_album(1, "", "Artist", "Target Album")
     assert res is True
     # Other album should have been unmonitored
-    assert "Other" in unmonitored
+    assert 3 in unmonitored
+    assert 1 not in unmonitored
+
+
+def test_unmonitor_all_except_specific_album_title_contained_in_target(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+
+    albums = [
+        {"id": 1, "title": "Other", "monitored": True, "foreignAlbumId": "X"},
+        {"id": 2, "title": "Target", "monitored": True, "foreignAlbumId": "Y"},
+        {"id": 3, "title": "Target", "monitored": True, "foreignAlbumId": "Z"},
+    ]
+
+    monkeypatch.setattr(c, "get_artist_albums", lambda artist_id, refresh=False: albums)
+    unmonitored = []
+
+    def fake_set_monitored(album_ids, monitored):
+        unmonitored.extend(album_ids)
+        return True
+
+    monkeypatch.setattr(c, "set_albums_monitored", fake_set_monitored)
+
+    res = c.unmonitor_all_except_specific_album(1, "", "Artist", "Target (Remastered)")
+    assert res is True
+    # Only the first title match is kept
+    assert unmonitored == [1, 3]
+
+
+@responses.activate
+def test_set_albums_monitored_single_bulk_put():
+    c = LidarrClient("http://localhost:8686", "k", 1, 1, "/root", request_delay=0)
+    responses.add(responses.PUT, "http://localhost:8686/api/v1/album/monitor", json=[], status=202)
+
+    assert c.set_albums_monitored([4, 5, 6], False) is True
+    assert c.set_albums_monitored([], False) is True
+
+    assert len(responses.calls) == 1
+    assert json.loads(responses.calls[0].request.body) == {"albumIds": [4, 5, 6], "monitored": False}
+
+
+def _http_error(status, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    return requests.exceptions.HTTPError(f"{status} Error", response=resp)
 
 
-def test_retry_request_retries_on_503_and_succeeds():
+def test_retry_request_retries_on_503_and_succeeds(monkeypatch):
     c = LidarrClient("http://host", "k", 1, 1, "/root")
     c.max_retries = 4
     counter = {"n": 0}
+    monkeypatch.setattr(time, "sleep", lambda s: None)
 
     def flaky():
         if counter["n"] < 2:
             counter["n"] += 1
-            raise requests.exceptions.RequestException("503 Service Unavailable")
+            raise _http_error(503)
         return "ok"
 
     res = c._retry_request(flaky)
@@ -283,9 +522,10 @@ def test_retry_request_retries_on_503_and_succeeds():
 def test_retry_request_raises_after_max(monkeypatch):
     c = LidarrClient("http://host", "k", 1, 1, "/root")
     c.max_retries = 2
+    monkeypatch.setattr(time, "sleep", lambda s: None)
 
     def always_fail():
-        raise requests.exceptions.RequestException("503 Service Unavailable")
+        raise _http_error(503)
 
     try:
         c._retry_request(always_fail)
@@ -296,6 +536,175 @@ def test_retry_request_raises_after_max(monkeypatch):
     assert raised is True
 
 
+def test_retry_request_does_not_retry_client_errors(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+    calls = []
+    monkeypatch.setattr(time, "sleep", lambda s: pytest.fail("should not back off"))
+
+    def not_found():
+        calls.append(1)
+        raise _http_error(404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        c._retry_request(not_found)
+    assert len(calls) == 1
+
+
+def test_retry_request_retries_connection_errors(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+    counter = {"n": 0}
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+
+    def drop_once():
+        if counter["n"] == 0:
+            counter["n"] += 1
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return "ok"
+
+    assert c._retry_request(drop_once) == "ok"
+
+
+def test_retry_request_backoff_uses_full_jitter(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root", retry_delay=2.0)
+    c.max_retries = 4
+    sleeps = []
+    bounds = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    def fake_uniform(low, high):
+        bounds.append((low, high))
+        return high / 2
+
+    monkeypatch.setattr("lib.lidarr_client.random.uniform", fake_uniform)
+
+    def always_fail():
+        raise _http_error(503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        c._retry_request(always_fail)
+    assert bounds == [(0, 2.0), (0, 4.0), (0, 8.0)]
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_retry_request_circuit_opens_and_probes(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+    c.max_retries = 3
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise _http_error(503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        c._retry_request(down)
+    with pytest.raises(requests.exceptions.HTTPError):
+        c._retry_request(down)
+    assert len(calls) == 5  # breaker opened on the fifth consecutive failure
+
+    with pytest.raises(CircuitOpenError):
+        c._retry_request(down)
+    assert len(calls) == 5
+
+    # After the cooldown a single probe goes through and closes the circuit
+    now[0] += c._cb_cooldown
+    assert c._retry_request(lambda: "ok") == "ok"
+    assert c._cb_fail_count == 0
+    assert c._retry_request(lambda: "ok") == "ok"
+
+
+def test_retry_request_half_open_allows_a_single_probe(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+    c.max_retries = 3
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    c._cb_fail_count = c._cb_threshold
+    c._cb_opened_at = now[0]
+    now[0] += c._cb_cooldown
+    calls = []
+
+    def failing_probe():
+        calls.append(1)
+        # Other callers fail fast while the probe is in flight
+        with pytest.raises(CircuitOpenError):
+            c._retry_request(lambda: "ok")
+        raise _http_error(503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        c._retry_request(failing_probe)
+    assert len(calls) == 1  # the probe is not retried
+    # A failed probe re-opens the circuit for another full cooldown
+    with pytest.raises(CircuitOpenError):
+        c._retry_request(lambda: "ok")
+
+    now[0] += c._cb_cooldown
+    assert c._retry_request(lambda: "ok") == "ok"
+    assert not c._cb_probing
+
+
+def test_retry_request_honours_retry_after_with_cap(monkeypatch):
+    c = LidarrClient("http://host", "k", 1, 1, "/root")
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    errors = [_http_error(429, {"Retry-After": "7"}), _http_error(429, {"Retry-After": "600"})]
+
+    def limited():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert c._retry_request(limited) == "ok"
+    assert sleeps == [7.0, 60.0]
+
+
+class TestLidarrClientRateLimiting:
+    """Test token-bucket rate limiting."""
+    
+    def test_burst_then_paced(self, monkeypatch):
+        """A full bucket allows a burst, then requests wait for refill."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0.5, burst=2)
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        
+        client._wait_for_rate_limit()
+        client._wait_for_rate_limit()
+        assert sleeps == []
+        
+        client._wait_for_rate_limit()
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 0.5
+    
+    def test_wall_clock_jumps_do_not_affect_limiter(self, monkeypatch):
+        """The limiter runs on time.monotonic(), so NTP steps never cause odd sleeps."""
+        clock = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0.5, burst=1)
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+        
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        monkeypatch.setattr(time, "time", lambda: -1e9)
+        
+        for _ in range(3):
+            client._wait_for_rate_limit()
+        
+        assert len(sleeps) == 2
+        assert all(0 < s <= 0.5 for s in sleeps)
+    
+    def test_zero_delay_disables_limiting(self, monkeypatch):
+        """request_delay=0 never sleeps."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        monkeypatch.setattr(time, "sleep", lambda s: pytest.fail("should not sleep"))
+        for _ in range(10):
+            client._wait_for_rate_limit()
+
+
 class TestLidarrClientGetExistingArtists:
     """Test retrieving existing artists from Lidarr."""
     
@@ -330,6 +739,16 @@ class TestLidarrClientGetExistingArtists:
         assert result["taylor swift"]["id"] == 1
         assert result["the beatles"]["id"] == 2
     
+    @responses.activate
+    def test_get_existing_artists_without_orjson(self, monkeypatch):
+        """Falls back to the stdlib JSON decoder when orjson is missing."""
+        monkeypatch.setattr("lib.lidarr_client.orjson", None)
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist",
+                      json=[{"id": 1, "artistName": "Taylor Swift"}], status=200)
+        
+        assert client.get_existing_artists()["taylor swift"]["id"] == 1
+    
     @responses.activate
     def test_get_existing_artists_empty(self):
         """Test when no artists exist."""
@@ -376,6 +795,130 @@ class TestLidarrClientGetExistingArtists:
         assert result == {}
 
 
+class TestLidarrClientResponseCache:
+    """Test TTL caching of library listings."""
+    
+    @responses.activate
+    def test_get_all_albums_fetched_once_and_patched_on_update(self):
+        """Library listings are reused, and updates patch them instead of refetching."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1, "title": "A"}], status=200)
+        responses.add(responses.PUT, "http://localhost:8686/api/v1/album/1", json={}, status=202)
+        
+        assert client.get_all_albums() == client.get_all_albums()
+        assert len(responses.calls) == 1
+        
+        assert client.update_album({"id": 1, "title": "A", "monitored": True}) is True
+        assert client.get_all_albums() == [{"id": 1, "title": "A", "monitored": True}]
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_set_albums_monitored_patches_index(self):
+        """Bulk monitoring updates the cached library index in place."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        album = {"id": 1, "title": "A", "artistId": 3, "releaseGroupId": "rg",
+                 "artist": {"artistName": "X"}, "monitored": False}
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[album], status=200)
+        responses.add(responses.PUT, "http://localhost:8686/api/v1/album/monitor", json={}, status=202)
+        
+        assert client.is_album_already_monitored("X", "A")[0] is False
+        assert client.set_albums_monitored([1], True) is True
+        
+        assert client.is_album_already_monitored("X", "A")[0] is True
+        assert client._indexed_artist_albums(3)[0]["monitored"] is True
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_update_album_title_change_invalidates(self):
+        """Changing an indexed field drops the listings instead of patching them."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1, "title": "A"}], status=200)
+        responses.add(responses.PUT, "http://localhost:8686/api/v1/album/1", json={}, status=202)
+        
+        client.get_all_albums()
+        assert client.update_album({"id": 1, "title": "B"}) is True
+        client.get_all_albums()
+        assert len(responses.calls) == 3
+    
+    @responses.activate
+    def test_add_album_extends_cached_listing(self):
+        """A newly added album is appended to the cached listings."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1, "title": "A", "artistId": 3}], status=200)
+        responses.add(responses.POST, "http://localhost:8686/api/v1/album",
+                      json={"id": 2, "title": "B", "artistId": 3}, status=201)
+        
+        client.get_all_albums()
+        client.get_artist_albums(3)
+        assert client.add_album({"title": "B", "artistId": 3}) is not None
+        
+        assert [a["id"] for a in client.get_all_albums()] == [1, 2]
+        assert [a["id"] for a in client.get_artist_albums(3)] == [1, 2]
+        assert len(responses.calls) == 3
+    
+    @responses.activate
+    def test_get_artist_albums_cached_until_refresh(self):
+        """Back-to-back fetches for one artist hit Lidarr once; a refresh drops the entry."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1}], status=200)
+        responses.add(responses.POST, "http://localhost:8686/api/v1/command", json={}, status=201)
+        
+        client.get_artist_albums(3)
+        client.get_artist_albums(3)
+        client.get_artist_albums(4)
+        assert len(responses.calls) == 2
+        
+        assert client.refresh_artist(3) is True
+        client.get_artist_albums(3)
+        client.get_artist_albums(4)
+        assert len(responses.calls) == 4
+    
+    @responses.activate
+    def test_unmonitor_cleanup_rereads_albums_after_add(self):
+        """The post-add cleanup sees albums Lidarr monitored on its own."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        url = "http://localhost:8686/api/v1/album"
+        responses.add(responses.GET, url, json=[{"id": 1, "title": "A", "artistId": 3, "monitored": False}], status=200)
+        responses.add(responses.POST, url, json={"id": 2, "title": "B", "artistId": 3, "monitored": True,
+                                                 "foreignAlbumId": "MBID-B"}, status=201)
+        responses.add(responses.GET, url, json=[
+            {"id": 1, "title": "A", "artistId": 3, "monitored": True},
+            {"id": 2, "title": "B", "artistId": 3, "monitored": True, "foreignAlbumId": "MBID-B"},
+        ], status=200)
+        responses.add(responses.PUT, "http://localhost:8686/api/v1/album/monitor", json={}, status=202)
+        
+        client.get_artist_albums(3)
+        assert client.add_album({"title": "B", "artistId": 3}) is not None
+        assert client.unmonitor_all_except_specific_album(3, "MBID-B", "Artist", "B") is True
+        
+        assert [c.request.method for c in responses.calls] == ["GET", "POST", "GET", "PUT"]
+        assert json.loads(responses.calls[3].request.body) == {"albumIds": [1], "monitored": False}
+    
+    @responses.activate
+    def test_get_artist_by_id_cached_per_id(self):
+        """Repeated artist fetches for the same ID hit Lidarr once."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist/7", json={"id": 7}, status=200)
+        
+        assert client.get_artist_by_id(7) == {"id": 7}
+        assert client.get_artist_by_id(7) == {"id": 7}
+        assert len(responses.calls) == 1
+    
+    @responses.activate
+    def test_failed_fetch_is_not_cached(self):
+        """Errors fall back to an empty result without poisoning the cache."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist", status=500)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist", json=[{"artistName": "X"}], status=200)
+        
+        assert client.get_existing_artists() == {}
+        assert "x" in client.get_existing_artists()
+        
+        client.invalidate()
+        client.get_existing_artists()
+        assert len(responses.calls) == 3
+
+
 class TestLidarrClientArtistLookup:
     """Test artist lookup functionality."""
     
@@ -408,6 +951,19 @@ class TestLidarrClientArtistLookup:
         assert result["artistName"] == "Taylor Swift"
         assert result["foreignArtistId"] == "abc123"
     
+    @responses.activate
+    def test_artist_lookup_mbid_single_request_then_name(self):
+        """An empty MBID lookup falls straight through to the name search."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist/lookup", json=[], status=200)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist/lookup",
+                      json=[{"artistName": "Taylor Swift"}], status=200)
+        
+        result = client.artist_lookup("Taylor Swift", musicbrainz_id="abc123")
+        
+        assert result == {"artistName": "Taylor Swift"}
+        assert [c.request.params["term"] for c in responses.calls] == ["lidarr:abc123", "Taylor Swift"]
+    
     @responses.activate
     def test_artist_lookup_by_name_only(self):
         """Test artist lookup by name only."""
@@ -458,6 +1014,96 @@ class TestLidarrClientArtistLookup:
         assert result is None
 
 
+class TestLidarrClientConditionalGet:
+    """Test ETag / body-digest reuse of library listings."""
+    
+    @responses.activate
+    def test_etag_sent_and_304_reuses_body(self):
+        """A 304 answer returns the previously parsed listing."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        url = "http://localhost:8686/api/v1/album"
+        responses.add(responses.GET, url, json=[{"id": 1}], status=200, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
+        
+        first = client.get_artist_albums(3)
+        client._albums_cache.clear()  # as if the per-artist TTL expired
+        second = client.get_artist_albums(3)
+        
+        assert second is first
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    
+    @responses.activate
+    def test_unchanged_body_skips_parse(self, monkeypatch):
+        """Without ETags, an identical body is not parsed again."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1}], status=200)
+        parses = []
+        real_parse = lidarr_client_module._parse_json
+        monkeypatch.setattr(lidarr_client_module, "_parse_json", lambda r: parses.append(1) or real_parse(r))
+        
+        first = client.get_artist_albums(3)
+        client._albums_cache.clear()
+        assert client.get_artist_albums(3) is first
+        assert len(parses) == 1
+    
+    @responses.activate
+    def test_update_album_drops_stored_bodies(self):
+        """Modified album dicts are never served back after an update."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album", json=[{"id": 1, "monitored": False}], status=200)
+        responses.add(responses.PUT, "http://localhost:8686/api/v1/album/1", status=500)
+        
+        album = client.get_artist_albums(3)[0]
+        album["monitored"] = True
+        assert client.update_album(album) is False
+        
+        assert client.get_artist_albums(3)[0]["monitored"] is False
+
+
+class TestLidarrClientLookupCache:
+    """Test memoization of artist and album lookups."""
+    
+    @responses.activate
+    def test_artist_lookup_memoized_by_name(self):
+        """Repeated lookups of the same artist hit Lidarr once, case-insensitively."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/artist/lookup",
+                      json=[{"artistName": "The Beatles"}], status=200)
+        
+        first = client.artist_lookup("The Beatles")
+        second = client.artist_lookup("the beatles")
+        assert first == second == {"artistName": "The Beatles"}
+        assert len(responses.calls) == 1
+    
+    @responses.activate
+    def test_not_found_expires_sooner(self, monkeypatch):
+        """Empty results are cached, but only for the negative TTL."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album/lookup", json=[], status=200)
+        
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        
+        assert client.album_lookup("A", "T") is None
+        assert client.album_lookup("a", "t") is None
+        assert len(responses.calls) == 1
+        
+        now[0] += 61
+        client.album_lookup("A", "T")
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_lookup_errors_are_not_cached(self):
+        """Failed lookups are retried on the next call."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album/lookup", status=500)
+        responses.add(responses.GET, "http://localhost:8686/api/v1/album/lookup", json=[{"title": "T"}], status=200)
+        
+        assert client.album_lookup("A", "T") is None
+        assert client.album_lookup("A", "T") == [{"title": "T"}]
+
+
 class TestLidarrClientAddArtist:
     """Test adding artists to Lidarr."""
     
@@ -669,6 +1315,28 @@ class TestLidarrClientSearchAlbum:
         assert result is True
 
 
+    @responses.activate
+    def test_search_for_albums_batches_commands(self):
+        """Album IDs are sent in chunks, one command per chunk."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.POST, "http://localhost:8686/api/v1/command", json={"id": 1}, status=201)
+        
+        assert client.search_for_albums(list(range(1, 121)), chunk=50) == 120
+        
+        sent = [json.loads(call.request.body)["albumIds"] for call in responses.calls]
+        assert [len(ids) for ids in sent] == [50, 50, 20]
+        assert sent[2][-1] == 120
+    
+    @responses.activate
+    def test_search_for_albums_counts_failed_chunks_out(self):
+        """A failed command does not stop later chunks."""
+        client = LidarrClient("http://localhost:8686", "test-key", 1, 1, "/music", request_delay=0)
+        responses.add(responses.POST, "http://localhost:8686/api/v1/command", status=400)
+        responses.add(responses.POST, "http://localhost:8686/api/v1/command", json={"id": 2}, status=201)
+        
+        assert client.search_for_albums([1, 2, 3], chunk=2) == 1
+
+
 class TestLidarrClientRefreshArtist:
     """Test artist metadata refresh."""
     
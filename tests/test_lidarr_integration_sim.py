@@ -8,6 +8,8 @@ class FakeResponse:
         self.status_code = status_code
         self._json = json_obj
         self.text = text or (json.dumps(json_obj) if json_obj is not None else '')
+        self.content = self.text.encode()
+        self.headers = {}
 
     def json(self):
         return self._json
@@ -58,11 +60,11 @@ def test_monitor_album_by_mbid_success(monkeypatch):
             return FakeResponse(200, {'message': 'ok'})
         return FakeResponse(404, None, 'not found')
 
-    monkeypatch.setattr('requests.get', fake_get)
-    monkeypatch.setattr('requests.post', fake_post)
-
     client = LidarrClient(base_url='http://localhost:8686', api_key='key', quality_profile_id=1, metadata_profile_id=1, root_folder_path='/music')
 
+    monkeypatch.setattr(client._session, 'get', fake_get)
+    monkeypatch.setattr(client._session, 'post', fake_post)
+
     result = client.monitor_album_by_mbid(artist_id=123, musicbrainz_album_id='mbid1', artist_name='Artist', album_title='Test Album')
     assert result is True
     # verify we did the lookup and then posted to add album
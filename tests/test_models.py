@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+
+from lib.models import AlbumEntry
+
+
+def test_album_entry_equality_ignores_case():
+    a = AlbumEntry(artist="The Band", album="Some Album")
+    b = AlbumEntry(artist="the band", album="SOME ALBUM", source_format="text_dash")
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_album_entry_key_follows_reassigned_fields():
+    entry = AlbumEntry(artist="Old", album="Album")
+    entry.artist = "New"
+
+    assert entry == AlbumEntry(artist="new", album="album")
+    assert entry != AlbumEntry(artist="old", album="album")
+
+
+def test_album_entry_key_computed_once_per_source(monkeypatch):
+    import lib.models as models
+
+    calls = []
+    real_normalize = models.unicodedata.normalize
+
+    def counting_normalize(form, value):
+        calls.append(value)
+        return real_normalize(form, value)
+
+    monkeypatch.setattr(models.unicodedata, "normalize", counting_normalize)
+    entry = AlbumEntry(artist="A", album="B", album_search="B", source_format="x")
+    assert len(calls) == 2
+
+    entry.risk_reason = "r"
+    hash(entry)
+    assert len(calls) == 2
+
+    entry.album = "C"
+    hash(entry)
+    hash(entry)
+    assert len(calls) == 4
+
+
+def test_album_entry_key_not_in_repr():
+    assert "_key" not in repr(AlbumEntry(artist="A", album="B"))
+
+
+def test_album_entry_folds_unicode_normalization_forms():
+    composed = AlbumEntry(artist="Beyonc\u00e9", album="Lemonade")
+    decomposed = AlbumEntry(artist="Beyonce\u0301", album="Lemonade")
+
+    assert composed == decomposed
+    assert len({composed, decomposed}) == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_album_entry_uses_slots():
+    entry = AlbumEntry(artist="A", album="B")
+
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.not_a_field = 1
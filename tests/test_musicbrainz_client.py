@@ -6,11 +6,11 @@ canonical test file for easier maintenance.
 """
 import sys
 from pathlib import Path
-import xml.etree.ElementTree as ET
 import time
 import re
 
 import pytest
+import requests
 import responses
 from unittest.mock import patch, Mock
 
@@ -45,6 +45,29 @@ class TestMusicBrainzClientInit:
         client = MusicBrainzClient(user_agent=user_agent)
         assert 'User-Agent' in client.session.headers
 
+    @pytest.mark.unit
+    def test_init_mounts_pooled_adapter(self):
+        client = MusicBrainzClient()
+        adapter = client.session.get_adapter('https://musicbrainz.org/ws/2/artist')
+        assert adapter._pool_maxsize == 16
+
+    def test_init_uses_shared_session(self):
+        shared = requests.Session()
+        client = MusicBrainzClient(session=shared)
+
+        assert client.session is shared
+        assert 'lidarr-album-import-script' in shared.headers['User-Agent']
+        with patch.object(shared, 'close') as close:
+            client.close()
+        close.assert_not_called()
+
+    def test_init_retries_failed_connections_only(self):
+        client = MusicBrainzClient()
+        retry = client.session.get_adapter('https://musicbrainz.org/ws/2/artist').max_retries
+        assert retry.connect == 2
+        assert retry.read == 0
+        assert retry.status == 0
+
 
 class TestRateLimiting:
     @pytest.mark.unit
@@ -55,32 +78,74 @@ class TestRateLimiting:
         client._wait_for_rate_limit()
         assert time.time() - start >= 0.9
 
+    @pytest.mark.unit
+    def test_rate_limit_reserves_consecutive_slots(self, monkeypatch):
+        import lib.musicbrainz_client as mb_module
+
+        client = MusicBrainzClient(delay=1.0)
+        sleeps = []
+        monkeypatch.setattr(mb_module.time, 'monotonic', lambda: 100.0)
+        monkeypatch.setattr(mb_module.time, 'sleep', sleeps.append)
+
+        # Callers arriving together (e.g. from worker threads) each get
+        # their own slot instead of all waking at the same moment
+        for _ in range(3):
+            client._wait_for_rate_limit()
+        assert sleeps == [1.0, 2.0]
+
 
 class TestMakeRequest:
     @pytest.mark.unit
     @responses.activate
     def test_make_request_success(self):
         client = MusicBrainzClient(delay=0.1)
-        xml_response = '''<?xml version="1.0"?>
-<metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">
-    <artist-list count="1" offset="0">
-        <artist id="test-id" type="Group">
-            <name>Test Artist</name>
-        </artist>
-    </artist-list>
-</metadata>'''
-        responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', body=xml_response, status=200, content_type='application/xml')
+        body = {'artists': [{'id': 'test-id', 'type': 'Group', 'name': 'Test Artist'}]}
+        responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', json=body, status=200)
         result = client._make_request('artist', {'query': 'test'})
-        assert result is not None
+        assert result == body
 
+    @pytest.mark.unit
+    @responses.activate
+    def test_make_request_non_json_body_returns_none(self):
+        client = MusicBrainzClient(delay=0.1)
+        responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', body='<metadata/>', status=200, content_type='application/xml')
+        assert client._make_request('artist', {'query': 'test'}) is None
 
     @pytest.mark.unit
     @responses.activate
-    def test_make_request_503_rate_limited(self):
+    def test_make_request_503_rate_limited(self, monkeypatch):
+        import lib.musicbrainz_client as mb_module
+
+        monkeypatch.setattr(mb_module.time, 'sleep', lambda s: None)
         client = MusicBrainzClient(delay=0.1)
         responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', body='Rate limit exceeded', status=503)
         result = client._make_request('artist', {'query': 'test'})
         assert result is None
+        # Initial attempt plus max_retries retries
+        assert len(responses.calls) == client.max_retries + 1
+
+    @pytest.mark.unit
+    @responses.activate
+    def test_make_request_retries_503_honouring_retry_after(self, monkeypatch):
+        import lib.musicbrainz_client as mb_module
+
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(mb_module.time, 'monotonic', lambda: clock[0])
+        monkeypatch.setattr(mb_module.time, 'sleep', fake_sleep)
+        client = MusicBrainzClient(delay=1.0)
+        url = 'https://musicbrainz.org/ws/2/artist'
+        responses.add(responses.GET, url, status=503, headers={'Retry-After': '5'})
+        responses.add(responses.GET, url, json={'artists': []}, status=200)
+
+        assert client._make_request('artist', {'query': 'test'}) == {'artists': []}
+        assert len(responses.calls) == 2
+        assert sleeps == [5.0]
 
 
 class TestSearchArtists:
@@ -88,16 +153,14 @@ class TestSearchArtists:
     @responses.activate
     def test_search_artists_success(self):
         client = MusicBrainzClient(delay=0.1)
-        xml_response = '''<?xml version="1.0" encoding="UTF-8"?>
-<metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#" xmlns:ext="http://musicbrainz.org/ns/ext#-2.0">
-    <artist-list count="2">
-        <artist id="artist-1" ext:score="100"><name>Son Lux</name></artist>
-        <artist id="artist-2" ext:score="90"><name>Son Lux Trio</name></artist>
-    </artist-list>
-</metadata>'''
-        responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', body=xml_response, status=200)
+        body = {'artists': [
+            {'id': 'artist-1', 'score': 100, 'name': 'Son Lux'},
+            {'id': 'artist-2', 'score': 90, 'name': 'Son Lux Trio'},
+        ]}
+        responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', json=body, status=200)
         result = client.search_artists('Son Lux', limit=5)
         assert 'artist-list' in result
+        assert result['artist-list'][0]['id'] == 'artist-1'
 
 
 @responses.activate
@@ -122,6 +185,22 @@ def test_search_release_groups_json_prefers_spotify_relation():
         assert result[0].get('id') == 'rg-spotify-match'
 
 
+@responses.activate
+def test_search_release_groups_requests_json():
+    client = MusicBrainzClient()
+    client.min_delay = 0.0
+    body = {'release-groups': [{'id': 'rg-1', 'title': 'Album', 'score': 100, 'artist-credit': [{'name': 'Artist', 'artist': {'name': 'Artist'}}]}]}
+    url_re = re.compile(r'https://musicbrainz.org/ws/2/release-group.*')
+    responses.add(responses.GET, url_re, json=body, status=200)
+
+    result = client.search_release_groups('Artist', 'Album')
+
+    assert result['release-group-list'][0]['id'] == 'rg-1'
+    request = responses.calls[0].request
+    assert 'fmt=json' in request.url
+    assert request.headers['Accept'] == 'application/json'
+
+
 def test_generate_title_variations_basic():
     client = MusicBrainzClient()
     variations = client._generate_title_variations('ep seeds')
@@ -147,8 +226,8 @@ def test_search_release_groups_prefers_stripped_title():
     assert result['release-group-list'][0]['id'] == 'rg-seeds'
 
 
-# Additional tests: XML parsing, _make_request error paths, and extra artist-match edge cases
-def test_extract_artists_from_root_with_json_and_xml():
+# Additional tests: response parsing, _make_request error paths, and extra artist-match edge cases
+def test_extract_artists_from_root_with_json():
         client = MusicBrainzClient()
 
         # JSON-style input
@@ -157,57 +236,16 @@ def test_extract_artists_from_root_with_json_and_xml():
         assert isinstance(artists, list)
         assert artists and artists[0].get('id') == 'a1'
 
-        # XML-style input: craft a minimal MB-like XML
-        xml_text = '''<?xml version="1.0"?>
-        <metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">
-            <artist-list>
-                <artist id="xml-1"><name>XML Artist</name></artist>
-            </artist-list>
-        </metadata>'''
-        root = ET.fromstring(xml_text)
-        artists_xml = client._extract_artists_from_root(root, 'XML Artist')
-        assert isinstance(artists_xml, list)
-        assert artists_xml and artists_xml[0].get('id') == 'xml-1'
-
-
-def test_parse_release_groups_xml_filters_and_parses():
-        client = MusicBrainzClient()
-
-        xml_text = '''<?xml version="1.0"?>
-        <metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">
-            <release-group-list>
-                <release-group id="rg-parse-1">
-                    <title>Parsed Album</title>
-                    <artist-credit>
-                        <name-credit>
-                            <artist><name>Parse Artist</name></artist>
-                        </name-credit>
-                    </artist-credit>
-                    <first-release-date>2020-01-01</first-release-date>
-                </release-group>
-            </release-group-list>
-        </metadata>'''
-
-        root = ET.fromstring(xml_text)
-        ns = {'mb': 'http://musicbrainz.org/ns/mmd-2.0#'}
-        rgs = root.findall('.//mb:release-group', ns)
-
-        parsed = client._parse_release_groups(rgs, ns, 'Parse Artist', {})
-        assert isinstance(parsed, list)
-        assert parsed and parsed[0].get('id') == 'rg-parse-1'
-
-        # Ensure artist mismatch filters out results
-        parsed_none = client._parse_release_groups(rgs, ns, 'Other Artist', {})
-        assert parsed_none == []
-
 
 def test_make_request_handles_timeout_and_503(monkeypatch):
         client = MusicBrainzClient(delay=0.0)
+        monkeypatch.setattr('lib.musicbrainz_client.time.sleep', lambda s: None)
 
         class DummyResp:
                 def __init__(self, status_code=503, text='err'):
                         self.status_code = status_code
                         self.text = text
+                        self.headers = {}
 
                 def raise_for_status(self):
                         from requests import HTTPError
@@ -401,30 +439,244 @@ def test_search_release_groups_volume_handling_and_no_match(monkeypatch):
     assert res2.get('release-group-list') == []
 
 
-def test_parse_release_groups_exact_title_preference():
+def test_search_release_groups_ranks_by_title_similarity(monkeypatch):
+    client = MusicBrainzClient()
+
+    def fake_make_request(endpoint, params):
+        return {
+            'release-groups': [
+                {'id': 'rg-far', 'title': 'Something Else Entirely', 'artist-credit-phrase': 'Rank Artist', 'ext:score': '100'},
+                {'id': 'rg-near', 'title': 'Night Drive Sessions', 'artist-credit-phrase': 'Rank Artist', 'ext:score': '60'},
+                {'id': 'rg-mid', 'title': 'Night Sessions', 'artist-credit-phrase': 'Rank Artist', 'ext:score': '90'},
+            ]
+        }
+
+    monkeypatch.setattr(client, '_make_request', fake_make_request)
+    res = client.search_release_groups('Rank Artist', 'Night Drive')
+
+    ids = [rg['id'] for rg in res['release-group-list']]
+    assert ids[0] == 'rg-near'
+    assert ids[-1] == 'rg-far'
+
+
+def test_is_artist_match_reuses_memoized_normalization():
+    import lib.musicbrainz_client as mb_module
+
+    client = MusicBrainzClient()
+    client._is_artist_match('Memo Credit', 'Memo Artist', {})
+    hits = mb_module._norm.cache_info().hits
+    client._is_artist_match('Memo Credit', 'Memo Artist', {})
+
+    assert mb_module._norm.cache_info().hits == hits + 2
+
+
+def test_search_release_groups_skips_case_only_title_variations(monkeypatch):
+    client = MusicBrainzClient()
+    queried_titles = []
+
+    def fake_make_request(endpoint, params):
+        queried_titles.append(params['query'])
+        return None
+
+    monkeypatch.setattr(client, '_make_request', fake_make_request)
+    client.search_release_groups('Some Artist', 'ep seeds', artist_mbid='mbid-1')
+
+    # 'Ep Seeds' and 'EP SEEDS'-style variants repeat 'ep seeds' case-insensitively
+    assert not any('Ep Seeds' in q for q in queried_titles)
+    assert any('"ep seeds"' in q for q in queried_titles)
+    assert any('"seeds"' in q for q in queried_titles)
+
+
+def test_search_release_groups_skips_unicode_form_title_variations(monkeypatch):
+    client = MusicBrainzClient()
+    queried_titles = []
+
+    def fake_make_request(endpoint, params):
+        queried_titles.append(params['query'])
+        return None
+
+    monkeypatch.setattr(client, '_make_request', fake_make_request)
+    monkeypatch.setattr(
+        client, '_generate_title_variations', lambda title: ['Caf\u00e9 Tacvba', 'Cafe\u0301 Tacvba']
+    )
+    client.search_release_groups('Some Artist', 'Caf\u00e9 Tacvba', artist_mbid='mbid-1')
+
+    assert not any('Cafe\u0301' in q for q in queried_titles)
+
+
+def test_search_release_groups_arid_results_skip_artist_name_filter(monkeypatch):
+    client = MusicBrainzClient()
+    queries = []
+
+    def fake_make_request(endpoint, params):
+        queries.append(params['query'])
+        # Credit spelled differently from the CSV artist name
+        return {'release-groups': [{'id': 'rg-arid', 'title': 'Album', 'artist-credit-phrase': 'Совсем Другое', 'ext:score': '100'}]}
+
+    monkeypatch.setattr(client, '_make_request', fake_make_request)
+    res = client.search_release_groups('Transliterated Artist', 'Album', artist_mbid='mbid-1')
+
+    assert res['release-group-list'][0]['id'] == 'rg-arid'
+    assert queries == ['arid:mbid-1 AND releasegroup:"Album"']
+
+
+def test_search_artists_falls_back_to_relaxed_similarity(monkeypatch):
+    client = MusicBrainzClient()
+    body = {'artists': [
+        {'id': 'relaxed', 'name': 'The Son Lux Band', 'score': 90},
+        {'id': 'far', 'name': 'Sun Locks', 'score': 95},
+    ]}
+    monkeypatch.setattr(client, '_make_request', lambda endpoint, params: body)
+
+    result = client.search_artists('Son Lux')
+
+    # Nothing reaches MIN_ARTIST_SIMILARITY; only the >= relaxed cutoff match survives
+    assert [a['id'] for a in result['artist-list']] == ['relaxed']
+
+
+def test_search_artists_prefers_candidates_keeping_search_prefix(monkeypatch):
+    client = MusicBrainzClient()
+    body = {'artists': [
+        {'id': 'bare', 'name': 'Shadows', 'score': 100},
+        {'id': 'prefixed', 'name': 'DJ Shadow', 'score': 80},
+    ]}
+    monkeypatch.setattr(client, '_make_request', lambda endpoint, params: body)
+
+    result = client.search_artists('DJ Shadows')
+
+    assert [a['id'] for a in result['artist-list']] == ['prefixed', 'bare']
+    assert all('similarity' not in a for a in result['artist-list'])
+
+
+def test_search_release_groups_exact_matches_tolerate_non_numeric_scores(monkeypatch):
+    client = MusicBrainzClient()
+    body = {'release-groups': [
+        {'id': 'rg-odd', 'title': 'Album', 'artist-credit-phrase': 'Score Artist', 'ext:score': 'n/a'},
+        {'id': 'rg-best', 'title': 'Album', 'artist-credit-phrase': 'Score Artist', 'ext:score': '95'},
+    ]}
+    monkeypatch.setattr(client, '_make_request', lambda endpoint, params: body)
+
+    res = client.search_release_groups('Score Artist', 'Album')
+
+    assert [rg['id'] for rg in res['release-group-list']] == ['rg-best', 'rg-odd']
+
+
+def test_batch_search_release_groups_preserves_order(monkeypatch):
+    client = MusicBrainzClient()
+
+    def fake_search(artist, releasegroup, **kwargs):
+        time.sleep(0.01 if artist == 'First' else 0)
+        return {'release-group-list': [{'id': f'{artist}-{releasegroup}', **kwargs}]}
+
+    monkeypatch.setattr(client, 'search_release_groups', fake_search)
+    results = client.batch_search_release_groups([
+        {'artist': 'First', 'releasegroup': 'A'},
+        {'artist': 'Second', 'releasegroup': 'B', 'artist_mbid': 'm2'},
+    ])
+    client.close()
+
+    assert [r['release-group-list'][0]['id'] for r in results] == ['First-A', 'Second-B']
+    assert results[1]['release-group-list'][0]['artist_mbid'] == 'm2'
+
+
+def test_build_release_group_queries_skips_redundant_unquoted_artist():
     client = MusicBrainzClient()
 
-    # Build two release-group XML elements with same artist credit but different titles/scores
-    ns = {'mb': 'http://musicbrainz.org/ns/mmd-2.0#'}
-    rg1 = ET.Element('{http://musicbrainz.org/ns/mmd-2.0#}release-group', {'id': 'rg-a', '{http://musicbrainz.org/ns/ext#-2.0}score': '50'})
-    t1 = ET.SubElement(rg1, '{http://musicbrainz.org/ns/mmd-2.0#}title')
-    t1.text = 'Exact Album'
-    ac1 = ET.SubElement(rg1, '{http://musicbrainz.org/ns/mmd-2.0#}artist-credit')
-    nc1 = ET.SubElement(ac1, '{http://musicbrainz.org/ns/mmd-2.0#}name-credit')
-    art1 = ET.SubElement(nc1, '{http://musicbrainz.org/ns/mmd-2.0#}artist')
-    name1 = ET.SubElement(art1, '{http://musicbrainz.org/ns/mmd-2.0#}name')
-    name1.text = 'Exact Artist'
-
-    rg2 = ET.Element('{http://musicbrainz.org/ns/mmd-2.0#}release-group', {'id': 'rg-b', '{http://musicbrainz.org/ns/ext#-2.0}score': '90'})
-    t2 = ET.SubElement(rg2, '{http://musicbrainz.org/ns/mmd-2.0#}title')
-    t2.text = 'Similar Album'
-    ac2 = ET.SubElement(rg2, '{http://musicbrainz.org/ns/mmd-2.0#}artist-credit')
-    nc2 = ET.SubElement(ac2, '{http://musicbrainz.org/ns/mmd-2.0#}name-credit')
-    art2 = ET.SubElement(nc2, '{http://musicbrainz.org/ns/mmd-2.0#}artist')
-    name2 = ET.SubElement(art2, '{http://musicbrainz.org/ns/mmd-2.0#}name')
-    name2.text = 'Exact Artist'
-
-    parsed = client._parse_release_groups([rg1, rg2], {'mb': ns['mb'], 'ns2': 'http://musicbrainz.org/ns/ext#-2.0'}, 'Exact Artist', {}, title_searched='Exact Album')
-    assert isinstance(parsed, list)
-    assert parsed and parsed[0]['title'].lower() == 'exact album'
+    single_word = client._build_release_group_queries('Eevee', 'Seeds')
+    assert single_word == ['artist:"Eevee" AND releasegroup:"Seeds"']
+
+    multi_word = client._build_release_group_queries('Son Lux', 'Brighter Wounds')
+    assert multi_word == [
+        'artist:"Son Lux" AND releasegroup:"Brighter Wounds"',
+        'artist:Son Lux AND releasegroup:"Brighter Wounds"',
+    ]
+
+
+def test_extract_artists_scores_all_names_in_one_pass():
+    client = MusicBrainzClient()
+    root = {'artists': [
+        {'id': 'a1', 'name': 'Eevee', 'score': 100},
+        {'id': 'a2', 'name': 'Completely Different', 'score': 80},
+        {'id': 'a3', 'name': None, 'score': 50},
+    ]}
+
+    artists = client._extract_artists_from_root(root, 'eevee')
+
+    assert [a['id'] for a in artists] == ['a1', 'a2', 'a3']
+    assert artists[0]['similarity'] == 100
+    assert artists[1]['similarity'] == 0
+    assert artists[2]['similarity'] == 0
+
+
+def test_is_artist_match_exact_credit_skips_normalization(monkeypatch):
+    client = MusicBrainzClient()
+
+    def fail(_):
+        raise AssertionError("normalizer should not run for identical names")
+
+    monkeypatch.setattr('lib.musicbrainz_client._norm', fail)
+
+    assert client._is_artist_match('Eevee', 'Eevee', {}) is True
+
+
+@responses.activate
+def test_make_request_always_asks_for_json():
+    client = MusicBrainzClient()
+    client.min_delay = 0.0
+    responses.add(responses.GET, 'https://musicbrainz.org/ws/2/artist', json={'artists': []}, status=200)
 
+    params = {'query': 'artist:"Eevee"'}
+    client._make_request('artist', params)
+
+    assert 'fmt=json' in responses.calls[0].request.url
+    assert params == {'query': 'artist:"Eevee"'}
+
+
+def test_merge_into_collected_keeps_best_values():
+    collected = {}
+    MusicBrainzClient._merge_into_collected(
+        collected, [{'id': 'a1', 'name': 'Eevee', 'ext:score': '80', 'similarity': 90}], is_quoted=False
+    )
+    MusicBrainzClient._merge_into_collected(
+        collected, [{'id': 'a1', 'name': 'Eevee', 'ext:score': '95', 'similarity': 70}], is_quoted=True
+    )
+
+    assert collected == {
+        'a1': {'id': 'a1', 'name': 'Eevee', 'ext:score': '95', 'similarity': 90, 'is_quoted': True}
+    }
+
+
+def test_merge_into_collected_ignores_non_numeric_scores():
+    collected = {'a1': {'id': 'a1', 'name': 'Eevee', 'ext:score': 'n/a', 'similarity': 90, 'is_quoted': True}}
+    MusicBrainzClient._merge_into_collected(
+        collected, [{'id': 'a1', 'name': 'Eevee', 'ext:score': '60', 'similarity': 90}], is_quoted=True
+    )
+    MusicBrainzClient._merge_into_collected(
+        collected, [{'id': 'a1', 'name': 'Eevee', 'ext:score': None, 'similarity': 90}], is_quoted=True
+    )
+
+    assert collected['a1']['ext:score'] == '60'
+
+
+def test_generate_title_variations_strips_prefix_case_insensitively():
+    client = MusicBrainzClient()
+
+    assert 'Seeds' in client._generate_title_variations('EP Seeds')
+    assert 'Wall' in client._generate_title_variations(' The Wall')
+    assert client._generate_title_variations('Theory')[0] == 'Theory'
+    assert 'ory' not in client._generate_title_variations('Theory')
+
+
+def test_generate_title_variations_is_memoized():
+    import lib.musicbrainz_client as mb_module
+
+    client = MusicBrainzClient()
+    first = client._generate_title_variations('memo title')
+    hits = mb_module._title_variations.cache_info().hits
+    second = client._generate_title_variations('memo title')
+
+    assert second == first
+    assert mb_module._title_variations.cache_info().hits == hits + 1
+    # Callers get their own list; the cached tuple cannot be mutated through it
+    second.append('extra')
+    assert 'extra' not in client._generate_title_variations('memo title')
@@ -0,0 +1,68 @@
+"""
+Tests for the SQLite MusicBrainz response cache and its use by MusicBrainzClient.
+"""
+
+import re
+
+import responses
+
+from lib.musicbrainz_client import MusicBrainzClient
+from lib.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test the ResponseCache store itself."""
+
+    def test_set_get_and_persist(self, tmp_path):
+        """Test that bodies round-trip and survive reopening the cache."""
+        db = str(tmp_path / "mb.sqlite")
+        key = ResponseCache.make_key('artist', {'query': 'x', 'fmt': 'json'})
+        with ResponseCache(db) as cache:
+            assert cache.get(key) is None
+            cache.set(key, b'{"artists": []}')
+            assert len(cache) == 1
+
+        with ResponseCache(db) as cache:
+            assert cache.get(key) == b'{"artists": []}'
+
+    def test_key_ignores_param_order(self):
+        """Test that parameter order does not change the key."""
+        assert ResponseCache.make_key('artist', {'a': '1', 'b': '2'}) == \
+            ResponseCache.make_key('artist', {'b': '2', 'a': '1'})
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test that entries older than the TTL are treated as misses."""
+        with ResponseCache(str(tmp_path / "mb.sqlite"), ttl=-1) as cache:
+            cache.set('k', b'body')
+            assert cache.get('k') is None
+
+
+class TestMusicBrainzClientCache:
+    """Test that MusicBrainzClient serves repeated requests from the cache."""
+
+    @responses.activate
+    def test_repeated_request_skips_network_and_rate_limit(self, tmp_path, monkeypatch):
+        client = MusicBrainzClient(cache_path=str(tmp_path / "mb.sqlite"))
+        responses.add(responses.GET, re.compile(r'https://musicbrainz.org/ws/2/artist.*'),
+                      json={'artists': [{'id': 'a1', 'name': 'Cached'}]}, status=200)
+        waits = []
+        monkeypatch.setattr(client, '_wait_for_rate_limit', lambda: waits.append(1))
+
+        first = client._make_request('artist', {'query': 'cached', 'fmt': 'json'})
+        second = client._make_request('artist', {'query': 'cached', 'fmt': 'json'})
+        client.close()
+
+        assert first == second == {'artists': [{'id': 'a1', 'name': 'Cached'}]}
+        assert len(responses.calls) == 1
+        assert waits == [1]
+
+    @responses.activate
+    def test_failed_responses_are_not_cached(self, tmp_path, monkeypatch):
+        client = MusicBrainzClient(cache_path=str(tmp_path / "mb.sqlite"))
+        responses.add(responses.GET, re.compile(r'https://musicbrainz.org/ws/2/artist.*'),
+                      body='oops', status=500)
+        monkeypatch.setattr(client, '_wait_for_rate_limit', lambda: None)
+
+        assert client._make_request('artist', {'query': 'x'}) is None
+        assert len(client.cache) == 0
+        client.close()
@@ -29,3 +29,16 @@ def test_clean_csv_input_and_profanity():
     cleaned = clean_csv_input('F*ck Love  - EP')
     assert 'EP' not in cleaned
     assert 'fuck' in cleaned.lower()
+
+
+def test_lib_import_is_lazy():
+    # `import lib` must not drag in requests; exports load on first access.
+    import subprocess
+    repo_root = Path(__file__).parent.parent
+    code = (
+        "import sys, lib\n"
+        "assert 'requests' not in sys.modules\n"
+        "assert lib.MusicBrainzClient.__name__ == 'MusicBrainzClient'\n"
+        "assert 'requests' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=str(repo_root), check=True)
@@ -0,0 +1,76 @@
+"""
+Tests for the SQLite status journal and its use by CSVHandler.
+"""
+
+import csv
+
+from lib.csv_handler import CSVHandler
+from lib.status_store import StatusStore
+
+
+class TestStatusStore:
+    """Test the StatusStore journal itself."""
+
+    def test_set_get_and_overwrite(self, tmp_path):
+        """Test that the latest status per (artist, album) wins."""
+        with StatusStore(str(tmp_path / "s.sqlite")) as store:
+            store.set('Artist A', 'Album A', 'pending_refresh')
+            store.set('Artist A', 'Album A', 'success')
+            store.set('Artist B', 'Album B', 'skip')
+
+            assert len(store) == 2
+            assert store.get_all() == {
+                ('Artist A', 'Album A'): 'success',
+                ('Artist B', 'Album B'): 'skip',
+            }
+
+            store.clear()
+            assert store.get_all() == {}
+
+    def test_persists_across_connections(self, tmp_path):
+        """Test that statuses survive closing and reopening the journal."""
+        csv_path = tmp_path / "albums.csv"
+        with StatusStore.for_csv(str(csv_path)) as store:
+            store.set('Artist A', 'Album A', 'success')
+            assert store.db_path.name == 'albums.status.sqlite'
+
+        with StatusStore.for_csv(str(csv_path)) as store:
+            assert store.get_all() == {('Artist A', 'Album A'): 'success'}
+
+
+class TestCSVHandlerWithStatusStore:
+    """Test CSVHandler journaling single-item updates."""
+
+    def test_updates_journaled_until_flush(self, tmp_path):
+        """Test that the CSV is only rewritten when the journal is flushed."""
+        csv_file = tmp_path / "albums.csv"
+        csv_file.write_text("artist,album\nArtist A,Album A\nArtist B,Album B\n")
+        original = csv_file.read_text()
+
+        with StatusStore.for_csv(str(csv_file)) as store:
+            handler = CSVHandler(str(csv_file), flush_every=1, status_store=store)
+            handler.update_single_status('Artist A', 'Album A', 'success')
+            assert csv_file.read_text() == original
+
+            handler.flush()
+            assert len(store) == 0
+
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['status'] for r in rows] == ['success', '']
+
+    def test_read_items_recovers_interrupted_run(self, tmp_path):
+        """Test that statuses left in the journal are merged on the next read."""
+        csv_file = tmp_path / "albums.csv"
+        csv_file.write_text("artist,album\nArtist A,Album A\n")
+
+        # Simulate a run that journaled a status and then crashed
+        with StatusStore.for_csv(str(csv_file)) as store:
+            store.set('Artist A', 'Album A', 'success')
+
+        with StatusStore.for_csv(str(csv_file)) as store:
+            handler = CSVHandler(str(csv_file), status_store=store)
+            items, has_status = handler.read_items()
+
+        assert has_status
+        assert items[0].status == 'success'
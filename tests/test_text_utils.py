@@ -279,6 +279,20 @@ class TestNormalizeAlbumTitleForMatching:
         assert normalize_album_title_for_matching("Album Title") == "album title"
         assert normalize_album_title_for_matching("  ALBUM  ") == "album"
 
+    @pytest.mark.unit
+    def test_results_are_memoized(self):
+        """Repeated titles are served from the cache."""
+        normalize_album_title_for_matching.cache_clear()
+        normalize_album_title_for_matching("Cached Album (Deluxe)")
+        assert normalize_album_title_for_matching("Cached Album (Deluxe)") == "cached album"
+        assert normalize_album_title_for_matching.cache_info().hits == 1
+
+    @pytest.mark.unit
+    def test_unicode_forms_match(self):
+        """Composed and decomposed accents normalize identically."""
+        assert (normalize_album_title_for_matching("Caf\u00e9 (Deluxe)")
+                == normalize_album_title_for_matching("Cafe\u0301"))
+
     @pytest.mark.unit
     def test_deluxe_removal(self):
         """Test removal of deluxe edition suffixes."""
@@ -75,3 +75,30 @@ def test_spotify_id_normalization_and_output(tmp_path):
         assert 'ALBID2' in out_ids
         # we should have three output rows (one per unique album aggregation)
         assert len(rows) == 3
+
+
+@pytest.mark.unit
+def test_spotify_track_lists_are_tuples_joined_on_output(tmp_path):
+    header = ["Track URI", "Track Name", "Artist Name(s)", "Album URI", "Album Name", "ISRC"]
+    rows = [
+        ['spotify:track:AAA', 'Track1', 'Test Artist', 'spotify:album:ALBID1', 'Album One', 'ISRC1'],
+        ['spotify:track:BBB', 'Track2', 'Test Artist', 'spotify:album:ALBID1', 'Album One', 'ISRC2'],
+    ]
+    tmpfile = tmp_path / "test_spotify.csv"
+    with tmpfile.open('w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows([header] + rows)
+
+    up = UniversalParser()
+    up.parse_file(str(tmpfile))
+
+    assert len(up.entries) == 1
+    entry = up.entries[0]
+    assert entry.track_titles == ('Track1', 'Track2')
+    assert entry.track_isrcs == ('ISRC1', 'ISRC2')
+
+    out = tmp_path / "out.csv"
+    up.write_output(str(out))
+    with out.open('r', encoding='utf-8') as f:
+        (row,) = csv.DictReader(f)
+    assert row['track_titles'] == 'Track1;Track2'
+    assert row['track_isrcs'] == 'ISRC1;ISRC2'